@@ -0,0 +1,74 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares reading typed values through ``config_holder``, which remembers
+them, with reading them from the parser each time as it used to.
+
+Run from the top of the repository, with SpiNNUtils installed, as
+``python benchmarks/config_holder_benchmark.py``
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_float, get_config_int, get_config_str,
+    set_config)
+from spinn_utilities.config_setup import unittest_setup
+from spinn_utilities.configs import CamelCaseConfigParser
+
+READS = 200000
+
+
+def _time(name: str, read: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(READS):
+        read()
+    elapsed = time.perf_counter() - start
+    print(f"{name:18} {elapsed / READS * 1e9:8.0f} ns per read")
+    return elapsed
+
+
+def main() -> None:
+    """
+    Times cached and uncached reads of each type.
+    """
+    values = {"an_int": "42", "a_float": "4.2", "a_bool": "True",
+              "a_str": "forty two"}
+    unittest_setup()
+    for option, value in values.items():
+        set_config("Logging", option, value)
+    # A parser holding the same, to read without the cache
+    parser = CamelCaseConfigParser()
+    parser.read_dict({"Logging": values})
+    cases: List[Tuple[str, Callable[[], object], Callable[[], object]]] = [
+        ("int", lambda: get_config_int("Logging", "an_int"),
+         lambda: parser.get_int("Logging", "an_int")),
+        ("float", lambda: get_config_float("Logging", "a_float"),
+         lambda: parser.get_float("Logging", "a_float")),
+        ("bool", lambda: get_config_bool("Logging", "a_bool"),
+         lambda: parser.get_bool("Logging", "a_bool", None)),
+        ("str", lambda: get_config_str("Logging", "a_str"),
+         lambda: parser.get_str("Logging", "a_str")),
+    ]
+    for name, cached, uncached in cases:
+        assert cached() == uncached()
+        before = _time(f"{name} uncached", uncached)
+        after = _time(f"{name} cached", cached)
+        print(f"{name:18} {before / after:8.1f} times faster")
+
+
+if __name__ == "__main__":
+    main()
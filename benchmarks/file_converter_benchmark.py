@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the throughput of the one pass and line by line engines of the
+``FileConverter`` and checks they give the same output.
+
+Run from the top of the repository, with SpiNNUtils installed, as
+``python benchmarks/file_converter_benchmark.py [c_source_dir ...]``
+
+Point it at real SpiNNaker C sources, such as the ``c_common`` directory
+of a spinnaker_tools checkout or ``neural_modelling/src`` of sPyNNaker.
+By default the mock sources of the unit tests are used.
+"""
+
+from io import StringIO
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from spinn_utilities.exceptions import UnexpectedCException
+from spinn_utilities.make_tools.conversion_options import (
+    ALLOWED_EXTENSIONS)
+from spinn_utilities.make_tools.file_converter import FileConverter
+
+REPEATS = 5
+DEFAULT_CORPUS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "unittests", "make_tools", "mock_src")
+
+
+def _corpus(src_dirs: List[str]) -> List[Tuple[str, str]]:
+    files = []
+    for src_dir in src_dirs:
+        for directory, _, file_names in os.walk(src_dir):
+            for file_name in sorted(file_names):
+                if os.path.splitext(file_name)[1] in ALLOWED_EXTENSIONS:
+                    path = os.path.join(directory, file_name)
+                    with open(path, encoding="utf-8") as f:
+                        files.append((path, f.read()))
+    return files
+
+
+def _convert_lines(
+        converter: FileConverter, dest_f: StringIO, content: str) -> None:
+    # The line at a time engine the one pass engine replaced
+    # pylint: disable=protected-access
+    for line_num, text in enumerate(StringIO(content)):
+        converter._convert_line(dest_f, line_num, text)
+
+
+def _convert_text(
+        converter: FileConverter, dest_f: StringIO, content: str) -> None:
+    # pylint: disable=protected-access
+    converter._convert_text(dest_f, content)
+
+
+ENGINES: Dict[str, Callable[[FileConverter, StringIO, str], None]] = {
+    "_convert_lines": _convert_lines,
+    "_convert_text": _convert_text,
+}
+
+
+def _run(engine: str, path: str, content: str) -> str:
+    # pylint: disable=protected-access
+    converter = FileConverter(None, "B")
+    converter._src = path
+    dest_f = StringIO()
+    try:
+        ENGINES[engine](converter, dest_f, content)
+        converter._check_end_status()
+    except UnexpectedCException as ex:
+        return f"Error {ex}"
+    return dest_f.getvalue()
+
+
+def main() -> None:
+    """
+    Times both engines on the corpus.
+    """
+    files = _corpus(sys.argv[1:] or [DEFAULT_CORPUS])
+    size = sum(len(content) for _, content in files)
+    lines = sum(content.count("\n") for _, content in files)
+    print(f"{len(files)} files, {lines} lines, {size / 1e6:.2f} MB")
+    outputs = {}
+    for engine in ENGINES:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            outputs[engine] = [
+                _run(engine, path, content) for path, content in files]
+        elapsed = (time.perf_counter() - start) / REPEATS
+        print(f"{engine:15} {elapsed * 1e3:8.1f} ms "
+              f"{size / elapsed / 1e6:8.2f} MB/s")
+    for (path, _), lines_out, text_out in zip(
+            files, outputs["_convert_lines"], outputs["_convert_text"]):
+        if lines_out != text_out:
+            print(f"Different output for {path}")
+
+
+if __name__ == "__main__":
+    main()
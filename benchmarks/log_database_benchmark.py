@@ -0,0 +1,102 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Times lookups and inserts on a synthetic logs database with and without the
+indexes declared in ``db.sql``.
+
+Run from the top of the repository, with SpiNNUtils installed, as
+``python benchmarks/log_database_benchmark.py [messages]``
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+from spinn_utilities.make_tools.log_sqllite_database import (
+    LogInfo, LogSqlLiteDatabase)
+
+FILES = 1000
+SAMPLES = 1000
+
+
+def _build(path: str, messages: int) -> List[LogInfo]:
+    logs: List[LogInfo] = []
+    with LogSqlLiteDatabase(path) as db:
+        directory_id = db.get_directory_id("src", "dest")
+        per_file = max(1, messages // FILES)
+        for file_num in range(FILES):
+            file_id = db.get_file_id(directory_id, f"file_{file_num}.c")
+            file_logs = [
+                (20, line, f"message {file_num} {line} value %u")
+                for line in range(per_file)]
+            db.set_log_infos(file_logs, file_id)
+            logs.extend(file_logs)
+    return logs
+
+
+def _time(path: str, logs: List[LogInfo], indexed: bool) -> None:
+    samples = random.Random(42).sample(logs, SAMPLES)
+    with LogSqlLiteDatabase(path) as db:
+        if not indexed:
+            # Opening the database adds the indexes so drop them after
+            # pylint: disable=protected-access
+            assert db._db is not None
+            for index in ["log_lookup", "file_lookup", "directory_lookup"]:
+                db._db.execute(f"DROP INDEX IF EXISTS {index}")
+        directory_id = db.get_directory_id("src", "dest")
+
+        start = time.perf_counter()
+        for i in range(SAMPLES):
+            db.get_file_id(directory_id, f"file_{i % FILES}.c")
+        file_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for (level, line, original) in samples:
+            db.set_log_info(level, line, original, 1)
+        lookup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i, (level, line, original) in enumerate(samples):
+            db.set_log_info(level, line, f"{original} {indexed} {i}", 1)
+        insert_time = time.perf_counter() - start
+
+    print(f"  get_file_id:          {file_time / SAMPLES * 1e6:10.1f} us")
+    print(f"  set_log_info (reuse): {lookup_time / SAMPLES * 1e6:10.1f} us")
+    print(f"  set_log_info (new):   {insert_time / SAMPLES * 1e6:10.1f} us")
+
+
+def main() -> None:
+    """
+    Builds the database then times it with and without indexes.
+    """
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "logsB.sqlite3")
+        start = time.perf_counter()
+        logs = _build(path, messages)
+        print(f"Built {len(logs)} messages in "
+              f"{time.perf_counter() - start:.1f} s")
+        print(f"Database size {os.path.getsize(path) / 1e6:.1f} MB")
+        print("With indexes:")
+        _time(path, logs, True)
+        print("Without indexes:")
+        _time(path, logs, False)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,8 @@
 from configparser import NoOptionError
 import logging
 import os
-from typing import List, Optional, Tuple
+from typing import (
+    Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar)
 
 import appdirs
 
@@ -40,6 +41,12 @@ __missing_config_file: Optional[str] = None
 __template: Optional[str] = None
 __user_cfg: Optional[str] = None
 __unittest_mode: bool = False
+#: The typed values read so far by section, option and type.
+#: Cleared whenever the configuration changes through this module;
+#: changing the parser returned by load_config directly does not clear it.
+__cache: Dict[Tuple[str, str, Hashable], Any] = dict()
+
+_T = TypeVar("_T")
 
 
 def add_default_cfg(default: str) -> None:
@@ -87,6 +94,7 @@ def clear_cfg_files(unittest_mode: bool) -> None:
     """
     global __config,  __template, __unittest_mode
     __config = None
+    __cache.clear()
     __default_config_files.clear()
     __template = None
     __unittest_mode = unittest_mode
@@ -106,6 +114,7 @@ def _pre_load_config() -> CamelCaseConfigParser:
     if not __default_config_files:
         raise ConfigException("No default configs set")
     __config = conf_loader.load_defaults(__default_config_files)
+    __cache.clear()
     return __config
 
 
@@ -212,12 +221,37 @@ def load_config(config_file: str) -> CamelCaseConfigParser:
         logger.info(f".{config_file} not found in the home directory")
     __config = conf_loader.load_config(
             config_file, __user_cfg, __default_config_files)
+    __cache.clear()
 
     logging_parser(__config)
     logger.info("config files read = {}", __config.read_files)
     return __config
 
 
+def _cached(section: str, option: str, kind: Hashable,
+            read: Callable[[CamelCaseConfigParser, str, str], _T]) -> _T:
+    """
+    Gets a typed value, only reading it from the parser the first time.
+
+    :param section: What section to get the option from.
+    :param option: What option to read.
+    :param kind: Identifies the type, and how the value is read
+    :param read: Reads the value from the parser
+    :return: The option value
+    """
+    key = (section, option, kind)
+    try:
+        return __cache[key]
+    except KeyError:
+        pass
+    if __config is None:
+        value = read(_pre_load_config(), section, option)
+    else:
+        value = read(__config, section, option)
+    __cache[key] = value
+    return value
+
+
 def is_config_none(section: str, option: str) -> bool:
     """
     Check if the value of a configuration option would be considered None
@@ -254,10 +288,8 @@ def get_config_str_or_none(section: str, option: str) -> Optional[str]:
     :return: The option value
     :raises ConfigException: if the Value would be None
     """
-    if __config is None:
-        return _pre_load_config().get_str(section, option)
-    else:
-        return __config.get_str(section, option)
+    return _cached(
+        section, option, "str", CamelCaseConfigParser.get_str)
 
 
 def get_config_str_list(
@@ -270,10 +302,10 @@ def get_config_str_list(
     :param token: The token to split the string into a list
     :return: The list (possibly empty) of the option values
     """
-    if __config is None:
-        return _pre_load_config().get_str_list(section, option, token)
-    else:
-        return __config.get_str_list(section, option, token)
+    # A copy as lists can be changed
+    return list(_cached(
+        section, option, "list" + token,
+        lambda config, sect, opt: config.get_str_list(sect, opt, token)))
 
 
 def get_config_int(section: str, option: str) -> int:
@@ -300,10 +332,8 @@ def get_config_int_or_none(section: str, option: str) -> Optional[int]:
     :return: The option value
     :raises ConfigException: if the Value would be None
     """
-    if __config is None:
-        return _pre_load_config().get_int(section, option)
-    else:
-        return __config.get_int(section, option)
+    return _cached(
+        section, option, "int", CamelCaseConfigParser.get_int)
 
 
 def get_config_float(section: str, option: str) -> float:
@@ -329,10 +359,8 @@ def get_config_float_or_none(section: str, option: str) -> Optional[float]:
     :param option: What option to read.
     :return: The option value.
     """
-    if __config is None:
-        return _pre_load_config().get_float(section, option)
-    else:
-        return __config.get_float(section, option)
+    return _cached(
+        section, option, "float", CamelCaseConfigParser.get_float)
 
 
 def get_config_bool(section: str, option: str) -> bool:
@@ -362,10 +390,17 @@ def get_config_bool_or_none(section: str, option: str,
     :return: The option value.
     :raises ConfigException: if the Value would be None
     """
-    if __config is None:
-        return _pre_load_config().get_bool(section, option, special_nones)
-    else:
-        return __config.get_bool(section, option, special_nones)
+    if special_nones:
+        return _cached(
+            section, option, ("bool", tuple(special_nones)),
+            lambda config, sect, opt: config.get_bool(
+                sect, opt, special_nones))
+    return _cached(section, option, "bool", _get_bool)
+
+
+def _get_bool(config: CamelCaseConfigParser, section: str,
+              option: str) -> Optional[bool]:
+    return config.get_bool(section, option, None)
 
 
 def set_config(section: str, option: str, value: Optional[str]) -> None:
@@ -383,6 +418,8 @@ def set_config(section: str, option: str, value: Optional[str]) -> None:
         _pre_load_config().set(section, option, value)
     else:
         __config.set(section, option, value)
+    # Other values may be interpolated from this one
+    __cache.clear()
 
 
 def config_sections() -> List[str]:
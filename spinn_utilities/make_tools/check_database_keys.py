@@ -12,38 +12,222 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
 from spinn_utilities.data import UtilsDataView
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 
+# exclude directories that may have an aplx but not logs database
+_EXCLUDES = frozenset(["JavaSpiNNaker", "spinnaker_tools",
+                       "SpiNNakerManchester.github.io"])
 
-def check_all_log_database_keys() -> None:
+#: What was found in each database by path: the stamp of the database
+#: when checked (see :py:func:`_stamp`) and the description of what is in it
+_CACHE: Dict[str, Tuple[List[int], str]] = dict()
+#: What was found under each top level directory: the modification time in
+#: nanoseconds of each directory walked and the directories with an aplx
+_WALKS: Dict[str, Tuple[Dict[str, int], List[str]]] = dict()
+
+
+def _walk(directory: str, mtimes: Dict[str, int], found: List[str]) -> None:
+    """
+    Records a directory and whether it has an aplx file in it, then does
+    the same for each sub directory in the order :py:func:`os.walk` would.
+
+    :param directory: The directory to search
+    :param mtimes: Where to record the modification time of each directory
+    :param found: Where to add the directories with an aplx file in them
+    """
+    try:
+        # Before listing so a file added while listing is found next time
+        mtimes[directory] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as scan:
+            entries = sorted(scan, key=lambda entry: entry.name)
+    except OSError:
+        # As os.walk, directories that can not be read are skipped
+        return
+    sub_dirs = [entry.path for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and entry.name not in _EXCLUDES]
+    if any(entry.name.endswith(".aplx") and not entry.is_dir()
+           for entry in entries):
+        found.append(directory)
+    for sub_dir in sub_dirs:
+        _walk(sub_dir, mtimes, found)
+
+
+def _unchanged(mtimes: Dict[str, int]) -> bool:
+    """
+    Checks that no directory has changed since it was walked.
+
+    :param mtimes: The modification time of each directory when walked
+    """
+    try:
+        return all(os.stat(directory).st_mtime_ns == mtime
+                   for directory, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def _find_aplx_dirs(top: str) -> List[str]:
+    """
+    Finds the directories under a directory with an aplx file in them.
+
+    The directories are only walked again if one of them has changed
+    since last walked, as when a file is added or removed.
+
+    :param top: The directory to search
+    :returns: The directories in the order walked
+    """
+    cached = _WALKS.get(top)
+    if cached is not None and _unchanged(cached[0]):
+        return cached[1]
+    mtimes: Dict[str, int] = dict()
+    found: List[str] = []
+    _walk(top, mtimes, found)
+    _WALKS[top] = (mtimes, found)
+    return found
+
+
+def _describe_database(database_path: str) -> str:
+    """
+    Opens a logs database to check it can be read.
+
+    :param database_path: Path to the logs database
+    :returns: What is in the database, or why it can not be read
+    """
+    try:
+        with LogSqlLiteDatabase(database_path, read_only=True) as database:
+            return f"max log id {database.get_max_log_id()}"
+    except sqlite3.Error as ex:
+        return f"unreadable: {ex}"
+
+
+def _stamp(database_path: str) -> List[int]:
+    """
+    Gets what changes when a logs database is written to.
+
+    Writes in WAL mode may only change the write ahead log, so its size
+    and modification time are included too.
+
+    :param database_path: Path to the logs database
+    :returns: The sizes and modification times in nanoseconds of the
+        database and its write ahead log, with -1 for a missing log
+    """
+    stat = os.stat(database_path)
+    try:
+        wal = os.stat(database_path + "-wal")
+        return [stat.st_size, stat.st_mtime_ns, wal.st_size, wal.st_mtime_ns]
+    except FileNotFoundError:
+        return [stat.st_size, stat.st_mtime_ns, -1, -1]
+
+
+def check_database(database_path: str) -> str:
+    """
+    Describes what is in a logs database, only opening it if it has
+    changed since last checked.
+
+    :param database_path: Path to the logs database
+    :returns: What is in the database, or why it can not be read
+    """
+    stamp = _stamp(database_path)
+    cached = _CACHE.get(database_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    description = _describe_database(database_path)
+    _CACHE[database_path] = (stamp, description)
+    return description
+
+
+def _load_cache(cache_file: str) -> None:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        databases = {
+            str(path): ([int(value) for value in stamp], str(description))
+            for path, (stamp, description) in data["databases"].items()}
+        walks = {
+            str(top): ({str(directory): int(mtime)
+                        for directory, mtime in mtimes.items()},
+                       [str(found) for found in founds])
+            for top, (mtimes, founds) in data["walks"].items()}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        # No usable cache so everything is walked and opened
+        return
+    for path, cached in databases.items():
+        _CACHE.setdefault(path, cached)
+    for top, walked in walks.items():
+        _WALKS.setdefault(top, walked)
+
+
+def _save_cache(cache_file: str) -> None:
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({"databases": _CACHE, "walks": _WALKS}, f)
+
+
+def check_all_log_database_keys(
+        workers: int = 8, cache_file: Optional[str] = None) -> None:
     """
     This check is intended to be run after automatic_make
 
-    It will check all parallel repositories use unique database keys
+    It will check all parallel repositories use unique database keys,
+    and that each logs database can be read, so a database that can not
+    be used for decoding is found now rather than when decoding.
+
+    The repositories are searched and the databases opened by a pool of
+    threads. A repository is only searched again if one of its
+    directories has changed, and a database is only opened again if it or
+    its write ahead log has changed, since they were last checked.
+
+    :param workers: The number of threads to search with
+    :param cache_file:
+        If given, what was found in each repository and database is also
+        remembered in this file so later runs can use it
     """
     this_path = os.path.dirname(os.path.abspath(__file__))
     test_path = os.path.dirname(this_path)
     utils_path = os.path.dirname(test_path)
     all_path = os.path.dirname(utils_path)
-    # exclude directories that may have an aplx but not logs database
-    excludes = set(["JavaSpiNNaker", "spinnaker_tools",
-                    "SpiNNakerManchester.github.io"])
-    print("Logs Sqlite Database keys and Paths")
-    for root, _dirs, files in os.walk(all_path):
-        for exclude in excludes:
-            if exclude in _dirs:
-                _dirs.remove(exclude)
-        aplx_found = False
-        for file in files:
-            if file.endswith(".aplx"):
-                aplx_found = True
-        if aplx_found:
-            UtilsDataView.register_binary_search_path(root)
-    database_map = UtilsDataView.get_log_database_keys_and_paths()
-    for database_key, database_path in database_map:
-        print(database_key, database_path)
+    if cache_file is not None:
+        _load_cache(cache_file)
+    with os.scandir(all_path) as entries:
+        # As os.walk, links to directories are not followed
+        tops = sorted(entry.path for entry in entries
+                      if entry.is_dir(follow_symlinks=False)
+                      and entry.name not in _EXCLUDES)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        aplx_dirs = []
+        if any(file.endswith(".aplx") for file in os.listdir(all_path)):
+            aplx_dirs.append(all_path)
+        for found in pool.map(_find_aplx_dirs, tops):
+            aplx_dirs.extend(found)
+        # Registered in the same order as a single walk would
+        for aplx_dir in aplx_dirs:
+            UtilsDataView.register_binary_search_path(aplx_dir)
+        database_map = list(UtilsDataView.get_log_database_keys_and_paths())
+        descriptions = pool.map(
+            check_database, [path for _, path in database_map])
+        print("Logs Sqlite Database keys and Paths")
+        for (database_key, database_path), description in zip(
+                database_map, descriptions):
+            print(database_key, database_path, description)
+    if cache_file is not None:
+        _save_cache(cache_file)
 
 
 if __name__ == "__main__":
-    check_all_log_database_keys()
+    _parser = argparse.ArgumentParser(
+        description="Checks all parallel repositories use unique logs "
+        "database keys")
+    _parser.add_argument(
+        "-j", "--jobs", type=int, default=8,
+        help="Number of threads to search with (default 8)")
+    _parser.add_argument(
+        "--cache",
+        help="File to remember what is in each repository and database in")
+    _args = _parser.parse_args()
+    check_all_log_database_keys(_args.jobs, _args.cache)
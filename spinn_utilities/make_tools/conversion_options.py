@@ -0,0 +1,87 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import os
+from typing import Dict, List, Optional, Tuple
+
+#: The extensions of the files that are converted
+ALLOWED_EXTENSIONS = frozenset([".c", ".cpp", ".h"])
+#: Files that are not converted but are expected in a source tree
+SKIPPABLE_FILES = frozenset([
+    "common.mk", "Makefile.common",
+    "paths.mk", "Makefile.paths",
+    "neural_build.mk", "Makefile.neural_build"])
+
+
+def conversion_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Makes a parser for the arguments that every way of running a
+    conversion from the command line takes.
+
+    :param description: What the command does
+    :return: A parser to which the command can add its own arguments
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("src", help="The source directory")
+    parser.add_argument("dest", help="The destination directory")
+    parser.add_argument(
+        "database_dir", help="The directory to write the logs database to")
+    parser.add_argument(
+        "database_key", help="A single character database key")
+    parser.add_argument(
+        "--hashed-ids", action="store_true",
+        help="Make log IDs from a hash of each message")
+    return parser
+
+
+def find_files(src_path: str, dest_path: str,
+               directories: Optional[Dict[str, int]] = None
+               ) -> List[Tuple[str, str, str]]:
+    """
+    Finds the files to convert in a whole directory including sub
+    directories.
+
+    Links to directories are not followed.
+
+    :param src_path: Full source directory
+    :param dest_path: Full destination directory
+    :param directories:
+        If given, the modification time in nanoseconds of each directory
+        walked is added, as read before the directory is listed
+    :return: The source directory, destination directory and file name of
+        each file, in a fixed order
+    """
+    if directories is not None:
+        directories[src_path] = os.stat(src_path).st_mtime_ns
+    files = []
+    for src_dir, dirs, file_list in os.walk(src_path):
+        dirs.sort()
+        if directories is not None:
+            # Before os.walk lists them so a file added meanwhile is seen
+            for sub_dir in dirs:
+                path = os.path.join(src_dir, sub_dir)
+                if not os.path.islink(path):
+                    directories[path] = os.stat(path).st_mtime_ns
+        dest_dir = os.path.join(dest_path, os.path.relpath(src_dir, src_path))
+        file_list.sort()
+        for file_name in file_list:
+            _, extension = os.path.splitext(file_name)
+            if extension in ALLOWED_EXTENSIONS:
+                files.append((src_dir, dest_dir, file_name))
+            elif file_name in SKIPPABLE_FILES:
+                pass
+            else:
+                source = os.path.join(src_dir, file_name)
+                print(f"Unexpected file {source}")
+    return files
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import json
+import os
+from typing import Dict, List, Optional, TextIO, Union
+
+#: The columns of a report, in order
+FIELDS = ("path", "bytes", "logs", "check_time", "parse_time", "save_time",
+          "skipped")
+
+
+class FileProfile(object):
+    """
+    What converting one file cost.
+    """
+
+    __slots__ = [
+        # size of the source in bytes
+        "bytes",
+        # seconds spent deciding if the file needs converting
+        "check_time",
+        # number of log calls found
+        "logs",
+        # seconds spent parsing
+        "parse_time",
+        # full path of the source
+        "path",
+        # seconds spent saving the logs and writing the converted file
+        "save_time",
+        # why the file was not converted, or None
+        "skipped",
+    ]
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: Full path of the source file
+        """
+        self.path = path
+        self.bytes = os.path.getsize(path)
+        self.logs = 0
+        self.check_time = 0.0
+        self.parse_time = 0.0
+        self.save_time = 0.0
+        self.skipped: Optional[str] = None
+
+    @property
+    def total_time(self) -> float:
+        """
+        Seconds spent on the file in all phases.
+        """
+        return self.check_time + self.parse_time + self.save_time
+
+    def as_dict(self) -> Dict[str, Union[str, int, float]]:
+        """
+        The profile as a row of a report.
+
+        :returns: The value of each of :py:data:`FIELDS`
+        """
+        return {
+            "path": self.path, "bytes": self.bytes, "logs": self.logs,
+            "check_time": self.check_time, "parse_time": self.parse_time,
+            "save_time": self.save_time, "skipped": self.skipped or ""}
+
+
+class ConversionProfile(object):
+    """
+    Collects a :py:class:`FileProfile` for each file of a conversion.
+
+    In a parallel conversion the parse time is that of the worker process,
+    so the times of the files add up to more than the time taken.
+    """
+
+    __slots__ = ["_files"]
+
+    def __init__(self) -> None:
+        self._files: List[FileProfile] = []
+
+    def add_file(self, path: str) -> FileProfile:
+        """
+        Starts the profile of a file.
+
+        :param path: Full path of the source file
+        :returns: The profile to fill in
+        """
+        profile = FileProfile(path)
+        self._files.append(profile)
+        return profile
+
+    @property
+    def files(self) -> List[FileProfile]:
+        """
+        The profile of each file in the order converted.
+        """
+        return list(self._files)
+
+    def write(self, report_path: str) -> None:
+        """
+        Writes a report with a row per file.
+
+        :param report_path:
+            File to write; CSV if it ends with ``.csv`` otherwise JSON
+        """
+        rows = [profile.as_dict() for profile in self._files]
+        with open(report_path, "w", encoding="utf-8", newline="") as f:
+            if report_path.lower().endswith(".csv"):
+                writer = csv.DictWriter(f, fieldnames=FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, f, indent=2)
+
+    def summary(self, top: int = 10) -> str:
+        """
+        Describes the totals and the files that took longest.
+
+        :param top: How many of the slowest files to list
+        :returns: Text of several lines
+        """
+        converted = [
+            profile for profile in self._files if profile.skipped is None]
+        check_time = sum(profile.check_time for profile in self._files)
+        parse_time = sum(profile.parse_time for profile in self._files)
+        save_time = sum(profile.save_time for profile in self._files)
+        lines = [
+            f"{len(converted)} of {len(self._files)} files converted, "
+            f"{sum(profile.bytes for profile in converted)} bytes, "
+            f"{sum(profile.logs for profile in converted)} logs",
+            f"check {check_time:.3f}s parse {parse_time:.3f}s "
+            f"save {save_time:.3f}s"]
+        slowest = sorted(
+            self._files, key=lambda profile: profile.total_time,
+            reverse=True)[:top]
+        if slowest:
+            lines.append(f"Slowest {len(slowest)}:")
+        for profile in slowest:
+            lines.append(
+                f"{profile.total_time:8.3f}s {profile.bytes:9d} bytes "
+                f"{profile.logs:5d} logs {profile.path}" + (
+                    f" (skipped: {profile.skipped})"
+                    if profile.skipped else ""))
+        return "\n".join(lines)
+
+    def print_summary(self, top: int = 10,
+                      out: Optional[TextIO] = None) -> None:
+        """
+        Prints :py:meth:`summary`.
+
+        :param top: How many of the slowest files to list
+        :param out: Where to print; standard output by default
+        """
+        print(self.summary(top), file=out)
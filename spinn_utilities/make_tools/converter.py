@@ -12,20 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
+from typing import Iterable, List, Optional, Tuple
+from spinn_utilities.timer import Timer
+from .conversion_options import conversion_parser, find_files
+from .conversion_profile import ConversionProfile, FileProfile
 from .file_converter import FileConverter
-from .log_sqllite_database import LogSqlLiteDatabase
-
-ALLOWED_EXTENSIONS = frozenset([".c", ".cpp", ".h"])
-SKIPPABLE_FILES = frozenset([
-    "common.mk", "Makefile.common",
-    "paths.mk", "Makefile.paths",
-    "neural_build.mk", "Makefile.neural_build"])
+from .log_lookup import LogLookup, lookup_filename
+from .log_sqllite_database import LogInfo, LogSqlLiteDatabase
+from .watch import SourceWatcher
 
 
 def convert(src: str, dest: str, database_dir: str,
-            database_key: str) -> str:
+            database_key: str, workers: int = 1,
+            hashed_ids: bool = False, prune: bool = False,
+            keep_log_ids: Iterable[int] = (),
+            profile: Optional[str] = None, top: int = 10) -> str:
     """
     Converts a whole directory including sub-directories.
 
@@ -34,45 +38,156 @@ def convert(src: str, dest: str, database_dir: str,
     :param database_dir:
         Full path to directory to place database file in.
     :param database_key: database key for this conversion
-    :return: Full path to the logs database
+    :param workers:
+        Number of processes to parse the files with.
+        The database is always written by this process in the same order,
+        so the results are the same whatever the number of workers.
+    :param hashed_ids:
+        If True log IDs are made from a hash of each message rather than
+        counted, so separate conversions of parts of the same tree (with
+        the same key) can be combined with
+        :py:meth:`LogSqlLiteDatabase.merge`.
+    :param prune:
+        If True the log messages no longer in any source are deleted from
+        the database afterwards; see :py:meth:`LogSqlLiteDatabase.prune`
+    :param keep_log_ids:
+        If pruning, IDs of log messages to keep anyway
+    :param profile:
+        If given, the bytes read, log calls found, time in each phase and
+        why not converted of each file is written to this file,
+        as CSV if it ends with ``.csv`` otherwise as JSON,
+        and a summary is printed
+    :param top: How many of the slowest files the summary lists
+    :return: Full path to the logs database;
+        a lookup file for decoding is written next to it
     :raises ValueError:
     """
     database_file = LogSqlLiteDatabase.filename_by_key(
         database_dir, database_key)
-    log_database = LogSqlLiteDatabase(database_file)
+    log_database = LogSqlLiteDatabase(database_file, hashed_ids=hashed_ids)
 
     src_path = os.path.abspath(src)
     if not os.path.exists(src_path):
         raise FileNotFoundError(
             f"Unable to locate source directory {src_path}")
+    log_database.start_session(src_path)
     dest_path = os.path.abspath(dest)
     file_converter = FileConverter(log_database, database_key)
-    _convert_dir(src_path, dest_path, file_converter)
+    conversion_profile = ConversionProfile() if profile else None
+    if workers > 1:
+        _convert_dir_parallel(
+            src_path, dest_path, file_converter, database_key, workers,
+            conversion_profile)
+    else:
+        _convert_dir(src_path, dest_path, file_converter, conversion_profile)
+    log_database.end_session()
+    if prune:
+        log_database.prune(keep_log_ids)
+    infos = log_database.get_all_log_info()
+    log_database.close()
+    # Written after the database is closed so it is newer
+    LogLookup.write(lookup_filename(database_file), infos)
+    if profile and conversion_profile is not None:
+        conversion_profile.write(profile)
+        conversion_profile.print_summary(top)
     return database_file
 
 
 def _convert_dir(src_path: str, dest_path: str,
-                 file_converter: FileConverter) -> None:
+                 file_converter: FileConverter,
+                 profile: Optional[ConversionProfile] = None) -> None:
     """
     Converts a whole directory including sub directories.
 
     :param src_path: Full source directory
     :param dest_path: Full destination directory
     :param file_converter:
+    :param profile: If given, what each file cost is added to it
+    """
+    for src_dir, dest_dir, file_name in find_files(src_path, dest_path):
+        if profile is None:
+            file_converter.convert(src_dir, dest_dir, file_name)
+            continue
+        file_profile = profile.add_file(os.path.join(src_dir, file_name))
+        timer = Timer()
+        timer.start_timing()
+        file_profile.skipped = file_converter.skip_reason(
+            src_dir, dest_dir, file_name)
+        file_profile.check_time = timer.take_sample().total_seconds()
+        if file_profile.skipped is not None:
+            continue
+        timer.start_timing()
+        text, logs = file_converter.parse(src_dir, dest_dir, file_name)
+        file_profile.parse_time = timer.take_sample().total_seconds()
+        file_profile.logs = len(logs)
+        timer.start_timing()
+        file_converter.save(src_dir, dest_dir, file_name, text, logs)
+        file_profile.save_time = timer.take_sample().total_seconds()
+
+
+def _parse_file(database_key: str, src_dir: str, dest_dir: str,
+                file_name: str) -> Tuple[str, List[LogInfo], float]:
+    """
+    Parses a single file in a worker process.
+
+    See :py:meth:`FileConverter.parse`
+
+    :returns: The converted text, the log messages found in it and the
+        seconds taken
+    """
+    with Timer() as timer:
+        text, logs = FileConverter(None, database_key).parse(
+            src_dir, dest_dir, file_name)
+    assert timer.measured_interval is not None
+    return text, logs, timer.measured_interval.total_seconds()
+
+
+def _convert_dir_parallel(
+        src_path: str, dest_path: str, file_converter: FileConverter,
+        database_key: str, workers: int,
+        profile: Optional[ConversionProfile] = None) -> None:
     """
-    for src_dir, dirs, file_list in os.walk(src_path):
-        dirs.sort()
-        dest_dir = os.path.join(dest_path, os.path.relpath(src_dir, src_path))
-        file_list.sort()
-        for file_name in file_list:
-            _, extension = os.path.splitext(file_name)
-            if extension in ALLOWED_EXTENSIONS:
-                file_converter.convert(src_dir, dest_dir, file_name)
-            elif file_name in SKIPPABLE_FILES:
-                pass
-            else:
-                source = os.path.join(src_dir, file_name)
-                print(f"Unexpected file {source}")
+    Converts a whole directory including sub directories, parsing the files
+    in a pool of processes.
+
+    The parsed files are saved by this process in the same order as
+    :py:func:`_convert_dir` would, so the log IDs are the same.
+
+    :param src_path: Full source directory
+    :param dest_path: Full destination directory
+    :param file_converter: Converter used to save the parsed files
+    :param database_key: database key for this conversion
+    :param workers: Number of processes to parse the files with
+    :param profile: If given, what each file cost is added to it
+    """
+    files = []
+    file_profiles: List[Optional[FileProfile]] = []
+    timer = Timer()
+    for src_dir, dest_dir, file_name in find_files(src_path, dest_path):
+        timer.start_timing()
+        skipped = file_converter.skip_reason(src_dir, dest_dir, file_name)
+        file_profile = None
+        if profile is not None:
+            file_profile = profile.add_file(os.path.join(src_dir, file_name))
+            file_profile.check_time = timer.take_sample().total_seconds()
+            file_profile.skipped = skipped
+        if skipped is None:
+            files.append((src_dir, dest_dir, file_name))
+            file_profiles.append(file_profile)
+    if not files:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parsed = pool.map(
+            _parse_file, [database_key] * len(files),
+            *zip(*files), chunksize=max(1, len(files) // (workers * 4)))
+        for (src_dir, dest_dir, file_name), (text, logs, seconds), \
+                file_profile in zip(files, parsed, file_profiles):
+            timer.start_timing()
+            file_converter.save(src_dir, dest_dir, file_name, text, logs)
+            if file_profile is not None:
+                file_profile.parse_time = seconds
+                file_profile.logs = len(logs)
+                file_profile.save_time = timer.take_sample().total_seconds()
 
 
 def _mkdir(destination: str) -> None:
@@ -83,16 +198,33 @@ def _mkdir(destination: str) -> None:
 
 
 if __name__ == '__main__':
-    _src = sys.argv[1]
-    _dest = sys.argv[2]
-    if len(sys.argv) > 4:
-        _database_file = sys.argv[3]
-        _database_key = sys.argv[4]
-        convert(_src, _dest, _database_file, _database_key)
-    else:
-        raise ValueError(
-            "Convert requires 4 parameters. The source directory, "
-            "the destination directory, a single character database key and "
-            "the path to write the logs sqlite3 database to. "
-            "Database keys must be unique. "
-            "To avoid clashes with system builds use a lower case letter")
+    _parser = conversion_parser(
+        "Converts the log messages in C code to short logs. "
+        "Database keys must be unique. "
+        "To avoid clashes with system builds use a lower case letter")
+    _parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of processes to parse files with (default 1)")
+    _parser.add_argument(
+        "--prune", action="store_true",
+        help="Delete log messages no longer in any source afterwards")
+    _parser.add_argument(
+        "--profile",
+        help="Write what each file cost to this file, "
+        "as CSV if it ends with .csv otherwise as JSON")
+    _parser.add_argument(
+        "--top", type=int, default=10,
+        help="How many of the slowest files to summarise when profiling "
+        "(default 10)")
+    _parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep converting the files that change until interrupted")
+    _args = _parser.parse_args()
+    if _args.watch:
+        with SourceWatcher(_args.src, _args.dest, _args.database_dir,
+                           _args.database_key, _args.hashed_ids) as _watcher:
+            _watcher.run()
+        sys.exit()
+    convert(_args.src, _args.dest, _args.database_dir, _args.database_key,
+            workers=_args.jobs, hashed_ids=_args.hashed_ids,
+            prune=_args.prune, profile=_args.profile, top=_args.top)
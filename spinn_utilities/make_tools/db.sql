@@ -14,6 +14,12 @@
 
 -- https://www.sqlite.org/pragma.html#pragma_synchronous
 PRAGMA main.synchronous = OFF;
+-- https://www.sqlite.org/pragma.html#pragma_auto_vacuum
+-- Only changes new databases, so before WAL which creates the file.
+-- Older databases are changed by their first prune
+PRAGMA main.auto_vacuum = INCREMENTAL;
+-- https://www.sqlite.org/wal.html so decoders can read during a build
+PRAGMA main.journal_mode = WAL;
 
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding each log message
@@ -44,6 +50,31 @@ CREATE TABLE IF NOT EXISTS directory(
 	);
 
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- A table holding the content hash of each converted source file
+-- and the log IDs the conversion produced, so unchanged files can be skipped
+CREATE TABLE IF NOT EXISTS source_manifest(
+    directory_id INTEGER NOT NULL REFERENCES directory(directory_id) ON DELETE RESTRICT,
+    file_name STRING NOT NULL,
+    content_hash STRING NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES file(file_id) ON DELETE RESTRICT,
+    -- TEXT as the numeric affinity of STRING would store one ID as a number
+    log_ids TEXT NOT NULL,
+    PRIMARY KEY (directory_id, file_name)
+    );
+
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- Indexes for the lookups done while converting.
+-- As these are IF NOT EXISTS they are added to older databases when opened.
+CREATE INDEX IF NOT EXISTS log_lookup
+    ON log(original, log_level, line_num, file_id);
+
+CREATE INDEX IF NOT EXISTS file_lookup
+    ON file(directory_id, file_name);
+
+CREATE INDEX IF NOT EXISTS directory_lookup
+    ON directory(src_path, dest_path);
+
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- Glue the bits together to show the information that people think is here
 CREATE VIEW IF NOT EXISTS replacer_view AS
     SELECT log_id, log_level, file_name, line_num , original, last_build
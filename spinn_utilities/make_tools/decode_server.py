@@ -0,0 +1,342 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Union
+
+from spinn_utilities.data import UtilsDataView
+from spinn_utilities.log import FormatAdapter
+from .replacer import Replacer
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: Most bytes read from a client before decoding what has arrived
+_READ_SIZE = 64 * 1024
+#: How many reads of a line without an end are held before it is passed on
+#: as it is, so a client that never sends a newline can not use up memory
+_MAX_PARTIAL_READS = 4
+_ENCODING = "utf-8"
+#: So bytes that are not text are passed through unchanged
+_ERRORS = "surrogateescape"
+
+
+class DecodeStatistics(object):
+    """
+    Counts what a :py:class:`DecodeServer` has done.
+
+    Latency is from a batch of lines arriving to the expanded lines having
+    been taken by the client, so includes any time held up by a slow client.
+    """
+
+    __slots__ = [
+        # number of batches decoded
+        "batches",
+        # bytes received
+        "bytes_in",
+        # bytes sent
+        "bytes_out",
+        # number of clients connected so far
+        "connections",
+        # number of lines decoded
+        "lines",
+        # longest latency of a batch in seconds
+        "max_latency",
+        # when counting started
+        "_start",
+        # total latency of all batches in seconds
+        "total_latency",
+    ]
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.connections = 0
+        self.lines = 0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self._start = time.perf_counter()
+
+    def add_batch(self, lines: int, bytes_in: int, bytes_out: int,
+                  latency: float) -> None:
+        """
+        Counts a batch of lines decoded.
+
+        :param lines: Number of lines in the batch
+        :param bytes_in: Bytes received
+        :param bytes_out: Bytes sent
+        :param latency: Seconds from receiving to sending the batch
+        """
+        self.batches += 1
+        self.lines += lines
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds since counting started.
+        """
+        return time.perf_counter() - self._start
+
+    @property
+    def lines_per_second(self) -> float:
+        """
+        Lines decoded per second since counting started.
+        """
+        elapsed = self.elapsed
+        return self.lines / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        Mean latency of a batch in seconds.
+        """
+        return self.total_latency / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        The counters, for reporting.
+
+        :returns: Each counter by name
+        """
+        return {
+            "connections": self.connections, "lines": self.lines,
+            "batches": self.batches, "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "lines_per_second": self.lines_per_second,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency}
+
+    def __str__(self) -> str:
+        return (
+            f"{self.connections} connections, {self.lines} lines, "
+            f"{self.lines_per_second:.0f} lines/s, latency mean "
+            f"{self.mean_latency * 1e3:.3f} ms max "
+            f"{self.max_latency * 1e3:.3f} ms")
+
+
+class DecodeServer(object):
+    """
+    Decodes streams of short log lines, such as IOBUF as it is read,
+    for clients connected over TCP, a Unix socket or any asyncio stream.
+
+    Whatever has arrived from a client is decoded as one batch with
+    :py:meth:`Replacer.replace_lines` and sent back before more is read,
+    so a client that does not read its results stops being read from and
+    the operating system then holds up its writes.
+    Decoding is done in the default executor of the event loop, so a slow
+    lookup for one client does not hold up the others.
+    A line that can not be decoded, or is too long to be a log line,
+    is passed on as it is.
+    """
+
+    __slots__ = [
+        # most bytes read before decoding
+        "_read_size",
+        # decodes the lines
+        "_replacer",
+        # counts what has been done
+        "_statistics",
+    ]
+
+    def __init__(self, replacer: Optional[Replacer] = None,
+                 read_size: int = _READ_SIZE) -> None:
+        """
+        :param replacer:
+            Decodes the lines; by default a preloaded one using the
+            registered databases
+        :param read_size: Most bytes read from a client before decoding
+        """
+        self._replacer = Replacer(preload=True) if replacer is None \
+            else replacer
+        self._read_size = read_size
+        self._statistics = DecodeStatistics()
+
+    @property
+    def statistics(self) -> DecodeStatistics:
+        """
+        What the server has done so far.
+        """
+        return self._statistics
+
+    def _decode(self, data: bytes) -> bytes:
+        # Not splitlines as that also splits at the TOKEN separator
+        parts = data.decode(_ENCODING, _ERRORS).split("\n")
+        lines = [part + "\n" for part in parts[:-1]]
+        if parts[-1]:
+            lines.append(parts[-1])
+        try:
+            decoded = "".join(self._replacer.replace_lines(lines))
+        except Exception:  # pylint: disable=broad-except
+            # Find the lines that fail and pass just those on as they are
+            decoded = "".join(self._decode_line(line) for line in lines)
+        return decoded.encode(_ENCODING, _ERRORS)
+
+    def _decode_line(self, line: str) -> str:
+        try:
+            return "".join(self._replacer.replace_lines([line]))
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not decode {!r}", line)
+            return line
+
+    async def serve_stream(self, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        """
+        Decodes the lines from a stream, writing them back, until the
+        reader is at its end. The writer is then closed.
+
+        :param reader: Where the short lines come from
+        :param writer: Where the expanded lines go
+        """
+        self._statistics.connections += 1
+        partial = b""
+        # Whether the rest of a line too long to be a log line is coming
+        too_long = False
+        try:
+            while True:
+                data = await reader.read(self._read_size)
+                start = time.perf_counter()
+                unchanged = b""
+                if too_long:
+                    # Up to the end of the long line is passed on as it is
+                    end = data.find(b"\n") + 1
+                    too_long = bool(data) and not end
+                    unchanged, data = (data[:end], data[end:]) if end \
+                        else (data, b"")
+                end = data.rfind(b"\n") + 1
+                if too_long:
+                    batch = b""
+                elif not data:
+                    batch, partial = partial, b""
+                elif end:
+                    # Only whole lines; the rest waits for its end
+                    batch, partial = partial + data[:end], data[end:]
+                else:
+                    batch, partial = b"", partial + data
+                if len(partial) > self._read_size * _MAX_PARTIAL_READS:
+                    # Too long to be a log line so pass it on as it is
+                    unchanged, partial, too_long = \
+                        unchanged + partial, b"", True
+                if batch or unchanged:
+                    decoded = await self._decode_batch(batch)
+                    writer.write(unchanged + decoded)
+                    # Back pressure: wait for a slow client to catch up
+                    await writer.drain()
+                    self._statistics.add_batch(
+                        batch.count(b"\n") + (
+                            bool(batch) and not batch.endswith(b"\n")),
+                        len(unchanged) + len(batch),
+                        len(unchanged) + len(decoded),
+                        time.perf_counter() - start)
+                if not data and not unchanged:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _decode_batch(self, batch: bytes) -> bytes:
+        """
+        Decodes a batch in the default executor, passing it on as it is
+        if that fails so the client is still served.
+        """
+        if not batch:
+            return b""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._decode, batch)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not decode a batch of {} bytes",
+                             len(batch))
+            return batch
+
+    async def start_tcp(self, host: Optional[str] = "127.0.0.1",
+                        port: int = 0) -> asyncio.Server:
+        """
+        Starts serving clients that connect over TCP.
+
+        :param host: Address to listen on; by default only local clients
+        :param port: Port to listen on; by default any free port
+        :returns: The server, which gives the port it is listening on
+        """
+        return await asyncio.start_server(self.serve_stream, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        """
+        Starts serving clients that connect to a Unix socket.
+
+        :param path: The path of the socket
+        :returns: The server
+        """
+        return await asyncio.start_unix_server(self.serve_stream, path)
+
+
+async def _serve(decode_server: DecodeServer, host: str, port: int,
+                 unix: Optional[str], report_interval: float) -> None:
+    if unix:
+        server = await decode_server.start_unix(unix)
+    else:
+        server = await decode_server.start_tcp(host, port)
+    for sock in server.sockets:
+        logger.info("Decoding on {}", sock.getsockname())
+    async with server:
+        while True:
+            await asyncio.sleep(report_interval)
+            logger.info("{}", decode_server.statistics)
+
+
+def main() -> None:
+    """
+    Serves decoding until interrupted.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serves the decoding of short log messages")
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument(
+        "--port", type=int, default=0,
+        help="Port to listen on; default any free port")
+    parser.add_argument(
+        "--unix", help="Listen on this Unix socket instead of TCP")
+    parser.add_argument(
+        "-p", "--path", action="append", default=[],
+        help="Directory to search for logs databases")
+    parser.add_argument(
+        "--report-interval", type=float, default=60,
+        help="Seconds between reports of the counters (default 60)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    for path in args.path:
+        UtilsDataView.register_binary_search_path(path)
+    decode_server = DecodeServer()
+    try:
+        asyncio.run(_serve(decode_server, args.host, args.port, args.unix,
+                           args.report_interval))
+    except KeyboardInterrupt:
+        pass
+    logger.info("{}", decode_server.statistics)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import enum
-from io import TextIOBase
+import hashlib
+from io import StringIO, TextIOBase
 import os
 import re
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from spinn_utilities.exceptions import UnexpectedCException
-from .log_sqllite_database import LogSqlLiteDatabase
+from .log_sqllite_database import LogInfo, LogSqlLiteDatabase
 
 TOKEN = chr(30)  # Record Separator
 
@@ -34,12 +35,39 @@ LEVELS = {"log_info(": 20,
           "log_debug(": 10,
           "log_warning(": 30}
 
+# Marks where a log ID goes in parsed text until the ID is known.
+# A lone surrogate, which text read as strict UTF-8 can never hold.
+_ID_MARK = "\udcff"
+_ID_PLACEHOLDER = re.compile(_ID_MARK + r"(\d+)" + _ID_MARK)
+
+# Finds the first line that is more than just copied
+_NORMAL_SKIP = re.compile(
+    r"/\*|log_(?:info|error|debug|warning)\s*\(")
+_COMMENT_SKIP = re.compile(r"\*/")
+# As above but also finds blank lines that may have to be removed
+_BLANK = r"^[^\S\n]*\*?[^\S\n]*$"
+_NORMAL_BLANK_SKIP = re.compile(
+    _NORMAL_SKIP.pattern + "|" + _BLANK, re.MULTILINE)
+_COMMENT_BLANK_SKIP = re.compile(
+    _COMMENT_SKIP.pattern + "|" + _BLANK, re.MULTILINE)
+
 MINIS = {"log_info(": "log_mini_info(",
          "log_error(": "log_mini_error(",
          "log_debug(": "log_mini_debug(",
          "log_warning(": "log_mini_warning("}
 
 
+def content_hash(path: str) -> str:
+    """
+    Gets a hash of the content of a file.
+
+    :param path: Full path to the file
+    :return: hex digest of the content
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
 class State(enum.Enum):
     """
     Status values.
@@ -56,12 +84,13 @@ class FileConverter(object):
     """
 
     __slots__ = [
+        "_content_hashes",
         "_database_key",
         "_log_database",
-        "_log_file_id",
         "_log",
         "_log_full",
         "_log_lines",
+        "_logs",
         "_log_start",
         "_previous_status",
         "_src",
@@ -69,10 +98,12 @@ class FileConverter(object):
         "_too_many_lines"
     ]
 
-    def __init__(self, log_database: LogSqlLiteDatabase, database_key: str):
+    def __init__(self, log_database: Optional[LogSqlLiteDatabase],
+                 database_key: str):
         """
 
-        :param log_database: Database to use
+        :param log_database:
+            Database to use, or `None` if only used to :py:meth:`parse`
         :param database_key: Key for this conversion
         """
         self._log_database = log_database
@@ -83,11 +114,14 @@ class FileConverter(object):
         if database_key.isdigit():
             raise ValueError(f"{database_key=} is digital")
 
+        # Hashes found by skip_reason of sources to be saved, by full path
+        self._content_hashes: Dict[str, str] = dict()
+
         # fill slots with temp values to avoid Optional
 
         # Variables created in each convert
         self._src = "Not yet defined!"
-        self._log_file_id = -9999999
+        self._logs: List[LogInfo] = []
         self._status = State.NORMAL_CODE
         self._previous_status = State.NORMAL_CODE
         self._too_many_lines = 2
@@ -112,41 +146,195 @@ class FileConverter(object):
             The name of the file to convert within the source directory; it
             will be made with the same name in the destination directory.
         """
-        self._src = os.path.join(src_dir, file_name)
-        if not os.path.exists(self._src):
-            raise UnexpectedCException(f"Unable to locate source {self._src}")
+        if not self.needs_convert(src_dir, dest_dir, file_name):
+            return
+        text, logs = self.parse(src_dir, dest_dir, file_name)
+        self.save(src_dir, dest_dir, file_name, text, logs)
+
+    def needs_convert(
+            self, src_dir: str, dest_dir: str, file_name: str) -> bool:
+        """
+        Checks if the c file needs converting, creating the destination
+        directory if needed.
+
+        :param src_dir: Source directory
+        :param dest_dir: Destination directory
+        :param file_name: The name of the file within the source directory
+        :returns: False if the destination exists and the source has the
+            same content as when last converted.
+            If the content was never recorded, False if the destination is
+            newer than the source.
+        :raises UnexpectedCException: If the source does not exist
+        """
+        return self.skip_reason(src_dir, dest_dir, file_name) is None
+
+    def skip_reason(self, src_dir: str, dest_dir: str,
+                    file_name: str) -> Optional[str]:
+        """
+        As :py:meth:`needs_convert` but says why the file is not converted.
+
+        :param src_dir: Source directory
+        :param dest_dir: Destination directory
+        :param file_name: The name of the file within the source directory
+        :returns: None if the file needs converting, otherwise the reason not
+        :raises UnexpectedCException: If the source does not exist
+        """
+        src = os.path.join(src_dir, file_name)
+        if not os.path.exists(src):
+            raise UnexpectedCException(f"Unable to locate source {src}")
         if not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)
+            os.makedirs(dest_dir, exist_ok=True)
         destination = os.path.join(dest_dir, file_name)
-        if os.path.exists(destination):
-            if os.path.getmtime(destination) > os.path.getmtime(self._src):
-                # Destination is newer than source so skip
-                return
-        directory_id = self._log_database.get_directory_id(src_dir, dest_dir)
-        self._log_file_id = self._log_database.get_file_id(
-            directory_id, file_name)
+        if not os.path.exists(destination):
+            return None
+        assert self._log_database is not None
+        # Not get_directory_id which makes one if needed
+        directory_id = self._log_database.find_directory_id(src_dir, dest_dir)
+        manifest = None
+        if directory_id is not None:
+            manifest = self._log_database.get_source_manifest(
+                directory_id, file_name)
+        if manifest is not None:
+            # Content unchanged so skip whatever the timestamps
+            src_hash = content_hash(src)
+            if manifest[0] == src_hash:
+                return "unchanged content"
+            # Kept for save so the source is only hashed once
+            self._content_hashes[src] = src_hash
+            return None
+        # Destination is newer than source so skip
+        if os.path.getmtime(destination) > os.path.getmtime(src):
+            return "destination newer"
+        return None
+
+    def parse(self, src_dir: str, dest_dir: str,
+              file_name: str) -> Tuple[str, List[LogInfo]]:
+        """
+        Converts the c file to text without using the database.
 
+        The text has placeholders where the log IDs go, which are
+        filled in by :py:meth:`save`.
+
+        :param src_dir: Source directory
+        :param dest_dir: Destination directory
+        :param file_name: The name of the file within the source directory
+        :returns: The converted text and the log messages found in it
+        :raises UnexpectedCException: If the c code can not be converted
+        """
+        self._src = os.path.join(src_dir, file_name)
+        destination = os.path.join(dest_dir, file_name)
+        self._logs = []
         self._status = State.NORMAL_CODE
         self._previous_status = State.NORMAL_CODE
         self._too_many_lines = 2
 
         with open(self._src, encoding="utf-8") as src_f:
-            with open(destination, 'w', encoding="utf-8") as dest_f:
-                dest_f.write(
-                    f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
-                    f"{os.path.relpath(self._src, destination)}\n\n")
-                for line_num, text in enumerate(src_f):
-                    if self._too_many_lines > 0:
-                        # Try to recover the lines added by do not edit
-                        check = text.strip()
-                        if len(check) == 0 or check == "*":
-                            self._too_many_lines -= 1
-                            continue
-                    previous_status = self._status
-                    if not self._process_line(dest_f, line_num, text):
-                        self._status = previous_status
-                        self._process_chars(dest_f, line_num, text)
+            content = src_f.read()
+        dest_f = StringIO()
+        dest_f.write(
+            f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
+            f"{os.path.relpath(self._src, destination)}\n\n")
+        self._convert_text(dest_f, content)
         self._check_end_status()
+        return dest_f.getvalue(), self._logs
+
+    def _convert_text(self, dest_f: TextIOBase, content: str) -> None:
+        """
+        Converts the whole text of a c file in one pass.
+
+        A single regular expression search finds the next line that could
+        need more than copying; all the lines before it are copied in one
+        go and only that line goes through :py:meth:`_convert_line`.
+        While in a log call every line goes through
+        :py:meth:`_convert_line`.
+
+        :param dest_f: Open file like Object to write modified source to
+        :param content: The whole text of the c file
+        """
+        position = 0
+        line_num = 0
+        end = len(content)
+        while position < end:
+            if self._status == State.NORMAL_CODE:
+                skip: Optional[re.Pattern] = (
+                    _NORMAL_BLANK_SKIP if self._too_many_lines > 0
+                    else _NORMAL_SKIP)
+            elif self._status == State.COMMENT:
+                skip = (_COMMENT_BLANK_SKIP if self._too_many_lines > 0
+                        else _COMMENT_SKIP)
+            else:
+                skip = None
+            if skip is not None:
+                match = skip.search(content, position)
+                if match is None:
+                    # Nothing left that is not just copied
+                    dest_f.write(content[position:])
+                    return
+                line_start = content.rfind("\n", position, match.start()) + 1
+                if line_start > position:
+                    dest_f.write(content[position:line_start])
+                    line_num += content.count("\n", position, line_start)
+                    position = line_start
+                    continue
+            line_end = content.find("\n", position) + 1 or end
+            self._convert_line(dest_f, line_num, content[position:line_end])
+            line_num += 1
+            position = line_end
+
+    def _convert_line(
+            self, dest_f: TextIOBase, line_num: int, text: str) -> None:
+        """
+        Converts a single line.
+
+        :param dest_f: Open file like Object to write modified source to
+        :param line_num: Line number in the source c file
+        :param text: Text of that line including whitespace
+        """
+        if self._too_many_lines > 0:
+            # Try to recover the lines added by do not edit
+            check = text.strip()
+            if len(check) == 0 or check == "*":
+                self._too_many_lines -= 1
+                return
+        previous_status = self._status
+        if not self._process_line(dest_f, line_num, text):
+            self._status = previous_status
+            self._process_chars(dest_f, line_num, text)
+
+    def save(self, src_dir: str, dest_dir: str, file_name: str, text: str,
+             logs: List[LogInfo]) -> None:
+        """
+        Saves the log messages found by :py:meth:`parse` in the database,
+        and writes the converted file with their IDs.
+
+        If the source has the same content as when last converted the IDs
+        from then are reused without changing the database.
+
+        :param src_dir: Source directory
+        :param dest_dir: Destination directory
+        :param file_name: The name of the file within the source directory
+        :param text: The text returned by :py:meth:`parse`
+        :param logs: The log messages returned by :py:meth:`parse`
+        """
+        assert self._log_database is not None
+        directory_id = self._log_database.get_directory_id(src_dir, dest_dir)
+        src = os.path.join(src_dir, file_name)
+        src_hash = self._content_hashes.pop(src, None)
+        if src_hash is None:
+            src_hash = content_hash(src)
+        manifest = self._log_database.get_source_manifest(
+            directory_id, file_name)
+        if (manifest is not None and manifest[0] == src_hash and
+                len(manifest[1]) == len(logs)):
+            log_ids = manifest[1]
+        else:
+            log_ids = self._log_database.set_file_log_infos(
+                directory_id, file_name, logs, src_hash)
+        text = _ID_PLACEHOLDER.sub(
+            lambda match: str(log_ids[int(match.group(1))]), text)
+        with open(os.path.join(dest_dir, file_name), 'w',
+                  encoding="utf-8") as dest_f:
+            dest_f.write(text)
 
     def _check_end_status(self) -> None:
         if self._status == State.NORMAL_CODE:
@@ -424,8 +612,9 @@ class FileConverter(object):
         parts = self._split_by_comma_plus(main, line_num)
         original = parts[0]
 
-        message_id = self._log_database.set_log_info(
-            LEVELS[self._log], line_num + 1, original, self._log_file_id)
+        # The real ID is only known once saved
+        message_id = f"{_ID_MARK}{len(self._logs)}{_ID_MARK}"
+        self._logs.append((LEVELS[self._log], line_num + 1, original))
         count = original.count("%") - original.count("%%") * 2
 
         if count == 0:
@@ -0,0 +1,130 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import sqlite3
+from typing import Dict
+
+
+def merge_attached(connection: sqlite3.Connection) -> int:
+    """
+    Adds everything from a logs database attached as ``other`` into the
+    main database of a connection, as :py:meth:`LogSqlLiteDatabase.merge`
+    does.
+
+    Nothing is committed, so the caller can make it one transaction.
+
+    :param connection: The connection, with rows that can be read by name
+    :return: The number of log messages added
+    :raises ValueError:
+        If the same log ID is used for different messages
+    """
+    # Check before changing anything
+    conflicts = [row["log_id"] for row in connection.execute(
+        """
+        SELECT other_log.log_id
+        FROM other.log AS other_log JOIN main.log AS log USING (log_id)
+        WHERE other_log.log_level != log.log_level
+            OR other_log.original != log.original
+        ORDER BY log_id
+        """)]
+    if conflicts:
+        raise ValueError(
+            f"Log IDs {conflicts} used for different messages")
+
+    cursor = connection.cursor()
+    # Not LogSqlLiteDatabase.get_directory_id as that commits and caches
+    directory_ids: Dict[int, int] = dict()
+    for row in connection.execute(
+            "SELECT * FROM other.directory ORDER BY directory_id"
+            ).fetchall():
+        paths = (row["src_path"], row["dest_path"])
+        for found in connection.execute(
+                """
+                SELECT directory_id FROM main.directory
+                WHERE src_path = ? AND dest_path = ?
+                """, paths):
+            directory_ids[row["directory_id"]] = found["directory_id"]
+            break
+        else:
+            cursor.execute(
+                "INSERT INTO directory(src_path, dest_path) VALUES(?, ?)",
+                paths)
+            assert cursor.lastrowid is not None
+            directory_ids[row["directory_id"]] = cursor.lastrowid
+    file_ids: Dict[int, int] = dict()
+    for row in connection.execute(
+            "SELECT * FROM other.file ORDER BY file_id").fetchall():
+        directory_id = directory_ids[row["directory_id"]]
+        # The same build merged before keeps its file row
+        for found in connection.execute(
+                """
+                SELECT file_id FROM main.file
+                WHERE directory_id = ? AND file_name = ? AND convert_time = ?
+                """, (directory_id, row["file_name"], row["convert_time"])):
+            file_ids[row["file_id"]] = found["file_id"]
+            break
+        else:
+            if row["last_build"]:
+                cursor.execute(
+                    """
+                    UPDATE file SET last_build = 0
+                    WHERE directory_id = ? AND file_name = ?
+                    """, [directory_id, row["file_name"]])
+            cursor.execute(
+                """
+                INSERT INTO file(
+                    directory_id, file_name, convert_time, last_build)
+                VALUES(?, ?, ?, ?)
+                """, (directory_id, row["file_name"], row["convert_time"],
+                      row["last_build"]))
+            assert cursor.lastrowid is not None
+            file_ids[row["file_id"]] = cursor.lastrowid
+
+    new_logs = []
+    # Rows of other are fetched first so a failure leaves none open
+    for row in connection.execute(
+            """
+            SELECT other_log.*, log.log_id AS old_id
+            FROM other.log AS other_log
+                LEFT JOIN main.log AS log USING (log_id)
+            ORDER BY log_id
+            """).fetchall():
+        file_id = file_ids[int(row["file_id"])]
+        if row["old_id"] is None:
+            new_logs.append((
+                row["log_id"], row["log_level"], row["line_num"],
+                row["original"], file_id))
+        else:
+            # Same message so now from the merged file
+            cursor.execute(
+                """
+                UPDATE log SET file_id = ?, line_num = ?
+                WHERE log_id = ?
+                """, (file_id, row["line_num"], row["log_id"]))
+    cursor.executemany(
+        """
+        INSERT INTO log(log_id, log_level, line_num, original, file_id)
+        VALUES(?, ?, ?, ?, ?)
+        """, new_logs)
+
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO source_manifest(
+            directory_id, file_name, content_hash, file_id, log_ids)
+        VALUES(?, ?, ?, ?, ?)
+        """, [(directory_ids[row["directory_id"]], row["file_name"],
+               row["content_hash"], file_ids[row["file_id"]],
+               row["log_ids"])
+              for row in connection.execute(
+                  "SELECT * FROM other.source_manifest").fetchall()])
+    return len(new_logs)
@@ -0,0 +1,283 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import partial
+import os
+import sqlite3
+import threading
+from typing import (
+    Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union)
+from urllib.request import pathname2url
+
+from spinn_utilities.abstract_context_manager import AbstractContextManager
+from spinn_utilities.data import UtilsDataView
+from .log_lookup import LogLookup, LookupInfo
+from .log_sqllite_database import LogSqlLiteDatabase, parameter_chunks
+
+#: How many databases SQLite attaches to a connection unless built otherwise
+_MAX_ATTACHED = 10
+
+
+def _schema(group: int, index: int) -> str:
+    """
+    The name a database is attached as.
+
+    :param group: Which connection of each thread it is attached to
+    :param index: Which database attached to that connection it is
+    """
+    return f"logs{group}_{index}"
+
+
+class AttachedDatabase(object):
+    """
+    The log messages of one logs database attached to connections shared
+    with other databases.
+
+    Has the same read methods as :py:class:`LogSqlLiteDatabase`.
+    """
+
+    __slots__ = [
+        # gets the connection of the current thread it is attached to
+        "_connect",
+        # the name the database is attached as
+        "_schema",
+    ]
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection],
+                 schema: str) -> None:
+        """
+        :param connect:
+            Gets the connection of the current thread the database is
+            attached to
+        :param schema: The name the database is attached as
+        """
+        self._connect = connect
+        self._schema = schema
+
+    def _query(self, where: str, parameters: Sequence) -> List[LookupInfo]:
+        # Not the view as views in attached databases can not be relied on
+        return LogSqlLiteDatabase.log_info_rows(self._connect().execute(
+            f"""
+            SELECT log_id, log_level, file_name, line_num, original,
+                last_build
+            FROM {self._schema}.log
+                NATURAL JOIN {self._schema}.file
+            {where}
+            """, parameters))
+
+    def get_log_info(self, log_id: str) -> Optional[Tuple[int, str, str, str]]:
+        """
+        Gets the data needed to replace a short log back to the original.
+
+        :param log_id: The int id as a String
+        :returns: log level, file name, line number and the original text
+        """
+        if not log_id.isdecimal():
+            return None
+        for (_, log_level, file_name, line_num, original) in self._query(
+                "WHERE log_id = ? LIMIT 1", [int(log_id)]):
+            return log_level, file_name, line_num, original
+        return None
+
+    def get_log_infos(self, log_ids: Sequence[int]) -> List[LookupInfo]:
+        """
+        Gets the data needed to replace a batch of short logs.
+
+        IDs not in the database are ignored.
+
+        :param log_ids: The IDs of the log messages wanted
+        :returns: log ID, log level, file name, line number and the original
+            text of each message found
+        """
+        infos: List[LookupInfo] = []
+        for placeholders, chunk in parameter_chunks(list(set(log_ids))):
+            infos.extend(self._query(
+                f"WHERE log_id IN ({placeholders})", chunk))
+        return infos
+
+    def get_all_log_info(self) -> List[LookupInfo]:
+        """
+        Gets the data needed to replace every short log back to the original.
+
+        :returns: As :py:meth:`get_log_infos` for every log message
+        """
+        return self._query("", [])
+
+
+class LogDatabaseRegistry(AbstractContextManager):
+    """
+    Opens the logs databases of every database key for decoding, sharing
+    connections between them.
+
+    A database with an up to date lookup file exported by the converter is
+    read through that, which needs no connection at all.
+    Each other database is attached, read only, to one connection per
+    thread (or a few if there are more than SQLite can attach to one).
+    So decoding messages from many binaries does not open a connection per
+    key, and threads decoding at the same time do not wait for each other.
+    """
+
+    __slots__ = [
+        # the URIs of the databases attached to each group of connections;
+        # the last group has room
+        "_attached",
+        # every connection opened by any thread, to close
+        "_connections",
+        # the opened databases by key
+        "_databases",
+        # the connection of each group and how many are attached to it,
+        # for the current thread
+        "_local",
+        # guards the attached URIs and connections
+        "_lock",
+        # database paths by key, or None to use those registered
+        "_paths",
+    ]
+
+    def __init__(self, paths: Optional[Dict[str, str]] = None) -> None:
+        """
+        :param paths:
+            The database path of each key. If None the paths registered
+            with :py:class:`~spinn_utilities.data.UtilsDataView` are used,
+            as found by
+            :py:meth:`~spinn_utilities.data.UtilsDataView.register_binary_search_path`.
+        """
+        self._paths = None if paths is None else dict(paths)
+        self._attached: List[List[str]] = []
+        self._connections: List[sqlite3.Connection] = []
+        self._databases: Dict[
+            str, Union[LogLookup, AttachedDatabase]] = dict()
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_directories(
+            cls, database_dirs: Iterable[str]) -> "LogDatabaseRegistry":
+        """
+        Makes a registry of the logs databases in some directories, found
+        once with :py:meth:`LogSqlLiteDatabase.find_databases`.
+
+        :param database_dirs: Directories that may have logs databases in
+        :returns: A registry of the databases found
+        :raises ValueError: If two databases have the same key
+        """
+        paths: Dict[str, str] = dict()
+        for database_dir in database_dirs:
+            for key, path in LogSqlLiteDatabase.find_databases(
+                    database_dir).items():
+                if key in paths and paths[key] != path:
+                    raise ValueError(
+                        f"Both databases {path} and {paths[key]} have the "
+                        f"database_key {key}")
+                paths[key] = path
+        return cls(paths)
+
+    @property
+    def keys(self) -> List[str]:
+        """
+        The database keys known, or those opened so far if using the
+        registered paths.
+        """
+        if self._paths is None:
+            return sorted(self._databases)
+        return sorted(self._paths)
+
+    def _path(self, database_key: str) -> Optional[str]:
+        if self._paths is None:
+            return UtilsDataView.get_log_database_path(database_key)
+        return self._paths.get(database_key)
+
+    def _connection(self, group: int) -> sqlite3.Connection:
+        """
+        Gets the connection of the current thread for a group of attached
+        databases, first attaching any added since it was last used.
+
+        :param group: Which group of databases
+        """
+        if not hasattr(self._local, "connections"):
+            self._local.connections = dict()
+            self._local.attached = dict()
+        connections: Dict[int, sqlite3.Connection] = self._local.connections
+        attached: Dict[int, int] = self._local.attached
+        if group in connections and \
+                attached[group] == len(self._attached[group]):
+            return connections[group]
+        with self._lock:
+            if group not in connections:
+                # Closed by whichever thread closes the registry
+                connection = sqlite3.connect(
+                    ":memory:", check_same_thread=False)
+                connection.row_factory = sqlite3.Row
+                self._connections.append(connection)
+                connections[group] = connection
+                attached[group] = 0
+            uris = self._attached[group]
+            for index in range(attached[group], len(uris)):
+                connections[group].execute(
+                    f"ATTACH DATABASE ? AS {_schema(group, index)}",
+                    [uris[index]])
+                attached[group] = index + 1
+            return connections[group]
+
+    def _attach(self, database_path: str) -> AttachedDatabase:
+        uri = "file:" + pathname2url(
+            os.path.abspath(database_path)) + "?mode=ro"
+        with self._lock:
+            if not self._attached or \
+                    len(self._attached[-1]) == _MAX_ATTACHED:
+                self._attached.append([])
+            group = len(self._attached) - 1
+            index = len(self._attached[group])
+            # Attached in this thread first so a bad database raises here
+            self._connection(group).execute(
+                f"ATTACH DATABASE ? AS {_schema(group, index)}", [uri])
+            self._attached[group].append(uri)
+            self._local.attached[group] = index + 1
+        return AttachedDatabase(partial(self._connection, group),
+                                _schema(group, index))
+
+    def database(self, database_key: str
+                 ) -> Optional[Union[LogLookup, AttachedDatabase]]:
+        """
+        Gets the database for a key, opening it the first time.
+
+        :param database_key: The key; "" for the deprecated database
+        :return: Something with the read methods of
+            :py:class:`LogSqlLiteDatabase`, or None if no database has the key
+        """
+        if database_key in self._databases:
+            return self._databases[database_key]
+        database_path = self._path(database_key)
+        if database_path is None:
+            # Not remembered as it may be registered later
+            return None
+        database: Union[LogLookup, AttachedDatabase, None] = \
+            LogLookup.open_if_current(database_path)
+        if database is None:
+            database = self._attach(database_path)
+        self._databases[database_key] = database
+        return database
+
+    def close(self) -> None:
+        for database in self._databases.values():
+            if isinstance(database, LogLookup):
+                database.close()
+        self._databases = dict()
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+            self._attached = []
+            # Forget the connections of every thread
+            self._local = threading.local()
@@ -0,0 +1,258 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+import struct
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.abstract_context_manager import AbstractContextManager
+
+#: Identifies the file and the version of its layout;
+#: 2 added the count of sorted IDs to the header
+_MAGIC = b"SPNLOGS2"
+#: The magic bytes, the number of entries in the index and
+#: the number of sorted IDs before the index (0 if indexed by ID)
+_HEADER = struct.Struct("<8sII")
+#: The offset into the blob and length of the entry for one log ID
+_ENTRY = struct.Struct("<II")
+#: The type of the sorted IDs of a sparse index
+_ID_TYPE = numpy.dtype("<u4")
+_MAX_ID = 2 ** 32 - 1
+#: Index by ID unless that has more than this many entries per message
+_MAX_SPARSENESS = 2
+#: plus this many
+_MAX_UNUSED = 1024
+#: Separates the fields of an entry
+_SEPARATOR = "\0"
+_ENCODING = "utf-8"
+_ERRORS = "surrogatepass"
+
+#: The log ID, log level, file name, line number and original text
+LookupInfo = Tuple[int, int, str, str, str]
+
+
+def lookup_filename(database_path: str) -> str:
+    """
+    Gets the path of the lookup file exported from a logs database.
+
+    :param database_path: Path to the logs database
+    :return: Path to the lookup file
+    """
+    return os.path.splitext(database_path)[0] + ".lookup"
+
+
+class LogLookup(AbstractContextManager):
+    """
+    A read only, memory mapped copy of what the
+    :py:class:`~spinn_utilities.make_tools.replacer.Replacer` needs from a
+    logs database.
+
+    The file is a header, then an index with a fixed width entry for every
+    log ID up to the largest, then one blob holding the level, file name,
+    line number and original text of each message.
+    So opening it costs almost nothing and finding a message is one
+    index read.
+
+    Where the IDs are too sparse for that, such as hashed IDs, the index
+    has an entry per message and is preceded by the sorted IDs, which are
+    binary searched.
+    """
+
+    __slots__ = [
+        # start of the blob in the file
+        "_blob",
+        # the number of entries in the index
+        "_count",
+        # the open file
+        "_file",
+        # the sorted IDs if sparse
+        "_ids",
+        # start of the index in the file
+        "_index",
+        # the mapped file
+        "_map",
+    ]
+
+    def __init__(self, lookup_path: str) -> None:
+        """
+        :param lookup_path: Path to the lookup file
+        :raises ValueError: If the file is not a lookup file
+        """
+        self._map: Optional[mmap.mmap] = None
+        self._ids: Optional[NDArray[numpy.uint32]] = None
+        self._file = open(lookup_path, "rb")  # pylint: disable=R1732
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._map) < _HEADER.size:
+                raise ValueError(f"{lookup_path} is not a log lookup file")
+            magic, self._count, n_ids = _HEADER.unpack_from(self._map)
+            if magic != _MAGIC:
+                raise ValueError(f"{lookup_path} is not a log lookup file")
+        except (OSError, ValueError):
+            # An empty file cannot be mapped at all
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+            raise
+        if n_ids:
+            self._ids = numpy.frombuffer(
+                self._map, dtype=_ID_TYPE, count=n_ids, offset=_HEADER.size)
+        self._index = _HEADER.size + n_ids * _ID_TYPE.itemsize
+        self._blob = self._index + self._count * _ENTRY.size
+
+    @classmethod
+    def open_if_current(cls, database_path: str) -> Optional["LogLookup"]:
+        """
+        Opens the lookup file of a logs database if there is one
+        written since the database was last changed.
+
+        Writes in WAL mode may only change the write ahead log, so that
+        counts as a change to the database too.
+        A lookup file with the same modification time as the database
+        may be from before the change, so is not used.
+
+        :param database_path: Path to the logs database
+        :return: The lookup or None if the database must be used instead
+        """
+        lookup_path = lookup_filename(database_path)
+        try:
+            changed = os.stat(database_path).st_mtime_ns
+            wal_path = database_path + "-wal"
+            if os.path.exists(wal_path):
+                changed = max(changed, os.stat(wal_path).st_mtime_ns)
+            if os.stat(lookup_path).st_mtime_ns <= changed:
+                return None
+            return cls(lookup_path)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def write(lookup_path: str, infos: Iterable[LookupInfo]) -> None:
+        """
+        Writes a lookup file.
+
+        The file is written under a temporary name and then renamed, so a
+        reader never sees part of a file.
+
+        :param lookup_path: Path to write to
+        :param infos: As returned by
+            :py:meth:`LogSqlLiteDatabase.get_all_log_info`
+        """
+        records = {
+            log_id: _SEPARATOR.join(
+                (str(log_level), file_name, line_num, original)).encode(
+                    _ENCODING, _ERRORS)
+            for (log_id, log_level, file_name, line_num, original) in infos}
+        count = max(records) + 1 if records else 0
+        ids = b""
+        if count > _MAX_SPARSENESS * len(records) + _MAX_UNUSED:
+            # Too many unused entries so index by position in sorted IDs
+            sorted_ids = sorted(records)
+            ids = numpy.array(sorted_ids, dtype=_ID_TYPE).tobytes()
+            positions = {log_id: i for i, log_id in enumerate(sorted_ids)}
+            count = len(records)
+        else:
+            positions = {log_id: log_id for log_id in records}
+        index = bytearray(count * _ENTRY.size)
+        blob = bytearray()
+        for log_id, record in records.items():
+            _ENTRY.pack_into(index, positions[log_id] * _ENTRY.size,
+                             len(blob), len(record))
+            blob += record
+        temp_path = lookup_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, count, len(ids) // 4))
+            f.write(ids)
+            f.write(index)
+            f.write(blob)
+        os.replace(temp_path, lookup_path)
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+        """
+        if self._map is not None:
+            # The view of the IDs must go before the map can close
+            self._ids = None
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _info(self, log_id: int) -> Optional[Tuple[int, str, str, str]]:
+        assert self._map is not None
+        if self._ids is None:
+            position = log_id
+        elif log_id > _MAX_ID:
+            return None
+        else:
+            position = int(numpy.searchsorted(self._ids, log_id))
+            if position == len(self._ids) or self._ids[position] != log_id:
+                return None
+        if not 0 <= position < self._count:
+            return None
+        offset, length = _ENTRY.unpack_from(
+            self._map, self._index + position * _ENTRY.size)
+        if length == 0:
+            return None
+        start = self._blob + offset
+        log_level, file_name, line_num, original = self._map[
+            start:start + length].decode(_ENCODING, _ERRORS).split(
+                _SEPARATOR, 3)
+        return int(log_level), file_name, line_num, original
+
+    def get_log_info(self, log_id: str) -> Optional[Tuple[int, str, str, str]]:
+        """
+        Gets the data needed to replace a short log back to the original.
+
+        :param log_id: The int id as a String
+        :returns: log level, file name, line number and the original text
+        """
+        if not log_id.isdecimal():
+            return None
+        return self._info(int(log_id))
+
+    def get_log_infos(self, log_ids: Sequence[int]) -> List[LookupInfo]:
+        """
+        Gets the data needed to replace a batch of short logs.
+
+        IDs not in the file are ignored.
+
+        :param log_ids: The IDs of the log messages wanted
+        :returns: log ID, log level, file name, line number and the original
+            text of each message found
+        """
+        infos = []
+        for log_id in dict.fromkeys(log_ids):
+            info = self._info(log_id)
+            if info is not None:
+                infos.append((log_id, *info))
+        return infos
+
+    def get_all_log_info(self) -> List[LookupInfo]:
+        """
+        Gets the data needed to replace every short log back to the original.
+
+        :returns: log ID, log level, file name, line number and the original
+            text of every log message
+        """
+        if self._ids is None:
+            return self.get_log_infos(range(self._count))
+        return self.get_log_infos(self._ids.tolist())
@@ -12,16 +12,76 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
+import hashlib
 import os
 import sqlite3
 import sys
+import threading
 import time
-from typing import Dict, Optional, Tuple
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple)
+from urllib.request import pathname2url
+from typing_extensions import TypeAlias
 from spinn_utilities.abstract_context_manager import AbstractContextManager
+from .log_database_merge import merge_attached
 
 _DDL_FILE = os.path.join(os.path.dirname(__file__), "db.sql")
 _SECONDS_TO_MICRO_SECONDS_CONVERSION = 1000
 DB_FILE_NAME = "logs.sqlite3"
+# Keep well below the SQLite limit on the number of parameters
+_MAX_PARAMETERS = 500
+# Hashed log IDs are below this so they fit in a signed 32 bit int
+_MAX_HASHED_ID = 2 ** 31 - 1
+# Records what the conversion of a source file produced
+_SET_SOURCE_MANIFEST = """
+    INSERT OR REPLACE INTO source_manifest(
+        directory_id, file_name, content_hash, file_id, log_ids)
+    VALUES(?, ?, ?, ?, ?)
+    """
+
+#: The log level, line number and original text of a log message
+LogInfo: TypeAlias = Tuple[int, int, str]
+
+
+def hashed_log_id(file_path: str, log_level: int, original: str,
+                  occurrence: int = 0, attempt: int = 0) -> int:
+    """
+    Makes a log ID from a stable hash of a log message.
+
+    The ID fits in 31 bits so can be printed by the C code with ``%u``.
+
+    :param file_path:
+        Path of the file the log is in, relative to the root of the
+        source tree and with ``/`` between directories
+    :param log_level: The level of the log message
+    :param original: The original text of the log message
+    :param occurrence:
+        How many times the same level and text was found earlier in the file
+    :param attempt: How many IDs have already been found to be in use
+    :return: An ID between 1 and 2**31 - 1
+    """
+    key = f"{file_path}\0{log_level}\0{original}\0{occurrence}"
+    if attempt:
+        key += f"\0{attempt}"
+    digest = hashlib.blake2b(
+        key.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % _MAX_HASHED_ID + 1
+
+
+def parameter_chunks(
+        values: Sequence[Any]) -> Iterator[Tuple[str, Sequence[Any]]]:
+    """
+    Splits the values to find with ``IN`` into chunks small enough for the
+    SQLite limit on the number of parameters.
+
+    :param values: The values to find
+    :return: The placeholders to go in the brackets and the values of
+        each chunk
+    """
+    for i in range(0, len(values), _MAX_PARAMETERS):
+        chunk = values[i:i + _MAX_PARAMETERS]
+        yield ", ".join("?" * len(chunk)), chunk
 
 
 def _timestamp() -> int:
@@ -32,9 +92,12 @@ class LogSqlLiteDatabase(AbstractContextManager):
     """
     Specific implementation of the Database for SQLite 3.
 
-    .. note::
-        **Not thread-safe on the same database.**
-        Threads can access different DBs just fine.
+    Each thread that uses the object gets its own connection,
+    so many threads can read the database at the same time.
+    Writing should still be done from a single thread.
+
+    While open for writing the database is in write-ahead log mode, so
+    read only connections (from other processes) can read at the same time.
 
     .. note::
         This totally relies on the way SQLite's type affinities function.
@@ -42,22 +105,102 @@ class LogSqlLiteDatabase(AbstractContextManager):
     """
 
     __slots__ = [
-        # the database holding the data to store
-        "_db",
+        # the connections in use, one per thread
+        "_connections",
+        # Full path to the database
+        "_database_path",
+        # True if opened read only
+        "_read_only",
+        # True if the database file is known never to change while open
+        "_immutable",
+        # guards the list of connections
+        "_lock",
+        # the connection of each thread
+        "_local",
+        # Once a session has started the directory IDs by source and
+        # destination path
+        "_directory_ids",
+        # In a session the file IDs by directory ID and file name
+        "_file_ids",
+        # In a session the root of the source tree if known
+        "_source_root",
+        # True if log IDs are made from a hash of the message
+        "_hashed_ids",
     ]
 
-    def __init__(self, database_path: str) -> None:
+    def __init__(self, database_path: str, read_only: bool = False,
+                 immutable: bool = False, hashed_ids: bool = False) -> None:
         """
         Connects to a log dict. The location of the file can be overridden
         using the ``C_LOGS_DICT`` environment variable.
 
         param database_file: Full path to the database.
            (use default_database_file to get the default location)
+        :param read_only:
+            If True the database is opened read only, such as for decoding,
+            and the file must already exist.
+        :param immutable:
+            If True and read only, SQLite is told the file can not change
+            so does no locking at all. Only safe if no build can be writing
+            the database at the same time.
+        :param hashed_ids:
+            If True :py:meth:`set_log_infos` makes each log ID from a hash
+            of the file path, level and text of the message (see
+            :py:func:`hashed_log_id`), so every conversion of the same
+            source gives the same IDs and databases made separately can
+            be combined with :py:meth:`merge`.
         """
         # To Avoid an Attribute error on close after an exception
-        self._db: Optional[sqlite3.Connection] = None
-        self._db = sqlite3.connect(database_path)
-        self.__init_db()
+        self._connections: Optional[List[sqlite3.Connection]] = None
+        self._database_path = database_path
+        self._read_only = read_only
+        self._immutable = immutable
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = []
+        self._directory_ids: Optional[Dict[Tuple[str, str], int]] = None
+        self._file_ids: Optional[Dict[Tuple[int, str], int]] = None
+        self._source_root: Optional[str] = None
+        self._hashed_ids = hashed_ids
+        # Connect now so any error is raised here
+        self.__connect()
+
+    @property
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """
+        The connection for the current thread, opened if needed.
+
+        None if the database has been closed.
+        """
+        if self._connections is None:
+            return None
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None)
+        if connection is None:
+            connection = self.__connect()
+        return connection
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection for the current thread.
+        """
+        if self._read_only:
+            uri = "file:" + pathname2url(os.path.abspath(
+                self._database_path)) + "?mode=ro"
+            if self._immutable:
+                uri += "&immutable=1"
+            connection = sqlite3.connect(
+                uri, uri=True, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(
+                self._database_path, check_same_thread=False)
+        with self._lock:
+            assert self._connections is not None
+            first = not self._connections
+            self._connections.append(connection)
+        self._local.connection = connection
+        self.__init_db(connection, first and not self._read_only)
+        return connection
 
     @classmethod
     def deprecated_database_file(cls) -> str:
@@ -102,24 +245,75 @@ class LogSqlLiteDatabase(AbstractContextManager):
         """
         Finalises and closes the database.
         """
-        try:
-            if self._db is not None:
-                self._db.close()
-        except Exception as ex:  # pylint: disable=broad-except
-            print(ex)
-        self._db = None
-
-    def __init_db(self) -> None:
+        if self._connections is None:
+            return
+        self.end_session()
+        with self._lock:
+            connections = self._connections
+            self._connections = None
+        if connections and not self._read_only:
+            try:
+                # Leave the file as a single rollback journal database
+                # so it can be read (read only) without the WAL files
+                connections[0].execute("PRAGMA journal_mode = DELETE")
+            except sqlite3.Error:
+                # Another connection is still in use so leave it in WAL
+                pass
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception as ex:  # pylint: disable=broad-except
+                print(ex)
+
+    def __init_db(self, connection: sqlite3.Connection,
+                  create: bool) -> None:
         """
         Set up the database if required.
+
+        :param connection: The connection to set up
+        :param create: True to create or update the tables
         """
-        assert self._db is not None
-        self._db.row_factory = sqlite3.Row
+        connection.row_factory = sqlite3.Row
         # Don't use memoryview / buffer as hard to deal with difference
-        self._db.text_factory = str
-        with open(_DDL_FILE, encoding="utf-8") as f:
-            sql = f.read()
-        self._db.executescript(sql)
+        connection.text_factory = str
+        if create:
+            with open(_DDL_FILE, encoding="utf-8") as f:
+                sql = f.read()
+            connection.executescript(sql)
+        elif not self._read_only:
+            connection.execute("PRAGMA main.synchronous = OFF")
+
+    def start_session(self, source_root: Optional[str] = None) -> None:
+        """
+        Starts a conversion session.
+
+        Until :py:meth:`end_session` directory and file IDs are kept in
+        memory, so each file gets one new file row however often it is
+        converted in the session.
+        :py:meth:`set_file_log_infos` writes that row in the same
+        transaction as the logs of the file.
+
+        Directory IDs never change so are also kept from any previous
+        session, until :py:meth:`prune`.
+
+        :param source_root:
+            Full path of the top of the source tree being converted.
+            Hashed log IDs are made from the path of each file below it,
+            or from just the file name if not given.
+        """
+        if self._directory_ids is None:
+            self._directory_ids = dict()
+        self._file_ids = dict()
+        self._source_root = source_root
+
+    def end_session(self) -> None:
+        """
+        Ends a conversion session, forgetting the file IDs kept in it.
+
+        Does nothing if no session was started.
+        """
+        self._file_ids = None
+        self._source_root = None
 
     def get_directory_id(self, src_path: str, dest_path: str) -> int:
         """
@@ -129,57 +323,91 @@ class LogSqlLiteDatabase(AbstractContextManager):
         :param dest_path:
         :returns: The ID for this directory.
         """
+        directory_id = self.find_directory_id(src_path, dest_path)
+        if directory_id is not None:
+            return directory_id
         assert self._db is not None
         with self._db:
-            cursor = self._db.cursor()
-            # reuse the existing if it exists
-            for row in self._db.execute(
-                    """
-                    SELECT directory_id
-                    FROM directory
-                    WHERE src_path = ? AND dest_path = ?
-                    LIMIT 1
-                    """, [src_path, dest_path]):
-                return row["directory_id"]
-
-            # create a new number
-            cursor.execute(
+            directory_id = self._db.execute(
                 """
                 INSERT INTO directory(src_path, dest_path)
                 VALUES(?, ?)
-                """, (src_path, dest_path))
-            directory_id = cursor.lastrowid
-            assert directory_id is not None
-            return directory_id
+                """, (src_path, dest_path)).lastrowid
+        assert directory_id is not None
+        if self._directory_ids is not None:
+            self._directory_ids[(src_path, dest_path)] = directory_id
+        return directory_id
+
+    def find_directory_id(
+            self, src_path: str, dest_path: str) -> Optional[int]:
+        """
+        Gets the ID for this directory without making a new one.
+
+        :param src_path:
+        :param dest_path:
+        :returns: The ID for this directory, or None if it has none yet
+        """
+        key = (src_path, dest_path)
+        if self._directory_ids is not None and key in self._directory_ids:
+            return self._directory_ids[key]
+        assert self._db is not None
+        for row in self._db.execute(
+                """
+                SELECT directory_id
+                FROM directory
+                WHERE src_path = ? AND dest_path = ?
+                LIMIT 1
+                """, key):
+            if self._directory_ids is not None:
+                self._directory_ids[key] = row["directory_id"]
+            return row["directory_id"]
+        return None
 
     def get_file_id(self, directory_id: int, file_name: str) -> int:
         """
         Gets the id for this file, making a new one if needed.
 
+        In a session the same file gets the same ID each time.
+        A new file row is written in the same transaction as the ID is
+        made, so IDs never clash with those of another writer.
+
         :param directory_id:
         :param file_name:
         :returns: The ID for this file
         """
         assert self._db is not None
-        with self._db:
-            # Make previous one as not last
-            with self._db:
-                cursor = self._db.cursor()
-                cursor.execute(
-                    """
-                    UPDATE file SET last_build = 0
-                    WHERE directory_id = ? AND file_name = ?
-                    """, [directory_id, file_name])
-                # always create new one to distinguish new from old logs
-                cursor.execute(
-                    """
-                    INSERT INTO file(
-                        directory_id, file_name, convert_time, last_build)
-                    VALUES(?, ?, ?, 1)
-                    """, (directory_id, file_name, _timestamp()))
-                file_id = cursor.lastrowid
-                assert file_id is not None
+        if self._file_ids is not None:
+            file_id = self._file_ids.get((directory_id, file_name))
+            if file_id is not None:
                 return file_id
+        with self._db:
+            file_id = self._new_file_id(directory_id, file_name)
+        if self._file_ids is not None:
+            self._file_ids[(directory_id, file_name)] = file_id
+        return file_id
+
+    def _new_file_id(self, directory_id: int, file_name: str) -> int:
+        """
+        Writes a new file row in the current transaction.
+        """
+        assert self._db is not None
+        cursor = self._db.cursor()
+        # Make previous one as not last
+        cursor.execute(
+            """
+            UPDATE file SET last_build = 0
+            WHERE directory_id = ? AND file_name = ?
+            """, [directory_id, file_name])
+        # always create new one to distinguish new from old logs
+        cursor.execute(
+            """
+            INSERT INTO file(
+                directory_id, file_name, convert_time, last_build)
+            VALUES(?, ?, ?, 1)
+            """, (directory_id, file_name, _timestamp()))
+        file_id = cursor.lastrowid
+        assert file_id is not None
+        return file_id
 
     def set_log_info(self, log_level: int, line_num: int,
                      original: str, file_id: int) -> int:
@@ -225,6 +453,355 @@ class LogSqlLiteDatabase(AbstractContextManager):
                     return row["log_id"]
         raise ValueError("unexpected no return")
 
+    def set_log_infos(
+            self, logs: List[LogInfo], file_id: int) -> List[int]:
+        """
+        Saves the data for all the log messages in a file in one transaction.
+
+        Gives the same IDs as calling :py:meth:`set_log_info` for each log
+        in turn.
+
+        If the database was opened with ``hashed_ids`` the IDs are made
+        by :py:func:`hashed_log_id` instead.
+
+        :param logs: log level, line number and original of each log message
+        :param file_id:
+        :returns: ID for each log message
+        """
+        assert self._db is not None
+        with self._db:
+            return self._save_log_infos(logs, file_id)
+
+    def _save_log_infos(
+            self, logs: List[LogInfo], file_id: int) -> List[int]:
+        """
+        Saves the log messages of a file in the current transaction.
+        """
+        if self._hashed_ids:
+            return self._set_hashed_log_infos(logs, file_id)
+        assert self._db is not None
+        unique = list(dict.fromkeys(logs))
+        log_ids: Dict[LogInfo, int] = dict()
+        cursor = self._db.cursor()
+        # find the existing numbers to reuse if nothing has changed
+        originals = list(dict.fromkeys(
+            original for (_, _, original) in unique))
+        for placeholders, chunk in parameter_chunks(originals):
+            for row in self._db.execute(
+                    f"""
+                    SELECT MIN(log_id) AS log_id, log_level, line_num,
+                        original
+                    FROM log
+                    WHERE original IN ({placeholders})
+                    GROUP BY log_level, line_num, original
+                    """, chunk):
+                key = (row["log_level"], row["line_num"], row["original"])
+                log_ids[key] = row["log_id"]
+        cursor.executemany(
+            """
+            UPDATE log SET
+                file_id = ?
+            WHERE log_id = ?
+            """, [(file_id, log_ids[log]) for log in unique
+                  if log in log_ids])
+
+        # create new numbers for anything that has changed
+        new_logs = [log for log in unique if log not in log_ids]
+        if new_logs:
+            previous_max = 0
+            for row in self._db.execute(
+                    "SELECT seq FROM sqlite_sequence WHERE name = 'log'"):
+                previous_max = row["seq"]
+            cursor.executemany(
+                """
+                INSERT INTO log(log_level, line_num, original, file_id)
+                VALUES(?, ?, ?, ?)
+                """, [(log_level, line_num, original, file_id)
+                      for (log_level, line_num, original) in new_logs])
+            # AUTOINCREMENT numbers the inserts in order
+            for log, row in zip(new_logs, self._db.execute(
+                    """
+                    SELECT log_id
+                    FROM log
+                    WHERE log_id > ?
+                    ORDER BY log_id
+                    """, [previous_max])):
+                log_ids[log] = row["log_id"]
+        return [log_ids[log] for log in logs]
+
+    def _set_hashed_log_infos(
+            self, logs: List[LogInfo], file_id: int) -> List[int]:
+        """
+        Saves the log messages of a file with IDs made from a hash,
+        in the current transaction.
+
+        An ID already used by an earlier build of the same file, for the
+        same level and text, is reused. If an ID is in use for anything
+        else the next attempt of :py:func:`hashed_log_id` is tried.
+
+        :param logs: log level, line number and original of each log message
+        :param file_id:
+        :returns: ID for each log message
+        """
+        assert self._db is not None
+        directory_id, file_name, file_path = self._hashed_file_path(file_id)
+        occurrences: Dict[Tuple[int, str], int] = defaultdict(int)
+        # Who owns each ID so far as directory, file name, level and original
+        owners: Dict[int, Optional[Tuple[int, str, int, str]]] = dict()
+        log_ids: List[int] = []
+        for (log_level, _, original) in logs:
+            occurrence = occurrences[(log_level, original)]
+            occurrences[(log_level, original)] += 1
+            message = (directory_id, file_name, log_level, original)
+            attempt = 0
+            while True:
+                log_id = hashed_log_id(
+                    file_path, log_level, original, occurrence, attempt)
+                if log_id not in owners:
+                    owners[log_id] = self._log_owner(log_id)
+                # An ID given out earlier in this file is always taken
+                if log_id not in log_ids and \
+                        owners[log_id] in (None, message):
+                    break
+                attempt += 1
+            log_ids.append(log_id)
+        rows = [(log_level, line_num, original, file_id, log_id)
+                for log_id, (log_level, line_num, original)
+                in zip(log_ids, logs)]
+        self._db.executemany(
+            """
+            UPDATE log SET file_id = ?, line_num = ?
+            WHERE log_id = ?
+            """, [(file_id, line_num, log_id)
+                  for (_, line_num, _, _, log_id) in rows
+                  if owners[log_id] is not None])
+        self._db.executemany(
+            """
+            INSERT INTO log(log_level, line_num, original, file_id, log_id)
+            VALUES(?, ?, ?, ?, ?)
+            """, [row for row in rows if owners[row[4]] is None])
+        return log_ids
+
+    def _hashed_file_path(self, file_id: int) -> Tuple[int, str, str]:
+        """
+        Gets the directory ID, name and the path used to hash the log IDs
+        of a file.
+        """
+        assert self._db is not None
+        for row in self._db.execute(
+                """
+                SELECT directory_id, file_name, src_path
+                FROM file NATURAL JOIN directory
+                WHERE file_id = ?
+                """, [file_id]):
+            if self._source_root is None:
+                return (row["directory_id"], row["file_name"],
+                        row["file_name"])
+            file_path = os.path.relpath(
+                os.path.join(row["src_path"], row["file_name"]),
+                self._source_root)
+            return (row["directory_id"], row["file_name"],
+                    file_path.replace(os.sep, "/"))
+        raise ValueError(f"Unknown {file_id=}")
+
+    def _log_owner(self, log_id: int) -> Optional[Tuple[int, str, int, str]]:
+        """
+        Gets the directory ID, file name, level and original of a log ID
+        if in use.
+        """
+        assert self._db is not None
+        for row in self._db.execute(
+                """
+                SELECT directory_id, file_name, log_level, original
+                FROM log NATURAL JOIN file
+                WHERE log_id = ?
+                """, [log_id]):
+            return (row["directory_id"], row["file_name"], row["log_level"],
+                    row["original"])
+        return None
+
+    def merge(self, database_path: str) -> int:
+        """
+        Adds everything from another log database into this one.
+
+        Intended for databases made with ``hashed_ids`` from different
+        parts of the same source tree, for example on different build
+        machines. Log IDs are kept, so a log ID in both must be for the
+        same message.
+        Merging the same database again changes nothing.
+
+        :param database_path: Path to the database to add
+        :return: The number of log messages added
+        :raises ValueError:
+            If the same log ID is used for different messages
+        """
+        assert self._db is not None
+        self.end_session()
+        self._db.execute("ATTACH DATABASE ? AS other", [
+            "file:" + pathname2url(os.path.abspath(database_path)) +
+            "?mode=ro"])
+        try:
+            with self._db:
+                # One transaction, so a merge that fails changes nothing
+                self._db.execute("BEGIN IMMEDIATE")
+                return merge_attached(self._db)
+        finally:
+            self._db.execute("DETACH DATABASE other")
+
+    def prune(self, keep_log_ids: Iterable[int] = ()) -> int:
+        """
+        Deletes the log messages that are not in the last build of any
+        file, then the files and directories no longer used, and gives the
+        space back to the file system.
+
+        :param keep_log_ids:
+            IDs of log messages not to delete even if from an older build,
+            such as those needed to decode binaries still in use
+        :return: The number of bytes the database shrank by.
+            This can be negative the first time an old database is pruned
+            as it is changed to allow incremental vacuuming.
+        """
+        assert self._db is not None
+        self.end_session()
+        # Directories may be deleted
+        self._directory_ids = None
+        before = self._size()
+        keep = set(keep_log_ids)
+        with self._db:
+            for row in self._db.execute(
+                    "SELECT log_ids FROM source_manifest"):
+                keep.update(int(log_id) for log_id in
+                            row["log_ids"].split(",") if log_id)
+            self._db.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS keep_log(
+                    log_id INTEGER PRIMARY KEY)
+                """)
+            self._db.execute("DELETE FROM keep_log")
+            self._db.executemany(
+                "INSERT INTO keep_log(log_id) VALUES(?)",
+                [(log_id,) for log_id in keep])
+            self._db.execute(
+                """
+                DELETE FROM log
+                WHERE file_id NOT IN (
+                        SELECT file_id FROM file WHERE last_build = 1)
+                    AND log_id NOT IN (SELECT log_id FROM keep_log)
+                """)
+            self._db.execute(
+                """
+                DELETE FROM file
+                WHERE last_build = 0
+                    AND file_id NOT IN (SELECT file_id FROM log)
+                    AND file_id NOT IN (SELECT file_id FROM source_manifest)
+                """)
+            self._db.execute(
+                """
+                DELETE FROM directory
+                WHERE directory_id NOT IN (SELECT directory_id FROM file)
+                    AND directory_id NOT IN (
+                        SELECT directory_id FROM source_manifest)
+                """)
+            self._db.execute("DROP TABLE keep_log")
+        # https://www.sqlite.org/pragma.html#pragma_incremental_vacuum
+        if self._db.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            self._db.execute("PRAGMA incremental_vacuum").fetchall()
+        else:
+            # Database from before auto vacuum so change it once
+            self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._db.execute("VACUUM")
+        return before - self._size()
+
+    def checkpoint(self) -> None:
+        """
+        Copies the changes in the write ahead log into the database file,
+        so the file is modified now rather than at some later write.
+        """
+        assert self._db is not None
+        self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def _size(self) -> int:
+        """
+        The size of the database in bytes.
+        """
+        assert self._db is not None
+        page_count = self._db.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._db.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def get_source_manifest(
+            self, directory_id: int,
+            file_name: str) -> Optional[Tuple[str, List[int]]]:
+        """
+        Gets what was recorded when a source file was last converted.
+
+        :param directory_id:
+        :param file_name:
+        :returns: The content hash of the source and the log IDs produced,
+            or None if nothing was recorded
+        """
+        assert self._db is not None
+        with self._db:
+            for row in self._db.execute(
+                    """
+                    SELECT content_hash, log_ids
+                    FROM source_manifest
+                    WHERE directory_id = ? AND file_name = ?
+                    LIMIT 1
+                    """, [directory_id, file_name]):
+                log_ids = [int(log_id) for log_id in
+                           row["log_ids"].split(",") if log_id]
+                return row["content_hash"], log_ids
+        return None
+
+    def set_source_manifest(
+            self, directory_id: int, file_name: str, content_hash: str,
+            file_id: int, log_ids: List[int]) -> None:
+        """
+        Records the content hash of a converted source file and the log IDs
+        its conversion produced.
+
+        :param directory_id:
+        :param file_name:
+        :param content_hash: Hash of the content of the source file
+        :param file_id: The ID of the file the logs were saved for
+        :param log_ids: The IDs of the logs in the order found
+        """
+        assert self._db is not None
+        with self._db:
+            self._db.execute(_SET_SOURCE_MANIFEST, (
+                directory_id, file_name, content_hash, file_id,
+                ",".join(str(log_id) for log_id in log_ids)))
+
+    def set_file_log_infos(
+            self, directory_id: int, file_name: str, logs: List[LogInfo],
+            content_hash: str) -> List[int]:
+        """
+        Saves the log messages of a converted source file in one
+        transaction, along with a new file row (unless the file already
+        has one in this session) and its source manifest.
+
+        :param directory_id:
+        :param file_name:
+        :param logs: log level, line number and original of each log message
+        :param content_hash: Hash of the content of the source file
+        :returns: ID for each log message
+        """
+        assert self._db is not None
+        key = (directory_id, file_name)
+        file_id = None if self._file_ids is None \
+            else self._file_ids.get(key)
+        with self._db:
+            if file_id is None:
+                file_id = self._new_file_id(directory_id, file_name)
+            log_ids = self._save_log_infos(logs, file_id)
+            self._db.execute(_SET_SOURCE_MANIFEST, (
+                directory_id, file_name, content_hash, file_id,
+                ",".join(str(log_id) for log_id in log_ids)))
+        if self._file_ids is not None:
+            self._file_ids[key] = file_id
+        return log_ids
+
     def get_log_info(self, log_id: str) -> Optional[Tuple[int, str, str, str]]:
         """
         Gets the data needed to replace a short log back to the original.
@@ -250,6 +827,63 @@ class LogSqlLiteDatabase(AbstractContextManager):
                         row["original"])
         return None
 
+    def get_all_log_info(self) -> List[Tuple[int, int, str, str, str]]:
+        """
+        Gets the data needed to replace every short log back to the original.
+
+        :returns: log ID, log level, file name, line number and the original
+            text of every log message; the line number as
+            :py:meth:`get_log_info`
+        """
+        assert self._db is not None
+        with self._db:
+            return self.log_info_rows(self._db.execute(
+                """
+                SELECT log_id, log_level, file_name, line_num, original,
+                    last_build
+                FROM replacer_view
+                """))
+
+    def get_log_infos(self, log_ids: Sequence[int]
+                      ) -> List[Tuple[int, int, str, str, str]]:
+        """
+        Gets the data needed to replace a batch of short logs.
+
+        IDs not in the database are ignored.
+
+        :param log_ids: The IDs of the log messages wanted
+        :returns: As :py:meth:`get_all_log_info` but only for the given IDs
+        """
+        assert self._db is not None
+        log_ids = list(set(log_ids))
+        infos: List[Tuple[int, int, str, str, str]] = []
+        with self._db:
+            for placeholders, chunk in parameter_chunks(log_ids):
+                infos.extend(self.log_info_rows(self._db.execute(
+                    f"""
+                    SELECT log_id, log_level, file_name, line_num, original,
+                        last_build
+                    FROM replacer_view
+                    WHERE log_id IN ({placeholders})
+                    """, chunk)))
+        return infos
+
+    @staticmethod
+    def log_info_rows(cursor: sqlite3.Cursor
+                      ) -> List[Tuple[int, int, str, str, str]]:
+        """
+        Gets the log infos from a query of log ID, log level, file name,
+        line number, original and last build.
+
+        :param cursor: The query, with rows that can be read by name
+        :returns: As :py:meth:`get_all_log_info`
+        """
+        return [
+            (row["log_id"], row["log_level"], row["file_name"],
+             str(row["line_num"]) + ("" if row["last_build"] else "*"),
+             row["original"])
+            for row in cursor]
+
     def check_original(self, original: str) -> None:
         """
         Checks that an original log line has been added to the database.
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Iterable, List
+
+from .log_lookup import LogLookup, lookup_filename
+from .log_sqllite_database import LogSqlLiteDatabase
+
+
+def prune(database_file: str, keep_log_ids: Iterable[int] = ()) -> int:
+    """
+    Deletes the log messages no longer in any source from a logs database
+    and compacts it. If the database has a lookup file that is rewritten.
+
+    :param database_file: Path to the logs database
+    :param keep_log_ids: IDs of log messages to keep anyway
+    :return: The number of bytes reclaimed
+    """
+    lookup_file = lookup_filename(database_file)
+    with LogSqlLiteDatabase(database_file) as log_database:
+        reclaimed = log_database.prune(keep_log_ids)
+        infos = log_database.get_all_log_info()
+    if os.path.exists(lookup_file):
+        # Written after the database is closed so it is newer
+        LogLookup.write(lookup_file, infos)
+    return reclaimed
+
+
+def _read_ids(paths: Iterable[str]) -> List[int]:
+    """
+    Reads log IDs separated by white space or commas from files.
+    """
+    log_ids: List[int] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            log_ids.extend(
+                int(log_id) for log_id in f.read().replace(",", " ").split())
+    return log_ids
+
+
+def main() -> None:
+    """
+    Prunes the logs databases given on the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Deletes the log messages no longer in any source from "
+        "logs databases and compacts them")
+    parser.add_argument(
+        "databases", nargs="+", help="The logs databases to prune")
+    parser.add_argument(
+        "-k", "--keep", type=int, nargs="+", default=[],
+        help="IDs of log messages to keep, such as those used by binaries "
+        "still in use")
+    parser.add_argument(
+        "--keep-file", nargs="+", default=[],
+        help="Files of IDs of log messages to keep")
+    args = parser.parse_args()
+    keep = args.keep + _read_ids(args.keep_file)
+    for database_file in args.databases:
+        reclaimed = prune(database_file, keep)
+        print(f"Reclaimed {reclaimed} bytes from {database_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,11 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 import logging
+import multiprocessing
 import struct
 import sys
+import threading
 from types import TracebackType
-from typing import Dict, Optional, Type, Tuple
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Type, Tuple,
+    Union)
+
+import numpy
 
 from typing_extensions import Literal, Self
 
@@ -25,7 +36,8 @@ from spinn_utilities.log import FormatAdapter
 
 from .file_converter import FORMAT_EXP
 from .file_converter import TOKEN
-from .log_sqllite_database import LogSqlLiteDatabase
+from .log_database_registry import AttachedDatabase, LogDatabaseRegistry
+from .log_lookup import LogLookup
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -34,6 +46,227 @@ LEVELS = {10: "[DEBUG]",
           30: "[WARN]",
           40: "[ERROR]"}
 
+_INT_FMT = struct.Struct("!I")
+_FLT_FMT = struct.Struct("!f")
+_DBL_FMT = struct.Struct("!d")
+
+
+def _hex_to_float(hex_str: str) -> float:
+    return _FLT_FMT.unpack(_INT_FMT.pack(int(hex_str, 16)))[0]
+
+
+def _hexes_to_double(upper: str, lower: str) -> float:
+    return _DBL_FMT.unpack(
+        _INT_FMT.pack(int(upper, 16)) + _INT_FMT.pack(int(lower, 16)))[0]
+
+
+class DecodePlan(object):
+    """
+    A precompiled way of expanding the short form of one log message.
+
+    The original message is split once into the literal text between the
+    format specifiers and the kind of argument each specifier takes,
+    so expanding a message is just a join.
+
+    A message whose escapes can not be read, such as one with characters
+    that are not latin-1, can not be expanded, so stays in its short form.
+    """
+
+    __slots__ = [
+        "_file_name", "_kinds", "_line_num", "_literals", "_log_level",
+        "_matches", "_prefix", "_specs", "_unescaped"]
+
+    def __init__(self, log_level: int, file_name: str, line_num: str,
+                 original: str):
+        """
+        :param log_level: The level of the log message
+        :param file_name: The name of the file the log message is in
+        :param line_num: The line number of the log message
+        :param original: The original text of the log message
+        """
+        self._log_level = log_level
+        self._file_name = file_name
+        self._line_num = line_num
+        self._prefix = f"{LEVELS[log_level]} ({file_name}: {line_num}): "
+        self._literals: Optional[Tuple[str, ...]] = None
+        self._kinds = ""
+        self._specs: Optional[Tuple[str, ...]] = None
+        self._matches: List[str] = []
+        self._unescaped: Optional[str] = None
+        try:
+            self._unescaped = original.encode("latin-1").decode(
+                "unicode_escape")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            # Only this message can not be expanded
+            return
+        # Remove any blanks due to double spacing
+        self._matches = [
+            x for x in FORMAT_EXP.findall(original) if x != ""]
+        literals: List[str] = []
+        kinds = ""
+        position = 0
+        simple = True
+        for match in self._matches:
+            index = self._unescaped.find(match, position)
+            if index < 0 or "%" in self._unescaped[position:index]:
+                # Earlier text could be replaced so replace in order instead
+                simple = False
+                break
+            literals.append(self._unescaped[position:index])
+            if match.endswith("f"):
+                kinds += "f"
+            elif match.endswith("F"):
+                kinds += "F"
+            else:
+                kinds += "s"
+            position = index + len(match)
+        literals.append(self._unescaped[position:])
+        self._literals = tuple(literals) if simple else None
+        self._kinds = kinds
+        self._specs = tuple(self._matches) if simple else None
+
+    @property
+    def log_level(self) -> int:
+        """
+        The level of the log message.
+        """
+        return self._log_level
+
+    @property
+    def file_name(self) -> str:
+        """
+        The name of the file the log message is in.
+        """
+        return self._file_name
+
+    @property
+    def line_num(self) -> str:
+        """
+        The line number, with a ``*`` if not from the last build.
+        """
+        return self._line_num
+
+    @property
+    def prefix(self) -> str:
+        """
+        The level, file name and line number as put before the message.
+        """
+        return self._prefix
+
+    def replace(self, parts: Sequence[str]) -> Optional[str]:
+        """
+        Expands the message using the arguments from the short message.
+
+        :param parts: The short message split by the token;
+            the first part (the ID) is ignored
+        :return: The expanded message, or None if the arguments do not fit
+            or the message can not be expanded
+        """
+        if len(parts) == 1 or self._unescaped is None:
+            return self._unescaped
+        literals = self._literals
+        if literals is None:
+            return self._replace_in_order(parts)
+        result = [literals[0]]
+        # Start at 0 so first i+1 puts you at 1 as part 0 is the short
+        i = 0
+        try:
+            for literal, kind in enumerate(self._kinds, 1):
+                i += 1
+                if kind == "f":
+                    result.append(str(_hex_to_float(parts[i])))
+                elif kind == "F":
+                    result.append(str(_hexes_to_double(
+                        parts[i], parts[i+1])))
+                    i += 1
+                elif "%" in parts[i]:
+                    # The value could itself be replaced so do it in order
+                    return self._replace_in_order(parts)
+                else:
+                    result.append(parts[i])
+                result.append(literals[literal])
+        except Exception:  # pylint: disable=broad-except
+            # If anything goes wrong don't do replace
+            return None
+        return "".join(result)
+
+    def replace_words(self, words: Sequence[int], signed: Sequence[int],
+                      floats: Sequence[float], doubles: Sequence[float],
+                      start: int, stop: int) -> Optional[str]:
+        """
+        Expands the message using arguments passed as binary words.
+
+        The words of a whole batch of messages are converted up front, so
+        this only picks out and formats the ones for this message.
+        Integer arguments are formatted as the format specifier says,
+        floats and doubles as :py:meth:`replace` would.
+
+        :param words: The words of the batch as unsigned ints
+        :param signed: The words of the batch as signed ints
+        :param floats: The words of the batch as floats
+        :param doubles: Each word and the one after it as a double
+        :param start: Index of the first word of this message
+        :param stop: Index after the last word of this message
+        :return: The expanded message, or None if the arguments do not fit
+            or can not be formatted from binary words
+        """
+        literals = self._literals
+        if literals is None or self._specs is None:
+            return None
+        result = [literals[0]]
+        i = start
+        try:
+            for literal, (kind, spec) in enumerate(
+                    zip(self._kinds, self._specs), 1):
+                conversion = spec[-1]
+                if kind == "f":
+                    result.append(str(floats[i]))
+                elif kind == "F":
+                    result.append(str(doubles[i]))
+                    i += 1
+                elif conversion in "di":
+                    result.append(spec % signed[i])
+                elif conversion in "cux":
+                    result.append(spec % words[i])
+                else:
+                    # Strings and fixed point values not supported
+                    return None
+                i += 1
+                result.append(literals[literal])
+        except Exception:  # pylint: disable=broad-except
+            # If anything goes wrong don't do replace
+            return None
+        if i != stop:
+            return None
+        return "".join(result)
+
+    def _replace_in_order(self, parts: Sequence[str]) -> Optional[str]:
+        """
+        Replaces each format specifier in turn in the whole text.
+
+        Used where the text can not be safely split in advance.
+        """
+        replaced = self._unescaped
+        if replaced is None:
+            return None
+        # Start at 0 so first i+1 puts you at 1 as part 0 is the short
+        i = 0
+        try:
+            for match in self._matches:
+                i += 1
+                if match.endswith("f"):
+                    replacement = str(_hex_to_float(parts[i]))
+                elif match.endswith("F"):
+                    replacement = str(_hexes_to_double(parts[i], parts[i+1]))
+                    i += 1
+                else:
+                    replacement = parts[i]
+                replaced = replaced.replace(match, replacement, 1)
+        except Exception:  # pylint: disable=broad-except
+            # If anything goes wrong don't do replace
+            return None
+        return replaced
+
 
 class Replacer(object):
     """
@@ -41,12 +274,52 @@ class Replacer(object):
     """
 
     __slots__ = [
-        # the database holding the data to store
-        "_dbs",
+        # recently used plans, or None if not found, by key and ID
+        "_memo",
+        # number of plans found in the memo
+        "_memo_hits",
+        # number of plans not in the memo so looked up
+        "_memo_misses",
+        # guards the memo and its counts
+        "_memo_lock",
+        # most plans kept in the memo
+        "_memo_size",
+        # True if all the messages are read from each database at once
+        "_preload",
+        # opens the databases of each key
+        "_registry",
+        # decode tables by database key when preloaded
+        "_tables"
     ]
 
-    def __init__(self) -> None:
-        self._dbs: Dict[str, LogSqlLiteDatabase] = dict()
+    def __init__(self, preload: bool = False,
+                 registry: Optional[LogDatabaseRegistry] = None,
+                 memo_size: int = 4096) -> None:
+        """
+        :param preload:
+            If True each database is read once into an in memory table of
+            :py:class:`DecodePlan` objects the first time it is needed,
+            otherwise the database is queried for each message.
+        :param registry:
+            Where to find the database of each key. By default the
+            databases registered with
+            :py:class:`~spinn_utilities.data.UtilsDataView`, which may be
+            shared by passing the same registry to several replacers.
+        :param memo_size:
+            Unless preloaded, the plans of this many recently used IDs, and
+            of IDs not found, are kept so they are only looked up once.
+            0 to look up every message.
+        """
+        self._memo: OrderedDict[
+            Tuple[str, str], Optional[DecodePlan]] = OrderedDict()
+        self._memo_hits = 0
+        self._memo_misses = 0
+        self._memo_lock = threading.Lock()
+        self._memo_size = memo_size
+        self._preload = preload
+        self._registry = LogDatabaseRegistry() if registry is None \
+            else registry
+        self._tables: Dict[str, Optional[Dict[int, DecodePlan]]] = dict()
 
     def __enter__(self) -> Self:
         return self
@@ -55,19 +328,95 @@ class Replacer(object):
                  exc_tb: TracebackType) -> Literal[False]:
         return False
 
-    _INT_FMT = struct.Struct("!I")
-    _FLT_FMT = struct.Struct("!f")
-    _DBL_FMT = struct.Struct("!d")
+    def _db(self, database_key: str
+            ) -> Optional[Union[LogLookup, AttachedDatabase]]:
+        return self._registry.database(database_key)
 
-    def _db(self, database_key: str) -> Optional[LogSqlLiteDatabase]:
-        if database_key in self._dbs:
-            return self._dbs[database_key]
-        database_file = UtilsDataView.get_log_database_path(database_key)
-        if database_file is None:
-            return None
-        db = LogSqlLiteDatabase(database_file)
-        self._dbs[database_key] = db
-        return db
+    def _table(self, database_key: str) -> Optional[Dict[int, DecodePlan]]:
+        if database_key in self._tables:
+            return self._tables[database_key]
+        db = self._db(database_key)
+        table = None
+        if db is not None:
+            table = {
+                log_id: DecodePlan(log_level, file_name, line_num, original)
+                for (log_id, log_level, file_name, line_num, original)
+                in db.get_all_log_info()}
+        self._tables[database_key] = table
+        return table
+
+    def _plan(self, database_key: str, log_id: str) -> Optional[DecodePlan]:
+        """
+        Gets the plan for expanding a message.
+
+        :param database_key: The key of the database the ID is in
+        :param log_id: The int ID as a String
+        :return: The plan or None if the message is not known
+        """
+        if self._preload:
+            table = self._table(database_key)
+            if table is None:
+                return None
+            try:
+                return table.get(int(log_id))
+            except ValueError:
+                return None
+        memo_key = (database_key, log_id)
+        found, plan = self._recall(memo_key)
+        if found:
+            return plan
+        db = self._db(database_key)
+        data = None if db is None else db.get_log_info(log_id)
+        plan = None if data is None else DecodePlan(*data)
+        self._remember(memo_key, plan)
+        return plan
+
+    def _recall(self, memo_key: Tuple[str, str]
+                ) -> Tuple[bool, Optional[DecodePlan]]:
+        """
+        Gets a plan, or None if not found, from the memo, counting the hit
+        or miss.
+
+        :return: True and the plan if in the memo, otherwise False and None
+        """
+        with self._memo_lock:
+            if memo_key not in self._memo:
+                self._memo_misses += 1
+                return False, None
+            self._memo_hits += 1
+            self._memo.move_to_end(memo_key)
+            return True, self._memo[memo_key]
+
+    def _remember(self, memo_key: Tuple[str, str],
+                  plan: Optional[DecodePlan]) -> None:
+        """
+        Adds a plan, or None if not found, to the memo, forgetting the
+        least recently used if it is full.
+        """
+        if self._memo_size <= 0:
+            return
+        with self._memo_lock:
+            self._memo[memo_key] = plan
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+    @property
+    def memo_statistics(self) -> Dict[str, int]:
+        """
+        The number of hits, misses and plans in the memo of plans.
+        """
+        with self._memo_lock:
+            return {"hits": self._memo_hits, "misses": self._memo_misses,
+                    "size": len(self._memo)}
+
+    def clear_memo(self) -> None:
+        """
+        Forgets the remembered plans, such as after a database has changed.
+        """
+        with self._memo_lock:
+            self._memo.clear()
+            self._memo_hits = 0
+            self._memo_misses = 0
 
     def _replace(self, short: str) -> Optional[Tuple[int, str, str, str]]:
         """
@@ -76,49 +425,88 @@ class Replacer(object):
         :param short: The short message to apply the transform to.
         :return: The expanded message.
         """
+        plan, replaced = self._plan_and_replace(short)
+        if plan is None or replaced is None:
+            return None
+        return (plan.log_level, plan.file_name, plan.line_num, replaced)
+
+    @staticmethod
+    def _split(short: str) -> Optional[Tuple[str, str, List[str]]]:
+        """
+        Splits a short message into its database key, ID and parts.
+        """
         parts = short.split(TOKEN)
         log_st = parts[0]
         if len(log_st) == 0:
             return None
         if log_st[0].isdigit():
-            log_id = log_st
-            database_key = ""
-        elif log_st[1:].isdigit():
-            log_id = log_st[1:]
-            database_key = log_st[0]
-        else:
-            return None
-        db = self._db(database_key)
-        if db is None:
-            return None
-        data = db.get_log_info(log_id)
-        if data is None:
-            return None
-        (log_level, file_name, line_num, original) = data
-
-        replaced = original.encode("latin-1").decode("unicode_escape")
-        if len(parts) > 1:
-            matches = FORMAT_EXP.findall(original)
-            # Remove any blanks due to double spacing
-            matches = [x for x in matches if x != ""]
-            # Start at 0 so first i+1 puts you at 1 as part 0 is the short
-            i = 0
-            try:
-                for match in matches:
-                    i += 1
-                    if match.endswith("f"):
-                        replacement = str(self._hex_to_float(parts[i]))
-                    elif match.endswith("F"):
-                        replacement = str(self._hexes_to_double(
-                            parts[i], parts[i+1]))
-                        i += 1
-                    else:
-                        replacement = parts[i]
-                    replaced = replaced.replace(match, replacement, 1)
-            except Exception:  # pylint: disable=broad-except
-                # If anything goes wrong don't do replace
-                return None
-        return (log_level, file_name, line_num, replaced)
+            return "", log_st, parts
+        if log_st[1:].isdigit():
+            return log_st[0], log_st[1:], parts
+        return None
+
+    def _plan_and_replace(
+            self, short: str,
+            plans: Optional[Dict[Tuple[str, str], DecodePlan]] = None
+            ) -> Tuple[Optional[DecodePlan], Optional[str]]:
+        split = self._split(short)
+        if split is None:
+            return None, None
+        database_key, log_id, parts = split
+        plan = self._find_plan(database_key, log_id, plans)
+        if plan is None:
+            return None, None
+        return plan, plan.replace(parts)
+
+    def _find_plan(
+            self, database_key: str, log_id: str,
+            plans: Optional[Dict[Tuple[str, str], DecodePlan]]
+            ) -> Optional[DecodePlan]:
+        if plans is None:
+            return self._plan(database_key, log_id)
+        return plans.get((database_key, log_id))
+
+    def _plans(self, shorts: Iterable[str]
+               ) -> Dict[Tuple[str, str], DecodePlan]:
+        """
+        Gets the plans for a batch of short messages with one query
+        per database for those not in the memo.
+        """
+        plans: Dict[Tuple[str, str], DecodePlan] = dict()
+        wanted: Dict[str, Set[str]] = defaultdict(set)
+        # Including those not found, so each is only counted once
+        seen: Set[Tuple[str, str]] = set()
+        for short in shorts:
+            split = self._split(short)
+            if split is None:
+                continue
+            memo_key = split[:2]
+            if memo_key in seen:
+                # As replace would find it in the memo by now
+                with self._memo_lock:
+                    self._memo_hits += 1
+                continue
+            seen.add(memo_key)
+            found, plan = self._recall(memo_key)
+            if not found:
+                wanted[split[0]].add(split[1])
+            elif plan is not None:
+                plans[memo_key] = plan
+        for database_key, log_ids in wanted.items():
+            db = self._db(database_key)
+            by_id = dict() if db is None else {
+                info[0]: info for info in db.get_log_infos(
+                    [int(log_id) for log_id in log_ids
+                     if log_id.isdecimal()])}
+            for log_id in log_ids:
+                plan = None
+                if log_id.isdecimal() and int(log_id) in by_id:
+                    (_, log_level, file_name, line_num, original) = \
+                        by_id[int(log_id)]
+                    plan = DecodePlan(log_level, file_name, line_num, original)
+                    plans[(database_key, log_id)] = plan
+                self._remember((database_key, log_id), plan)
+        return plans
 
     def replace(self, short: str) -> str:
         """
@@ -127,24 +515,211 @@ class Replacer(object):
         :param short: The short string as read of the machine
         :returns: The message as it would if short codes where not used.
         """
-        data = self._replace(short)
-        if data is None:
+        plan, replaced = self._plan_and_replace(short)
+        if plan is None or replaced is None:
             return short
-        (log_level, file_name, line_num, replaced) = data
-        return f"{LEVELS[log_level]} ({file_name}: {line_num}): {replaced}"
+        return plan.prefix + replaced
+
+    def replace_lines(self, lines: Iterable[str],
+                      chunk_size: int = 1000) -> Iterator[str]:
+        """
+        Apply the replacements to each line of a stream of short messages.
+
+        The lines are read lazily in chunks so memory use does not grow
+        with the length of the stream.
+        Unless preloaded the messages of each chunk are looked up
+        with one query per database.
+        A line that can not be expanded is kept as it is,
+        without affecting the rest of its chunk.
+        Line endings are kept.
+
+        :param lines: The lines as read of the machine
+        :param chunk_size: The number of lines to look up at once
+        :returns: The lines as they would be if short codes where not used
+        """
+        line_iter = iter(lines)
+        for chunk in iter(lambda: list(islice(line_iter, chunk_size)), []):
+            shorts = [line.rstrip("\r\n") for line in chunk]
+            plans = None if self._preload else self._plans(shorts)
+            for line, short in zip(chunk, shorts):
+                plan, replaced = self._plan_and_replace(short, plans)
+                if plan is None or replaced is None:
+                    yield line
+                else:
+                    yield plan.prefix + replaced + line[len(short):]
+
+    def replace_file(self, src: str, dest: str) -> None:
+        """
+        Apply the replacements to every line of a file of short messages.
+
+        :param src: Path of the file to read
+        :param dest: Path of the file to write
+        """
+        with open(src, encoding="utf-8", newline="") as src_f, \
+                open(dest, "w", encoding="utf-8", newline="") as dest_f:
+            dest_f.writelines(self.replace_lines(src_f))
+
+    def replace_binary(
+            self, messages: Iterable[Tuple[str, Union[bytes, memoryview]]],
+            byteorder: Literal["little", "big"] = "little") -> List[str]:
+        """
+        Apply the replacements to a batch of short messages whose arguments
+        are still the raw 32-bit words read from the machine.
+
+        The words of the whole batch are converted to ints, floats and
+        doubles with one NumPy view each rather than one at a time.
+        A double is passed as two words, the upper one first.
+
+        :param messages: For each message the short form of its ID
+            (such as ``R17``) and the bytes of its argument words
+        :param byteorder: The byte order of the words
+        :returns: The message as it would if short codes where not used,
+            or if that is not possible the short message with each word
+            as hex as read of the machine
+        """
+        messages = list(messages)
+        endian = "<" if byteorder == "little" else ">"
+        data = [bytes(args) for _, args in messages]
+        words_array = numpy.frombuffer(
+            b"".join(args for args in data if len(args) % 4 == 0),
+            dtype=numpy.dtype(endian + "u4"))
+        words: List[int] = words_array.tolist()
+        signed: List[int] = words_array.view(endian + "i4").tolist()
+        floats: List[float] = words_array.view(endian + "f4").tolist()
+        doubles: List[float] = (
+            (words_array[:-1].astype(numpy.uint64) << numpy.uint64(32)) |
+            words_array[1:].astype(numpy.uint64)).view(numpy.float64).tolist()
+
+        plans = None if self._preload else self._plans(
+            short for short, _ in messages)
+        results = []
+        start = 0
+        for (short, _), raw in zip(messages, data):
+            if len(raw) % 4:
+                results.append(short + TOKEN + raw.hex())
+                continue
+            stop = start + len(raw) // 4
+            split = self._split(short)
+            plan = None if split is None else self._find_plan(
+                split[0], split[1], plans)
+            replaced = None if plan is None else plan.replace_words(
+                words, signed, floats, doubles, start, stop)
+            if plan is None or replaced is None:
+                results.append(short + "".join(
+                    TOKEN + f"{word:x}" for word in words[start:stop]))
+            else:
+                results.append(plan.prefix + replaced)
+            start = stop
+        return results
+
+    def replace_iobufs(self, iobufs: Sequence[Sequence[str]],
+                       workers: int = 1) -> List[List[str]]:
+        """
+        Apply the replacements to the lines of several IOBUFs, such as one
+        per core, sharing the work across a pool of processes.
+
+        The decode table of every database used is built once here and
+        shared with forked worker processes, so no worker reads a database.
+        Where forking is not available the IOBUFs are done one at a time.
+
+        :param iobufs: The lines of each IOBUF as read of the machine
+        :param workers: The maximum number of processes to use
+        :returns: The replaced lines of each IOBUF in the same order
+        """
+        if workers <= 1 or len(iobufs) <= 1 or \
+                "fork" not in multiprocessing.get_all_start_methods():
+            return [list(self.replace_lines(lines)) for lines in iobufs]
+        keys = set()
+        for lines in iobufs:
+            for line in lines:
+                split = self._split(line.rstrip("\r\n"))
+                if split is not None:
+                    keys.add(split[0])
+        shared = Replacer(preload=True)
+        # pylint: disable=protected-access
+        shared._tables = {key: self._table(key) for key in keys}
+        # With fork the initargs are inherited rather than pickled
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(shared, iobufs)) as pool:
+            return list(pool.map(
+                _replace_iobuf, range(len(iobufs)),
+                chunksize=max(1, len(iobufs) // (workers * 4))))
 
     def _hex_to_float(self, hex_str: str) -> float:
-        return self._FLT_FMT.unpack(
-            self._INT_FMT.pack(int(hex_str, 16)))[0]
+        return _hex_to_float(hex_str)
 
     def _hexes_to_double(self, upper: str, lower: str) -> float:
-        return self._DBL_FMT.unpack(
-            self._INT_FMT.pack(int(upper, 16)) +
-            self._INT_FMT.pack(int(lower, 16)))[0]
+        return _hexes_to_double(upper, lower)
+
+
+#: The replacer and IOBUFs of a worker process forked by
+#: :py:meth:`Replacer.replace_iobufs`, set by :py:func:`_init_worker`
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
+        replacer: Replacer, iobufs: Sequence[Sequence[str]]) -> None:
+    """
+    Stores the work shared with a forked worker process.
+
+    :param replacer: The replacer with the decode tables already built
+    :param iobufs: The lines of each IOBUF
+    """
+    _WORKER_STATE["replacer"] = replacer
+    _WORKER_STATE["iobufs"] = iobufs
+
+
+def _replace_iobuf(index: int) -> List[str]:
+    """
+    Replaces the lines of one IOBUF in a forked worker process.
+
+    :param index: Which of the shared IOBUFs to replace
+    :returns: The replaced lines
+    """
+    replacer: Replacer = _WORKER_STATE["replacer"]
+    iobufs: Sequence[Sequence[str]] = _WORKER_STATE["iobufs"]
+    return list(replacer.replace_lines(iobufs[index]))
+
+
+def main() -> None:
+    """
+    Replaces short messages given on the command line, in files or from
+    standard input.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replaces short log messages with the originals")
+    parser.add_argument(
+        "message", nargs="?",
+        help="A single short message; any character that is not a letter "
+        "or digit is taken as a separator. If omitted the lines of the "
+        "input files are replaced")
+    parser.add_argument(
+        "-i", "--input", nargs="+", default=["-"],
+        help="Files of short messages, one per line; - for standard input")
+    parser.add_argument(
+        "-o", "--output", help="File to write to; default standard output")
+    parser.add_argument(
+        "-p", "--path", action="append", default=[],
+        help="Directory to search for logs databases")
+    args = parser.parse_args()
+    for path in args.path:
+        UtilsDataView.register_binary_search_path(path)
+    with Replacer(preload=args.message is None) as replacer:
+        if args.message is not None:
+            line = "".join(
+                [c if c.isalnum() else TOKEN for c in args.message])
+            print(replacer.replace(line))
+            return
+        with (open(args.output, "w", encoding="utf-8")
+              if args.output else nullcontext(sys.stdout)) as dest:
+            for src in args.input:
+                with (nullcontext(sys.stdin) if src == "-"
+                      else open(src, encoding="utf-8")) as lines:
+                    dest.writelines(replacer.replace_lines(lines))
 
 
 if __name__ == '__main__':
-    encoded = sys.argv[1]
-    LINE = "".join([c if c.isalnum() else TOKEN for c in encoded])
-    with Replacer() as replacer:
-        print(replacer.replace(LINE))
+    main()
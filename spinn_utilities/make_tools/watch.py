@@ -0,0 +1,195 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from spinn_utilities.abstract_context_manager import AbstractContextManager
+from spinn_utilities.exceptions import UnexpectedCException
+from .conversion_options import conversion_parser, find_files
+from .file_converter import FileConverter
+from .log_lookup import LogLookup, lookup_filename
+from .log_sqllite_database import LogSqlLiteDatabase
+
+#: The modification time in nanoseconds and size of a file
+_Stat = Tuple[int, int]
+
+
+class SourceWatcher(AbstractContextManager):
+    """
+    Keeps the converted copy of a source directory up to date, converting
+    only the files that change.
+
+    Changes are found by comparing the modification times and sizes of
+    the files and directories with the previous poll, so no file watching
+    service is needed.
+    The tree is only walked again when a directory changes, as when a file
+    is added or removed.
+    The database stays open, with its directory IDs cached, between polls.
+    """
+
+    __slots__ = [
+        # the converter which holds the open database
+        "_converter",
+        # full path to the logs database
+        "_database_file",
+        # full destination directory
+        "_dest_path",
+        # modification time of each source directory when last walked
+        "_directories",
+        # source directory, destination directory and name of each file
+        "_files",
+        # the open logs database
+        "_log_database",
+        # the stat of each source file when last polled
+        "_stats",
+        # full source directory
+        "_src_path",
+    ]
+
+    def __init__(self, src: str, dest: str, database_dir: str,
+                 database_key: str, hashed_ids: bool = False) -> None:
+        """
+        :param src: Full source directory
+        :param dest: Full destination directory
+        :param database_dir:
+            Full path to directory to place database file in.
+        :param database_key: database key for this conversion
+        :param hashed_ids: As for :py:func:`convert`
+        """
+        self._src_path = os.path.abspath(src)
+        if not os.path.exists(self._src_path):
+            raise FileNotFoundError(
+                f"Unable to locate source directory {self._src_path}")
+        self._dest_path = os.path.abspath(dest)
+        self._database_file = LogSqlLiteDatabase.filename_by_key(
+            database_dir, database_key)
+        self._log_database = LogSqlLiteDatabase(
+            self._database_file, hashed_ids=hashed_ids)
+        self._converter = FileConverter(self._log_database, database_key)
+        self._directories: Dict[str, int] = dict()
+        self._files: List[Tuple[str, str, str]] = []
+        self._stats: Dict[str, _Stat] = dict()
+
+    @property
+    def database_file(self) -> str:
+        """
+        Full path to the logs database.
+        """
+        return self._database_file
+
+    def close(self) -> None:
+        self._log_database.close()
+
+    def _directories_changed(self) -> bool:
+        for directory, mtime in self._directories.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return not self._directories
+
+    def _changed_files(self) -> List[Tuple[str, str, str]]:
+        """
+        Finds the files added or changed since the last poll.
+        """
+        if self._directories_changed():
+            self._directories = dict()
+            self._files = find_files(
+                self._src_path, self._dest_path, self._directories)
+        changed = []
+        stats = dict()
+        for src_dir, dest_dir, file_name in self._files:
+            src = os.path.join(src_dir, file_name)
+            try:
+                stat = os.stat(src)
+            except OSError:
+                # Removed since the walk so found by the next one
+                continue
+            stats[src] = (stat.st_mtime_ns, stat.st_size)
+            if self._stats.get(src) != stats[src]:
+                changed.append((src_dir, dest_dir, file_name))
+        self._stats = stats
+        return changed
+
+    def poll(self) -> List[str]:
+        """
+        Converts the files added or changed since the last poll.
+
+        The first poll converts whatever :py:func:`convert` would.
+        A file that can not be converted is reported and tried again when
+        it next changes.
+
+        :returns: Full path of each source file converted
+        """
+        converted = []
+        self._log_database.start_session(self._src_path)
+        for src_dir, dest_dir, file_name in self._changed_files():
+            try:
+                if not self._converter.needs_convert(
+                        src_dir, dest_dir, file_name):
+                    continue
+                text, logs = self._converter.parse(
+                    src_dir, dest_dir, file_name)
+            except (UnexpectedCException, UnicodeDecodeError) as ex:
+                print(ex)
+                continue
+            self._converter.save(src_dir, dest_dir, file_name, text, logs)
+            converted.append(os.path.join(src_dir, file_name))
+        self._log_database.end_session()
+        if converted:
+            self._log_database.checkpoint()
+            # Written after the database is changed so it is newer
+            LogLookup.write(lookup_filename(self._database_file),
+                            self._log_database.get_all_log_info())
+        return converted
+
+    def run(self, interval: float = 0.5,
+            max_polls: Optional[int] = None) -> None:
+        """
+        Polls until interrupted, printing what was converted.
+
+        :param interval: Seconds between the end of one poll and the next
+        :param max_polls: Stop after this many polls; None for never
+        """
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                start = time.perf_counter()
+                converted = self.poll()
+                if converted:
+                    print(f"Converted {len(converted)} files in "
+                          f"{time.perf_counter() - start:.3f}s")
+                    for src in converted:
+                        print(f"    {src}")
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    _parser = conversion_parser(
+        "Keeps converting the log messages in C code to short logs as the "
+        "code changes")
+    _parser.add_argument(
+        "-i", "--interval", type=float, default=0.5,
+        help="Seconds between checks for changes (default 0.5)")
+    _args = _parser.parse_args()
+    with SourceWatcher(_args.src, _args.dest, _args.database_dir,
+                       _args.database_key, _args.hashed_ids) as _watcher:
+        _watcher.run(_args.interval)
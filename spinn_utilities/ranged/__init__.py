@@ -22,12 +22,13 @@ from .abstract_dict import AbstractDict
 from .abstract_list import AbstractList, DualList, SingleList
 from .abstract_sized import AbstractSized
 from .abstract_view import AbstractView
+from .dual_array_list import DualArrayList
 from .multiple_values_exception import MultipleValuesException
 from .range_dictionary import RangeDictionary
 from .ranged_list import RangedList
 from .ranged_list_of_lists import RangedListOfList
 
 __all__ = [
-    "AbstractDict", "AbstractList", "DualList", "SingleList", "AbstractSized",
-    "AbstractView", "MultipleValuesException", "RangeDictionary",
-    "RangedList", "RangedListOfList"]
+    "AbstractDict", "AbstractList", "DualArrayList", "DualList", "SingleList",
+    "AbstractSized", "AbstractView", "MultipleValuesException",
+    "RangeDictionary", "RangedList", "RangedListOfList"]
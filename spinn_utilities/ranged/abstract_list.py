@@ -14,7 +14,7 @@
 from __future__ import annotations
 from numbers import Number
 from typing import (
-    Any, Callable, Generic, Iterator, Optional, Sequence, Tuple,
+    Any, Callable, ClassVar, Generic, Iterator, Optional, Sequence, Tuple,
     TypeVar, Union, cast)
 import numpy
 from numpy.typing import NDArray
@@ -23,6 +23,7 @@ from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.overrides import overrides
 from .abstract_sized import AbstractSized, Selector
 from .multiple_values_exception import MultipleValuesException
+from .value_index import ids_from_ranges
 #: :meta private:
 R = TypeVar("R")
 #: :meta private:
@@ -43,6 +44,11 @@ def _is_zero(value: Any) -> bool:
     return bool(numpy.isin(0, value))
 
 
+def _floor_divide(x: Any, y: Any) -> NDArray[numpy.integer]:
+    # Same int results as the floor division of two lists
+    return numpy.floor_divide(x, y).astype(int)
+
+
 def is_number(value: T) -> TypeGuard[float]:
     """
     Is the Value a simple integer or float?
@@ -89,9 +95,20 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         element-wise true division or true division by a single scalar
     `//`
         element-wise floor division or floor division by a single scalar
+
+    The other operand may also be a NumPy array with one value per element
+    (or one that broadcasts to that), in which case the operation is done
+    on whole ranges at a time with NumPy.
+    NumPy ufuncs such as ``numpy.exp(a_list)`` or ``array * a_list`` are
+    also supported.
     """
     __slots__ = ("_key", )
 
+    #: Makes the list combining a list with a NumPy array.
+    #: Set by :py:mod:`~spinn_utilities.ranged.dual_array_list`, which can
+    #: not be imported here as its list is an AbstractList.
+    array_list_type: ClassVar[Callable[..., AbstractList]]
+
     def __init__(self, size: int, key: Optional[str] = None) -> None:
         """
         :param size: Fixed length of the list
@@ -413,6 +430,17 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return start
         raise ValueError(f"{x} is not in list")
 
+    def ids_by_value(self, x: T) -> NDArray[numpy.integer]:
+        """
+        Finds the IDs of all the elements in the list with value ``x``.
+
+        :param x: The value to find.
+        :return: The IDs in order; empty if the value is not found
+        """
+        return ids_from_ranges(
+            (start, stop) for (start, stop, value) in self.iter_ranges()
+            if _eq(value, x))
+
     @abstractmethod
     def iter_ranges(self) -> Iterator[Tuple[int, int, T]]:
         """
@@ -505,7 +533,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         raise NotImplementedError
 
-    def __add__(self, other: Union[float, AbstractList[float]]
+    def __add__(self, other: Union[float, AbstractList[float], NDArray[Any]]
                 ) -> AbstractList[float]:
         """
         Support for ``new_list = list1 + list2``.
@@ -513,7 +541,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
+        :param other: another list, a NumPy array or a scalar
         :return: new list
         :raises TypeError:
         """
@@ -523,6 +551,8 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return x + y
 
             return DualList(left=self, right=other, operation=d_operation)
+        if isinstance(other, numpy.ndarray):
+            return self._with_array(other, numpy.add)
         if is_number(other):
 
             def s_operation(x: Any) -> float:
@@ -530,9 +560,9 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
 
             return SingleList(a_list=self, operation=s_operation)
         raise TypeError("__add__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
-    def __sub__(self, other: Union[float, AbstractList[float]]
+    def __sub__(self, other: Union[float, AbstractList[float], NDArray[Any]]
                 ) -> AbstractList[float]:
         """
         Support for ``new_list = list1 - list2``.
@@ -540,7 +570,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
+        :param other: another list, a NumPy array or a scalar
         :return: new list
         :raises TypeError:
         """
@@ -550,6 +580,8 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return x - y
 
             return DualList(left=self, right=other, operation=d_operation)
+        if isinstance(other, numpy.ndarray):
+            return self._with_array(other, numpy.subtract)
         if is_number(other):
 
             def s_operation(x: Any) -> float:
@@ -557,9 +589,9 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
 
             return SingleList(a_list=self, operation=s_operation)
         raise TypeError("__sub__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
-    def __mul__(self, other: Union[float, AbstractList[float]]
+    def __mul__(self, other: Union[float, AbstractList[float], NDArray[Any]]
                 ) -> AbstractList[float]:
         """
         Support for ``new_list = list1 * list2``.
@@ -567,7 +599,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
+        :param other: another list, a NumPy array or a scalar
         :return: new list
         :raises TypeError:
         """
@@ -577,6 +609,8 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return x * y
 
             return DualList(left=self, right=other, operation=d_operation)
+        if isinstance(other, numpy.ndarray):
+            return self._with_array(other, numpy.multiply)
         if is_number(other):
 
             def s_operation(x: Any) -> float:
@@ -584,10 +618,11 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
 
             return SingleList(a_list=self, operation=s_operation)
         raise TypeError("__mul__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
-    def __truediv__(self, other: Union[float, AbstractList[float]]
-                    ) -> AbstractList[float]:
+    def __truediv__(
+            self, other: Union[float, AbstractList[float], NDArray[Any]]
+            ) -> AbstractList[float]:
         """
         Support for ``new_list = list1 / list2``.
         Applies the division operator over this and other to create a
@@ -595,7 +630,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         The values of the new list are created on the fly so any changes to
         the original lists are reflected.
 
-        :param other: another list
+        :param other: another list, a NumPy array or a scalar
         :return: new list
         :raises TypeError:
         """
@@ -605,6 +640,10 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return x / y
 
             return DualList(left=self, right=other, operation=d_operation)
+        if isinstance(other, numpy.ndarray):
+            if _is_zero(other):
+                raise ZeroDivisionError()
+            return self._with_array(other, numpy.true_divide)
         if is_number(other):
             if _is_zero(other):
                 raise ZeroDivisionError()
@@ -614,15 +653,16 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
 
             return SingleList(a_list=self, operation=s_operation)
         raise TypeError("__truediv__ operation only supported for other "
-                        "RangedLists and numerical Values")
+                        "RangedLists, NumPy arrays and numerical Values")
 
-    def __floordiv__(self, other: Union[float, AbstractList[float]]
-                     ) -> AbstractList[int]:
+    def __floordiv__(
+            self, other: Union[float, AbstractList[float], NDArray[Any]]
+            ) -> AbstractList[int]:
         """
         Support for ``new_list = list1 // list2``.
         Applies the floor division operator over this and other.
 
-        :param other: another list
+        :param other: another list, a NumPy array or a scalar
         :return: new list
         :raises TypeError:
         """
@@ -632,6 +672,10 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return int(x // y)
 
             return DualList(left=self, right=other, operation=d_operation)
+        if isinstance(other, numpy.ndarray):
+            if _is_zero(other):
+                raise ZeroDivisionError()
+            return self._with_array(other, _floor_divide)
         if is_number(other):
             if _is_zero(other):
                 raise ZeroDivisionError()
@@ -642,9 +686,52 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
             return SingleList(a_list=self, operation=s_operation)
         raise TypeError(
             "__floordiv__ operation only supported for other "
-            "RangedLists and numerical Values"
+            "RangedLists, NumPy arrays and numerical Values"
         )
 
+    def __array_ufunc__(self, ufunc: numpy.ufunc, method: str,
+                        *inputs: Any, **kwargs: Any) -> Any:
+        """
+        Support for NumPy ufuncs such as ``numpy.exp(list)`` or
+        ``array * list``.
+        As with the operators, the values of the new list are created on the
+        fly.
+
+        :param ufunc: The ufunc to apply
+        :param method: How the ufunc is called; only ``__call__`` is handled
+        :param inputs: The operands, one of which is this list
+        :param kwargs: Extra ufunc arguments; none are supported
+        :return: new list, or NotImplemented if not supported
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if len(inputs) == 1:
+            return SingleList(a_list=self, operation=ufunc)
+        if len(inputs) != 2:
+            return NotImplemented
+        (left, right) = inputs
+        if isinstance(left, AbstractList) and isinstance(right, AbstractList):
+            return DualList(left=left, right=right, operation=ufunc)
+        reverse = left is not self
+        other = left if reverse else right
+        if isinstance(other, numpy.ndarray) or is_number(other):
+            return self._with_array(numpy.asarray(other), ufunc, reverse)
+        return NotImplemented
+
+    def _with_array(
+            self, array: NDArray[Any], operation: Callable[..., Any],
+            reverse: bool = False) -> AbstractList:
+        """
+        Makes a list which combines this one with a NumPy array.
+
+        :param array: The array of values, one per element of the list
+        :param operation: A vectorised function to combine them with
+        :param reverse: True if the array is the left operand
+        :return: new list
+        """
+        return AbstractList.array_list_type(
+            a_list=self, array=array, operation=operation, reverse=reverse)
+
     def apply_operation(self, operation: Callable[[T], U]) -> AbstractList[U]:
         """
         Applies a function on the list to create a new one.
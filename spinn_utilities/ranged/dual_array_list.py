@@ -0,0 +1,170 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import (
+    Any, Callable, Generic, Iterator, Optional, Sequence, Tuple)
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.abstract_base import AbstractBase
+from spinn_utilities.overrides import overrides
+from .abstract_list import AbstractList, IdsType, R, T, _eq
+from .multiple_values_exception import MultipleValuesException
+
+
+def _to_values(values: NDArray[Any]) -> Sequence[Any]:
+    # Python values for a vector, or the rows of anything bigger
+    if values.ndim == 1:
+        return values.tolist()
+    return list(values)
+
+
+class DualArrayList(AbstractList[R], Generic[T, R], metaclass=AbstractBase):
+    """
+    A list which combines another list with a NumPy array, element by
+    element, using a vectorised operation such as a NumPy ufunc.
+
+    The operation is applied to whole ranges of the other list at a time,
+    so it is never called per element.
+    """
+    __slots__ = [
+        "_a_list", "_array", "_operation", "_reverse"]
+
+    def __init__(self, a_list: AbstractList[T], array: NDArray[Any],
+                 operation: Callable[[Any, NDArray[Any]], NDArray[Any]],
+                 reverse: bool = False, key: Optional[str] = None):
+        """
+        :param a_list: The list to perform the operation on
+        :param array:
+            The array of values, one per element of the list.
+            Arrays of one value (or a 0-D array) are broadcast to all
+            elements.
+        :param operation:
+            A vectorised function which takes a value of the list and an
+            array of values, and returns an array of results
+        :param reverse:
+            True if the array is the left operand of the operation
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :raises ValueError: If the array is not the same size as the list
+        """
+        super().__init__(size=len(a_list), key=key)
+        if array.ndim == 0 or array.shape[0] == 1:
+            array = numpy.broadcast_to(
+                array, (self._size, ) + array.shape[1:])
+        elif array.shape[0] != self._size:
+            raise ValueError(
+                f"Array with {array.shape[0]} values can not be combined "
+                f"with a list of size {self._size}")
+        self._a_list = a_list
+        self._array = array
+        self._operation = operation
+        self._reverse = reverse
+
+    def _apply(self, value: Any, values: NDArray[Any]) -> NDArray[Any]:
+        if self._reverse:
+            return numpy.asarray(self._operation(values, value))
+        return numpy.asarray(self._operation(value, values))
+
+    def _iter_chunks(self, slice_start: int, slice_stop: int) -> Iterator[
+            Tuple[int, NDArray[Any]]]:
+        """
+        Yields the results for the slice as (start, array) chunks.
+        """
+        if not self._a_list.range_based():
+            values = numpy.asarray(list(
+                self._a_list.iter_by_slice(slice_start, slice_stop)))
+            yield (slice_start, self._apply(
+                values, self._array[slice_start:slice_stop]))
+            return
+        for (start, stop, value) in self._a_list.iter_ranges_by_slice(
+                slice_start, slice_stop):
+            yield (start, self._apply(value, self._array[start:stop]))
+
+    @overrides(AbstractList.range_based)
+    def range_based(self) -> bool:
+        return False
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id: int) -> R:
+        the_id = self._check_id_in_range(the_id)
+        return next(self.iter_by_slice(the_id, the_id + 1))
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(
+            self, slice_start: int, slice_stop: int) -> R:
+        only_range: Optional[Tuple[int, int, R]] = None
+        for this_range in self.iter_ranges_by_slice(slice_start, slice_stop):
+            if only_range is not None:
+                raise MultipleValuesException(
+                    self._key, only_range[2], this_range[2])
+            only_range = this_range
+        if only_range is None:
+            raise ValueError("Empty slice has no value")
+        return only_range[2]
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids: IdsType) -> R:
+        result = self.get_value_by_id(ids[0])
+        for id_value in ids[1:]:
+            value = self.get_value_by_id(id_value)
+            if not _eq(result, value):
+                raise MultipleValuesException(self._key, result, value)
+        return result
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[R]:
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        for (_, values) in self._iter_chunks(slice_start, slice_stop):
+            yield from _to_values(values)
+
+    @overrides(AbstractList.iter_ranges)
+    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        return self.iter_ranges_by_slice(0, self._size)
+
+    @overrides(AbstractList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[
+                Tuple[int, int, R]]:
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        previous: Optional[Tuple[int, int, R]] = None
+        for (start, values) in self._iter_chunks(slice_start, slice_stop):
+            if len(values) == 0:
+                continue
+            # Find where the value changes within the chunk
+            changed = values[1:] != values[:-1]
+            if changed.ndim > 1:
+                changed = changed.reshape(len(changed), -1).any(axis=1)
+            bounds = [0] + (numpy.flatnonzero(changed) + 1).tolist() + [
+                len(values)]
+            firsts = _to_values(values[bounds[:-1]])
+            for (low, high, value) in zip(bounds[:-1], bounds[1:], firsts):
+                if previous is not None:
+                    if previous[1] == start + low and _eq(previous[2], value):
+                        previous = (previous[0], start + high, previous[2])
+                        continue
+                    yield previous
+                previous = (start + low, start + high, value)
+        if previous is not None:
+            yield previous
+
+    @overrides(AbstractList.get_default)
+    def get_default(self) -> Optional[R]:
+        # There is no single array value to combine with the default
+        return None
+
+
+# So the operators of every AbstractList can make one
+AbstractList.array_list_type = DualArrayList
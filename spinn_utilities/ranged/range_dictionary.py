@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import hashlib
 from typing import (
-    Dict, Generator, Iterable, Iterator, Optional, Sequence, Tuple, Union,
-    Generic, overload, TYPE_CHECKING)
+    Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple,
+    Union, Generic, overload, TYPE_CHECKING)
 from typing_extensions import TypeAlias
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, T, _StrSeq
@@ -367,6 +368,9 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
                 self.set_value(key=key, value=value)
             elif isinstance(value, RangedList):
                 assert self._size == len(value)
+                # The whole of a new key counts as changed
+                # pylint: disable=protected-access
+                value._record_change(0, self._size)
                 self._value_lists[key] = value
                 # TODO Make work for other kinds of AbstractList
             else:
@@ -550,6 +554,71 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
             a_key: self._value_lists[a_key].iter_ranges_by_ids(ids=ids)
             for a_key in key})
 
+    @staticmethod
+    def change_token() -> int:
+        """
+        Gets a token to later pass to :py:meth:`changes_since`.
+
+        See :py:meth:`RangedList.change_token`
+
+        :return: A token marking the current point in time
+        """
+        return RangedList.change_token()
+
+    def changes_since(
+            self, token: int,
+            key: Union[str, _StrSeq, None] = None) -> List[Tuple[int, int]]:
+        """
+        Gets the ranges of IDs written to since the token was obtained.
+
+        Keys added after the token was obtained count as changed for every ID.
+
+        :param token: A value previously returned by :py:meth:`change_token`
+        :param key: The key or keys to check, or `None` for all keys
+        :return: Sorted, merged (start, stop) ranges of changed IDs
+        """
+        if isinstance(key, str):
+            return self._value_lists[key].changes_since(token)
+        if key is None:
+            key = list(self.keys())
+        changes = sorted(
+            change for a_key in key
+            for change in self._value_lists[a_key].changes_since(token))
+        result: List[Tuple[int, int]] = []
+        for (start, stop) in changes:
+            if result and start <= result[-1][1]:
+                result[-1] = (result[-1][0], max(stop, result[-1][1]))
+            else:
+                result.append((start, stop))
+        return result
+
+    def fingerprint(
+            self, key: Union[str, _StrSeq, None] = None,
+            slice_start: Optional[int] = None,
+            slice_stop: Optional[int] = None) -> str:
+        """
+        Gets a digest of the keys and values in the dictionary.
+
+        See :py:meth:`RangedList.fingerprint`
+
+        :param key: The key or keys to include, or `None` for all keys
+        :param slice_start: Start of the slice or `None` for all IDs
+        :param slice_stop: Exclusive end of the slice or `None` for the end
+        :return: Hex digest of the content
+        """
+        if isinstance(key, str):
+            return self._value_lists[key].fingerprint(slice_start, slice_stop)
+        if key is None:
+            key = list(self.keys())
+        digest = hashlib.blake2b(digest_size=16)
+        for a_key in sorted(key):
+            digest.update(a_key.encode("utf-8"))
+            digest.update(b"=")
+            digest.update(self._value_lists[a_key].fingerprint(
+                slice_start, slice_stop).encode("utf-8"))
+            digest.update(b";")
+        return digest.hexdigest()
+
     def set_default(self, key: str, default: T) -> None:
         """
         Sets the default value for a single key.
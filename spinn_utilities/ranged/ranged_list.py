@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import bisect
 from collections.abc import Sized
+import hashlib
+import re
 from typing import (
     Any, Callable, Generic, List, Iterable, Iterator, Optional, Sequence,
     Tuple, Union, cast, final)
+import numpy
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias, TypeGuard
 from spinn_utilities.overrides import overrides
 from spinn_utilities.helpful_functions import is_singleton
 from .abstract_sized import Selector
 from .abstract_list import AbstractList, T, _eq, IdsType
 from .multiple_values_exception import MultipleValuesException
+from .value_index import ValueIndex, ids_from_ranges
 
 #: The type of a range descriptor
 _RangeType: TypeAlias = Tuple[int, int, T]
@@ -30,6 +36,70 @@ _ListType: TypeAlias = Union[Callable[[int], T], Sequence[T]]
 # The type of value arguments in several places
 _ValueType: TypeAlias = Optional[Union[T, _ListType]]
 
+# The fingerprint sums the hash of the value of each ID times _BASE to the
+# power of the ID, modulo _PRIME, so it can be updated one range at a time
+_PRIME = 2 ** 127 - 1
+_BASE = 0x5bd1e9955bd1e9955bd1e995
+# Multiplying by this divides by _BASE - 1
+_INVERSE = pow(_BASE - 1, -1, _PRIME)
+# The address in a repr such as that of a function or a plain object
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _value_bytes(value: Any) -> bytes:
+    """
+    Gets a stable byte representation of a value for fingerprinting.
+
+    :param value: The value to represent
+    :return: bytes which only depend on the content of the value
+    :raises TypeError:
+        If the value has no stable representation, as its repr includes
+        its address
+    """
+    if isinstance(value, numpy.ndarray):
+        return (f"{value.dtype.str}{value.shape}".encode("utf-8") +
+                numpy.ascontiguousarray(value).tobytes())
+    if isinstance(value, numpy.generic):
+        value = value.item()
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__.encode("utf-8") + b"(" +
+                b",".join(_value_bytes(item) for item in value) + b")")
+    text = repr(value)
+    if _ADDRESS.search(text):
+        raise TypeError(
+            f"{type(value).__name__} values can not be fingerprinted as "
+            f"they have no stable representation: {text}")
+    return text.encode("utf-8")
+
+
+def _value_hash(value: Any) -> int:
+    """
+    Gets a stable hash of a value for fingerprinting.
+
+    :param value: The value to hash
+    :return: A hash of the value that is less than ``_PRIME``
+    """
+    digest = hashlib.blake2b(_value_bytes(value), digest_size=16).digest()
+    return int.from_bytes(digest, "little") % _PRIME
+
+
+def _hash_sum(ranges: Iterable[Tuple[int, int, Any]]) -> int:
+    """
+    Sums the hash of the value of each ID in some ranges times ``_BASE`` to
+    the power of the ID.
+
+    Done a range at a time as the sum over a range is a geometric series.
+
+    :param ranges: The (start, stop, value) ranges
+    :return: The sum modulo ``_PRIME``
+    :raises TypeError: If a value can not be fingerprinted
+    """
+    total = 0
+    for (start, stop, value) in ranges:
+        total += _value_hash(value) * pow(_BASE, start, _PRIME) * (
+            pow(_BASE, stop - start, _PRIME) - 1)
+    return total * _INVERSE % _PRIME
+
 
 def function_iterator(
         function: Callable[[int], T], size: int,
@@ -61,7 +131,11 @@ class RangedList(AbstractList[T], Generic[T]):
     that all have the same value.
     """
     __slots__ = [
-        "_default", "_ranged_based", "_ranges"]
+        "_changes", "_default", "_fingerprint", "_index_failed",
+        "_index_values", "_ranged_based", "_ranges", "_value_index"]
+
+    # Shared by all lists so that change tokens can be compared across lists
+    _change_clock = 0
 
     def __init__(
             self, size: Optional[int] = None, value: _ValueType = None,
@@ -90,6 +164,14 @@ class RangedList(AbstractList[T], Generic[T]):
             self._default = None
         self._ranges: Union[List[T], List[_RangeType]]
         self._ranged_based: Optional[bool] = None
+        # Disjoint (start, stop, stamp) ranges of when each ID last changed
+        self._changes: List[Tuple[int, int, int]] = []
+        # The hash sum of the whole list, or None until first asked for
+        self._fingerprint: Optional[int] = None
+        self._index_values = False
+        self._value_index: Optional[ValueIndex] = None
+        # True if the index could not be built since the last write
+        self._index_failed = False
         self.set_value(value, use_list_as_value=use_list_as_value)
 
     def __length(self, value: Any) -> int:
@@ -354,6 +436,7 @@ class RangedList(AbstractList[T], Generic[T]):
         :param value: new value(s)
         :param use_list_as_value: True if the value to be set *is* a list
         """
+        self.__start_write(0, self._size)
 
         # If the value to set is a list, just copy the values
         if not use_list_as_value and self.is_list(value):
@@ -365,6 +448,7 @@ class RangedList(AbstractList[T], Generic[T]):
         else:
             self._ranges = [(0, self._size, value)]
             self._ranged_based = True
+        self.__end_write(0, self._size)
 
     def set_value_by_id(self, the_id: int, value: T) -> None:
         """
@@ -382,7 +466,9 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # If non-range-based, set the value directly
         if not self._ranged_based:
+            self.__start_write(the_id, the_id + 1)
             self.__the_values[the_id] = value
+            self.__end_write(the_id, the_id + 1)
             return
 
         # Find the range in which to set the value
@@ -396,6 +482,7 @@ class RangedList(AbstractList[T], Generic[T]):
         if _eq(value, old_value):
             return
 
+        self.__start_write(the_id, the_id + 1)
         ranges = self.__the_ranges
 
         # Split the ID out of the range
@@ -424,6 +511,7 @@ class RangedList(AbstractList[T], Generic[T]):
                 ranges[idx - 1] = (
                     ranges[idx - 1][0], ranges[idx][1], ranges[idx][2])
                 ranges.pop(idx)
+        self.__end_write(the_id, the_id + 1)
 
     def set_value_by_slice(
             self, slice_start: int, slice_stop: int, value: _ValueType,
@@ -451,9 +539,12 @@ class RangedList(AbstractList[T], Generic[T]):
             return self._set_values_list(range(slice_start, slice_stop), value)
 
         # If non-ranged-based, set the values directly
+        written = (slice_start, slice_stop)
+        self.__start_write(*written)
         if not self._ranged_based:
             for id_value in range(slice_start, slice_stop):
                 self.__the_values[id_value] = cast(T, value)
+            self.__end_write(*written)
             return
 
         # Skip ranges before start of slice
@@ -508,6 +599,7 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # set the value in case missed elsewhere
         ranges[index] = (ranges[index][0], ranges[index][1], value)
+        self.__end_write(*written)
 
     def _set_values_list(self, ids: IdsType, value: _ListType) -> None:
         values = self.as_list(value=value, size=len(ids), ids=ids)
@@ -568,6 +660,250 @@ class RangedList(AbstractList[T], Generic[T]):
             return list(self.__the_ranges)
         return list(self.iter_ranges())
 
+    @staticmethod
+    def change_token() -> int:
+        """
+        Gets a token to later pass to :py:meth:`changes_since`.
+
+        Tokens are shared by all lists, so one token can be used to ask any
+        number of lists (or dictionaries) what has changed since it was
+        obtained.
+
+        :return: A token marking the current point in time
+        """
+        RangedList._change_clock += 1
+        return RangedList._change_clock
+
+    def __written_ranges(
+            self, start: int, stop: int) -> Optional[List[_RangeType]]:
+        """
+        Gets the ranges of a write, if the fingerprint or index need them.
+        """
+        if start >= stop or (
+                self._fingerprint is None and self._value_index is None):
+            return None
+        return list(self.iter_ranges_by_slice(start, stop))
+
+    def __start_write(self, start: int, stop: int) -> None:
+        """
+        Called before the IDs from start to stop (exclusive) are written.
+
+        Takes their old values out of the fingerprint and value index.
+        """
+        self._record_change(start, stop)
+        self._index_failed = False
+        ranges = self.__written_ranges(start, stop)
+        if ranges is None:
+            return
+        if self._fingerprint is not None:
+            try:
+                self._fingerprint = (
+                    self._fingerprint - _hash_sum(ranges)) % _PRIME
+            except TypeError:
+                self._fingerprint = None
+        if self._value_index is not None:
+            try:
+                self._value_index.remove(ranges)
+            except (KeyError, TypeError):
+                # A value changed in place; rebuilt on the next lookup
+                self._value_index = None
+
+    def __end_write(self, start: int, stop: int) -> None:
+        """
+        Called after the IDs from start to stop (exclusive) are written.
+
+        Puts their new values into the fingerprint and value index.
+        """
+        ranges = self.__written_ranges(start, stop)
+        if ranges is None:
+            return
+        if self._fingerprint is not None:
+            try:
+                self._fingerprint = (
+                    self._fingerprint + _hash_sum(ranges)) % _PRIME
+            except TypeError:
+                # Not remembered so fingerprint raises it
+                self._fingerprint = None
+        if self._value_index is not None:
+            try:
+                self._value_index.add(ranges)
+            except TypeError:
+                # Unhashable so lookups do it the slow way until next write
+                self._value_index = None
+                self._index_failed = True
+
+    def _record_change(self, start: int, stop: int) -> None:
+        """
+        Records that the IDs from start to stop (exclusive) were written.
+
+        :param start: First ID written
+        :param stop: Exclusive end of the IDs written
+        """
+        if start >= stop:
+            return
+        stamp = RangedList._change_clock
+        changes = self._changes
+
+        # The changes are disjoint and sorted so the ones overlapping the
+        # new one are together, from low up to but not including high.
+        # (x, 0, 0) sorts before any change starting at x as stops are > 0
+        low = bisect.bisect_left(changes, (start, 0, 0))
+        if low > 0 and changes[low - 1][1] > start:
+            low -= 1
+        high = bisect.bisect_left(changes, (stop, 0, 0), low)
+
+        # Keep the parts of the overlapped changes outside the new one
+        replacement = [(start, stop, stamp)]
+        if low < high:
+            (c_start, _, c_stamp) = changes[low]
+            if c_start < start:
+                replacement.insert(0, (c_start, start, c_stamp))
+            (_, c_stop, c_stamp) = changes[high - 1]
+            if c_stop > stop:
+                replacement.append((stop, c_stop, c_stamp))
+
+        # Merge with neighbours with the same stamp to keep the list short
+        if low > 0 and changes[low - 1][1] == replacement[0][0] and \
+                changes[low - 1][2] == replacement[0][2]:
+            low -= 1
+            replacement[0] = (
+                changes[low][0], replacement[0][1], replacement[0][2])
+        if high < len(changes) and changes[high][0] == replacement[-1][1] \
+                and changes[high][2] == replacement[-1][2]:
+            replacement[-1] = (
+                replacement[-1][0], changes[high][1], replacement[-1][2])
+            high += 1
+        changes[low:high] = replacement
+
+    def changes_since(self, token: int) -> List[Tuple[int, int]]:
+        """
+        Gets the ranges of IDs written to since the token was obtained.
+
+        .. note::
+            Writes that set an ID to the value it already had may still be
+            reported.
+
+        :param token: A value previously returned by :py:meth:`change_token`
+        :return: Sorted, merged (start, stop) ranges of changed IDs
+        """
+        result: List[Tuple[int, int]] = []
+        for (start, stop, stamp) in self._changes:
+            if stamp < token:
+                continue
+            if result and result[-1][1] == start:
+                result[-1] = (result[-1][0], stop)
+            else:
+                result.append((start, stop))
+        return result
+
+    def fingerprint(self, slice_start: Optional[int] = None,
+                    slice_stop: Optional[int] = None) -> str:
+        """
+        Gets a digest of the values in the list (or a slice of it).
+
+        The digest is computed over the ranges and their values, never over
+        the individual elements, so lists (or slices) with the same values
+        in the same places have the same fingerprint, even between runs.
+        Once the fingerprint of the whole list has been asked for, it is
+        kept up to date by each write, at the cost of hashing the values of
+        the ranges written.
+
+        .. warning::
+            Changes made to a mutable value in place are not detected.
+
+        :param slice_start: Start of the slice or `None` for the whole list
+        :param slice_stop: Exclusive end of the slice or `None` for the end
+        :return: Hex digest of the content
+        :raises TypeError:
+            If a value has no stable representation, such as a function or
+            an object without its own ``__repr__``
+        """
+        if slice_start is None and slice_stop is None:
+            if self._fingerprint is None:
+                self._fingerprint = _hash_sum(self.iter_ranges())
+            total = self._fingerprint
+            slice_start, slice_stop = 0, self._size
+        else:
+            slice_start, slice_stop = self._check_slice_in_range(
+                slice_start, slice_stop)
+            total = 0
+            if slice_start < slice_stop:
+                # Relative positions so equal slices have equal fingerprints
+                total = _hash_sum(self.iter_ranges_by_slice(
+                    slice_start, slice_stop)) * pow(
+                        _BASE, -slice_start, _PRIME) % _PRIME
+        return hashlib.blake2b(
+            f"{slice_stop - slice_start}:{total}".encode("utf-8"),
+            digest_size=16).hexdigest()
+
+    def enable_value_index(self, enable: bool = True) -> None:
+        """
+        Turns on (or off) an index from each value to the IDs that hold it.
+
+        When on, :py:meth:`index`, :py:meth:`count`, ``in`` and
+        :py:meth:`ids_by_value` look up hashable values in the index rather
+        than checking every range.
+        The index is built on the first lookup and then kept up to date by
+        each write, at the cost of updating it for the ranges written.
+
+        :param enable: True to use the index, False to stop using it
+        """
+        self._index_values = enable
+        self._value_index = None
+        self._index_failed = False
+
+    def __lookup(self, x: Any) -> Optional[List[Tuple[int, int]]]:
+        """
+        Gets the (start, stop) ranges holding the value from the index.
+
+        :param x: The value to find
+        :return: The ranges, or `None` if the index can not be used
+        """
+        if not self._index_values or self._index_failed:
+            return None
+        if self._value_index is None:
+            try:
+                self._value_index = ValueIndex(self.iter_ranges())
+            except TypeError:
+                # Unhashable values so not tried again until the next write
+                self._index_failed = True
+                return None
+        try:
+            return self._value_index.lookup(x)
+        except TypeError:
+            # Unhashable value so do it the slow way
+            return None
+
+    @overrides(AbstractList.__contains__)
+    def __contains__(self, item: T) -> bool:
+        id_ranges = self.__lookup(item)
+        if id_ranges is None:
+            return super().__contains__(item)
+        return len(id_ranges) > 0
+
+    @overrides(AbstractList.count)
+    def count(self, x: T) -> int:
+        id_ranges = self.__lookup(x)
+        if id_ranges is None:
+            return super().count(x)
+        return sum(stop - start for (start, stop) in id_ranges)
+
+    @overrides(AbstractList.index)
+    def index(self, x: T) -> int:
+        id_ranges = self.__lookup(x)
+        if id_ranges is None:
+            return super().index(x)
+        if not id_ranges:
+            raise ValueError(f"{x} is not in list")
+        return id_ranges[0][0]
+
+    @overrides(AbstractList.ids_by_value)
+    def ids_by_value(self, x: T) -> NDArray[numpy.integer]:
+        id_ranges = self.__lookup(x)
+        if id_ranges is None:
+            return super().ids_by_value(x)
+        return ids_from_ranges(id_ranges)
+
     def set_default(self, default: Optional[T]) -> None:
         """
         Sets the default value.
@@ -601,6 +937,7 @@ class RangedList(AbstractList[T], Generic[T]):
         :param other: Another Ranged List to copy the values from
         """
         # Assume the _default and key remain unchanged
+        self.__start_write(0, self._size)
         self._ranged_based = other.range_based()
         # clear the list fast and 2.7 safe
         self._ranges *= 0
@@ -608,6 +945,7 @@ class RangedList(AbstractList[T], Generic[T]):
             self.__the_ranges.extend(other.iter_ranges())
         else:
             self.__the_values.extend(other)
+        self.__end_write(0, self._size)
 
     def copy(self) -> RangedList[T]:
         """
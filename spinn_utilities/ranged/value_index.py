@@ -0,0 +1,103 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
+import numpy
+from numpy.typing import NDArray
+
+
+def ids_from_ranges(
+        ranges: Iterable[Tuple[int, int]]) -> NDArray[numpy.integer]:
+    """
+    Gets all the IDs covered by some ranges as one array.
+
+    :param ranges: The (start, stop) ranges of IDs
+    :return: The IDs in the order of the ranges
+    """
+    aranges = [numpy.arange(start, stop) for (start, stop) in ranges]
+    if not aranges:
+        return numpy.zeros(0, dtype=int)
+    return numpy.concatenate(aranges)
+
+
+class ValueIndex(object):
+    """
+    An index from each value of a list to the ranges of IDs that hold it.
+
+    The index is kept up to date by removing the ranges a write covers
+    before the write and adding them back, with their new values, after it.
+    Only hashable values can be indexed.
+    """
+
+    __slots__ = ["_id_ranges"]
+
+    def __init__(self, ranges: Iterable[Tuple[int, int, Any]]) -> None:
+        """
+        :param ranges: The (start, stop, value) ranges of the whole list
+        :raises TypeError: If a value is not hashable
+        """
+        # The sorted, merged (start, stop) ranges holding each value
+        self._id_ranges: Dict[Any, List[Tuple[int, int]]] = dict()
+        self.add(ranges)
+
+    def add(self, ranges: Iterable[Tuple[int, int, Any]]) -> None:
+        """
+        Adds ranges of IDs that have just been given values.
+
+        :param ranges: The (start, stop, value) ranges
+        :raises TypeError: If a value is not hashable
+        """
+        for (start, stop, value) in ranges:
+            id_ranges = self._id_ranges.setdefault(value, [])
+            index = bisect.bisect_left(id_ranges, (start, stop))
+            # Merge with the ranges either side if they touch this one
+            if index < len(id_ranges) and id_ranges[index][0] == stop:
+                stop = id_ranges.pop(index)[1]
+            if index > 0 and id_ranges[index - 1][1] == start:
+                index -= 1
+                start = id_ranges.pop(index)[0]
+            id_ranges.insert(index, (start, stop))
+
+    def remove(self, ranges: Iterable[Tuple[int, int, Any]]) -> None:
+        """
+        Removes ranges of IDs that are about to be given new values.
+
+        :param ranges: The (start, stop, value) ranges with their old values
+        :raises TypeError: If a value is not hashable
+        :raises KeyError: If a value is not in the index
+        """
+        for (start, stop, value) in ranges:
+            id_ranges = self._id_ranges[value]
+            # The range holding start is the last one starting at or before it
+            index = bisect.bisect_right(id_ranges, (start, sys.maxsize)) - 1
+            (r_start, r_stop) = id_ranges[index]
+            kept = []
+            if r_start < start:
+                kept.append((r_start, start))
+            if stop < r_stop:
+                kept.append((stop, r_stop))
+            id_ranges[index:index + 1] = kept
+            if not id_ranges:
+                del self._id_ranges[value]
+
+    def lookup(self, value: Any) -> List[Tuple[int, int]]:
+        """
+        Gets the ranges of IDs that hold a value.
+
+        :param value: The value to find
+        :return: The sorted (start, stop) ranges; empty if none
+        :raises TypeError: If the value is not hashable
+        """
+        return self._id_ranges.get(value, [])
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from spinn_utilities.make_tools import check_database_keys
+from spinn_utilities.make_tools.check_database_keys import check_database
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+
+
+class TestCheckDatabaseKeys(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        # pylint: disable=protected-access
+        check_database_keys._CACHE.clear()
+        check_database_keys._WALKS.clear()
+
+    def test_check_database(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsC.sqlite3")
+            with LogSqlLiteDatabase(database_file):
+                pass
+            self.assertEqual("max log id None", check_database(database_file))
+            with LogSqlLiteDatabase(database_file) as db:
+                directory_id = db.get_directory_id("src", "dest")
+                file_id = db.get_file_id(directory_id, "a.c")
+                db.set_log_infos([(20, 3, "first"), (30, 5, "second")],
+                                 file_id)
+            self.assertEqual("max log id 2", check_database(database_file))
+
+            # Same size and time so not opened again
+            stat = os.stat(database_file)
+            with open(database_file, "r+b") as f:
+                f.write(b"not a database!!")
+            os.utime(database_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual("max log id 2", check_database(database_file))
+            # A write only to the write ahead log is a change too
+            with open(database_file + "-wal", "wb") as f:
+                f.write(b"changed")
+            self.assertIn("unreadable", check_database(database_file))
+            os.remove(database_file + "-wal")
+            os.utime(database_file)
+            self.assertIn("unreadable", check_database(database_file))
+
+    def test_find_aplx_dirs(self) -> None:
+        # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            for directory in ["b", "a", os.path.join("a", "c"),
+                              "spinnaker_tools"]:
+                os.makedirs(os.path.join(tmp, directory))
+                open(os.path.join(tmp, directory, "x.aplx"), "w").close()
+            expected = [os.path.join(tmp, "a"), os.path.join(tmp, "a", "c"),
+                        os.path.join(tmp, "b")]
+            self.assertEqual(
+                expected, check_database_keys._find_aplx_dirs(tmp))
+
+            # Not walked again while no directory changes
+            mtimes, found = check_database_keys._WALKS[tmp]
+            found.append("remembered")
+            self.assertEqual(expected + ["remembered"],
+                             check_database_keys._find_aplx_dirs(tmp))
+            os.remove(os.path.join(tmp, "a", "c", "x.aplx"))
+            os.utime(os.path.join(tmp, "a", "c"),
+                     ns=(0, mtimes[os.path.join(tmp, "a", "c")] + 1))
+            self.assertEqual(expected[::2],
+                             check_database_keys._find_aplx_dirs(tmp))
+
+    def test_cache_file(self) -> None:
+        # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsC.sqlite3")
+            with LogSqlLiteDatabase(database_file):
+                pass
+            description = check_database(database_file)
+            cache_file = os.path.join(tmp, "cache.json")
+            check_database_keys._save_cache(cache_file)
+            saved = dict(check_database_keys._CACHE)
+            check_database_keys._CACHE.clear()
+            check_database_keys._load_cache(cache_file)
+            self.assertEqual(saved, check_database_keys._CACHE)
+            self.assertEqual(description, check_database(database_file))
+
+            # Anything that is not a cache is ignored
+            check_database_keys._CACHE.clear()
+            for bad in [[1, 2], {"databases": {"x": 3}, "walks": {}},
+                        {"databases": {}}, "text"]:
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump(bad, f)
+                check_database_keys._load_cache(cache_file)
+            check_database_keys._load_cache(os.path.join(tmp, "missing"))
+            self.assertEqual({}, check_database_keys._CACHE)
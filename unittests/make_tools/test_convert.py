@@ -12,14 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import redirect_stdout
+import csv
+from io import StringIO
+import json
 import os
 import pytest
 import shutil
+import sqlite3
 import sys
 import tempfile
 import unittest
 
 from spinn_utilities.make_tools.converter import convert
+from spinn_utilities.make_tools.file_converter import FileConverter
 from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 
 
@@ -68,3 +74,256 @@ class TestConverter(unittest.TestCase):
             convert(src, dest, tmp, "X")
             self.assertTrue(os.path.exists(e1))
             convert(src, dest, tmp, "Y")
+
+    def test_parallel(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        src = os.path.join(dir_path, "mock_src")
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            serial_dir = os.path.join(tmp, "serial")
+            parallel_dir = os.path.join(tmp, "parallel")
+            serial_db = convert(src, serial_dir, tmp, "S")
+            parallel_db = convert(src, parallel_dir, tmp, "P", workers=2)
+            for file_name in os.listdir(serial_dir):
+                with open(os.path.join(serial_dir, file_name),
+                          encoding="utf-8") as f:
+                    serial_text = f.read()
+                with open(os.path.join(parallel_dir, file_name),
+                          encoding="utf-8") as f:
+                    parallel_text = f.read()
+                self.assertEqual(
+                    serial_text, parallel_text.replace('"P', '"S'))
+            with LogSqlLiteDatabase(serial_db) as serial_sql:
+                with LogSqlLiteDatabase(parallel_db) as parallel_sql:
+                    max_id = serial_sql.get_max_log_id()
+                    assert max_id is not None
+                    self.assertEqual(max_id, parallel_sql.get_max_log_id())
+                    for log_id in range(1, max_id + 1):
+                        self.assertEqual(
+                            serial_sql.get_log_info(str(log_id)),
+                            parallel_sql.get_log_info(str(log_id)))
+
+    def test_null_character(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            dest = os.path.join(tmp, "dest")
+            os.mkdir(src)
+            with open(os.path.join(src, "null.c"), "w",
+                      encoding="utf-8") as f:
+                f.write('// A \0 in a comment\nlog_info("after %d", 1);\n')
+            database_file = convert(src, dest, tmp, "N", workers=2)
+            with open(os.path.join(dest, "null.c"), encoding="utf-8") as f:
+                text = f.read()
+            self.assertIn("// A \0 in a comment", text)
+            self.assertIn('log_mini_info("N1', text)
+            with LogSqlLiteDatabase(database_file) as sql:
+                info = sql.get_log_info("1")
+                assert info is not None
+                self.assertEqual("after %d", info[3])
+
+    def test_one_log_file(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            dest = os.path.join(tmp, "dest")
+            os.mkdir(src)
+            one = os.path.join(src, "one.c")
+            with open(one, "w", encoding="utf-8") as f:
+                f.write('log_info("only one");\n')
+            database_file = convert(src, dest, tmp, "O")
+            # The manifest of one log ID is read back as text
+            with LogSqlLiteDatabase(database_file) as sql:
+                self.assertIsNone(sql.find_directory_id(src, src))
+                # The top directory is walked as dest/.
+                directory_id = sql.find_directory_id(
+                    src, os.path.join(dest, "."))
+                assert directory_id is not None
+                manifest = sql.get_source_manifest(directory_id, "one.c")
+                assert manifest is not None
+                self.assertEqual([1], manifest[1])
+            os.utime(one)
+            convert(src, dest, tmp, "O")
+            with open(one, "a", encoding="utf-8") as f:
+                f.write("// changed\n")
+            convert(src, dest, tmp, "O")
+            with LogSqlLiteDatabase(database_file) as sql:
+                self.assertEqual(1, sql.get_max_log_id())
+
+    def test_check_does_not_write(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(dir_path, "mock_src")
+            dest = os.path.join(tmp, "dest")
+            database_file = convert(src, dest, tmp, "W")
+            with LogSqlLiteDatabase(database_file) as sql:
+                converter = FileConverter(sql, "W")
+                other_dest = os.path.join(tmp, "other")
+                shutil.copytree(dest, other_dest)
+                self.assertEqual("destination newer", converter.skip_reason(
+                    src, other_dest, "weird,file.c"))
+                self.assertIsNone(sql.find_directory_id(src, other_dest))
+
+    def test_content_hash(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            dest = os.path.join(tmp, "dest")
+            shutil.copytree(os.path.join(dir_path, "mock_src"), src)
+            weird = os.path.join(dest, "weird,file.c")
+            database_file = convert(src, dest, tmp, "H")
+            with open(weird, encoding="utf-8") as f:
+                first_text = f.read()
+
+            def file_rows() -> int:
+                db = sqlite3.connect(database_file)
+                count = db.execute("SELECT COUNT(*) FROM file").fetchone()[0]
+                db.close()
+                return count
+
+            rows = file_rows()
+            # A newer source with the same content is skipped
+            os.utime(os.path.join(src, "weird,file.c"))
+            os.utime(weird, (0, 0))
+            convert(src, dest, tmp, "H")
+            self.assertEqual(0, os.path.getmtime(weird))
+            self.assertEqual(rows, file_rows())
+            # A missing destination is rebuilt with the same IDs
+            shutil.rmtree(dest)
+            convert(src, dest, tmp, "H")
+            with open(weird, encoding="utf-8") as f:
+                self.assertEqual(first_text, f.read())
+            self.assertEqual(rows, file_rows())
+            # Changed content is converted even if older than destination
+            with open(os.path.join(src, "weird,file.c"), "a",
+                      encoding="utf-8") as f:
+                f.write('log_info("new at end");\n')
+            os.utime(os.path.join(src, "weird,file.c"), (0, 0))
+            convert(src, dest, tmp, "H")
+            self.assertEqual(rows + 1, file_rows())
+            with LogSqlLiteDatabase(database_file) as sql:
+                sql.check_original("new at end")
+
+    def test_hashed_ids(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        mock_src = os.path.join(dir_path, "mock_src")
+        shards = [["weird,file.c"], ["bit_field.c", "common-typedefs.h"]]
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            # Convert all then each shard as if on a different machine
+            shard_dbs = []
+            for i, file_names in enumerate([shards[0] + shards[1]] + shards):
+                shard = os.path.join(tmp, f"shard{i}")
+                os.makedirs(os.path.join(shard, "src"))
+                for file_name in file_names:
+                    shutil.copy(os.path.join(mock_src, file_name),
+                                os.path.join(shard, "src"))
+                shard_dbs.append(convert(
+                    os.path.join(shard, "src"), os.path.join(shard, "dest"),
+                    shard, "W", hashed_ids=True))
+            whole_db = shard_dbs.pop(0)
+            for file_names, shard in zip(shards, ["shard1", "shard2"]):
+                for file_name in file_names:
+                    with open(os.path.join(
+                            tmp, "shard0", "dest", file_name)) as f:
+                        whole_text = f.read()
+                    with open(os.path.join(
+                            tmp, shard, "dest", file_name)) as f:
+                        self.assertEqual(
+                            whole_text.split("\n")[1:],
+                            f.read().split("\n")[1:])
+
+            merged_db = os.path.join(tmp, "logsM.sqlite3")
+            with LogSqlLiteDatabase(merged_db) as merged:
+                for shard_db in shard_dbs:
+                    self.assertGreater(merged.merge(shard_db), 0)
+                connection = sqlite3.connect(merged_db)
+                files = connection.execute(
+                    "SELECT * FROM file ORDER BY file_id").fetchall()
+                # Merging again adds nothing, not even file rows
+                self.assertEqual(0, merged.merge(shard_dbs[0]))
+                self.assertEqual(files, connection.execute(
+                    "SELECT * FROM file ORDER BY file_id").fetchall())
+                connection.close()
+                with LogSqlLiteDatabase(whole_db) as whole:
+                    self.assertEqual(
+                        sorted(whole.get_all_log_info()),
+                        sorted(merged.get_all_log_info()))
+
+            connection = sqlite3.connect(shard_dbs[1])
+            connection.execute("UPDATE log SET original = 'changed'")
+            connection.commit()
+            connection.close()
+            with LogSqlLiteDatabase(merged_db) as merged:
+                with self.assertRaises(ValueError):
+                    merged.merge(shard_dbs[1])
+
+    def test_hashed_ids_same_file_name(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            for directory in ["a", "b"]:
+                os.makedirs(os.path.join(src, directory))
+                with open(os.path.join(src, directory, "same.c"), "w",
+                          encoding="utf-8") as f:
+                    f.write(f'// {directory}\nlog_info("same text");\n')
+            database_file = convert(
+                src, os.path.join(tmp, "dest"), tmp, "S", hashed_ids=True)
+            with LogSqlLiteDatabase(database_file) as sql:
+                infos = sql.get_all_log_info()
+            # Each file keeps its own ID for the same message
+            self.assertEqual(2, len(infos))
+            self.assertEqual({"same text"}, {info[4] for info in infos})
+            self.assertEqual({"2"}, {info[3] for info in infos})
+
+    def test_failed_merge_changes_nothing(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            shard_db = convert(
+                os.path.join(dir_path, "mock_src"), os.path.join(tmp, "dest"),
+                tmp, "F", hashed_ids=True)
+            # A manifest for a file that is not there fails after the
+            # directories, files and logs have been added
+            connection = sqlite3.connect(shard_db)
+            connection.execute("UPDATE source_manifest SET file_id = 9999")
+            connection.commit()
+            connection.close()
+            merged_db = os.path.join(tmp, "logsG.sqlite3")
+            with LogSqlLiteDatabase(merged_db) as merged:
+                with self.assertRaises(KeyError):
+                    merged.merge(shard_db)
+                self.assertEqual([], merged.get_all_log_info())
+            connection = sqlite3.connect(merged_db)
+            self.assertEqual([(0,)], list(connection.execute(
+                "SELECT COUNT(*) FROM directory")))
+            connection.close()
+
+    def test_profile(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        src = os.path.join(dir_path, "mock_src")
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            dest = os.path.join(tmp, "dest")
+            for workers, key in [(1, "A"), (2, "B")]:
+                report = os.path.join(tmp, f"profile{key}.json")
+                convert(src, os.path.join(tmp, f"dest{key}"), tmp, key,
+                        workers=workers, profile=report)
+                with open(report) as f:
+                    rows = json.load(f)
+                self.assertGreater(len(rows), 1)
+                for row in rows:
+                    self.assertEqual("", row["skipped"])
+                    self.assertEqual(
+                        os.path.getsize(row["path"]), row["bytes"])
+                by_name = {os.path.basename(row["path"]): row for row in rows}
+                self.assertGreater(by_name["weird,file.c"]["logs"], 0)
+                self.assertGreater(by_name["weird,file.c"]["parse_time"], 0)
+                self.assertGreater(by_name["weird,file.c"]["save_time"], 0)
+
+            report = os.path.join(tmp, "profile.csv")
+            convert(src, dest, tmp, "C")
+            output = StringIO()
+            with redirect_stdout(output):
+                convert(src, dest, tmp, "C", profile=report, top=2)
+            with open(report, newline="") as f:
+                csv_rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), len(csv_rows))
+            for csv_row in csv_rows:
+                self.assertEqual("unchanged content", csv_row["skipped"])
+            self.assertIn("0 of", output.getvalue())
+            self.assertIn("Slowest 2", output.getvalue())
+            self.assertIn(" save ", output.getvalue())
@@ -0,0 +1,182 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import socket
+import tempfile
+from typing import Iterator, List, Tuple
+import unittest
+from unittest import mock
+
+from spinn_utilities.make_tools.converter import convert
+from spinn_utilities.make_tools.decode_server import DecodeServer
+from spinn_utilities.make_tools.file_converter import TOKEN
+from spinn_utilities.make_tools.log_database_registry import (
+    LogDatabaseRegistry)
+from spinn_utilities.make_tools.replacer import Replacer
+
+LOGGER = "spinn_utilities.make_tools.decode_server"
+PATH = os.path.dirname(os.path.abspath(__file__))
+SHORTS = ["D11\n", "D17" + TOKEN + "10" + TOKEN + "20\n", "not a log\n",
+          "D8" + TOKEN + "0xc0400000\r\n"]
+
+
+async def _produce(reader: asyncio.StreamReader,
+                   writer: asyncio.StreamWriter, lines: List[str]) -> str:
+    """
+    Stands in for a machine sending IOBUF, a line at a time.
+    """
+    async def send() -> None:
+        for line in lines:
+            writer.write(line.encode())
+            await writer.drain()
+        writer.write_eof()
+
+    sender = asyncio.ensure_future(send())
+    received = await reader.read()
+    await sender
+    writer.close()
+    return received.decode()
+
+
+class TestDecodeServer(unittest.TestCase):
+
+    _tmp: tempfile.TemporaryDirectory[str]
+    _registry: LogDatabaseRegistry
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        database_file = convert(
+            os.path.join(PATH, "mock_src"),
+            os.path.join(cls._tmp.name, "dest"), cls._tmp.name, "D")
+        cls._registry = LogDatabaseRegistry({"D": database_file})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._registry.close()
+        cls._tmp.cleanup()
+
+    def _expected(self, lines: List[str]) -> str:
+        with Replacer(registry=self._registry) as replacer:
+            return "".join(replacer.replace_lines(lines))
+
+    def test_tcp(self) -> None:
+        lines = SHORTS * 500
+
+        async def run() -> Tuple[List[str], DecodeServer]:
+            decode_server = DecodeServer(
+                Replacer(preload=True, registry=self._registry),
+                read_size=1000)
+            server = await decode_server.start_tcp()
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                # Several producers at once
+                results = await asyncio.gather(*[
+                    _produce(*await asyncio.open_connection(
+                        "127.0.0.1", port), lines)
+                    for _ in range(3)])
+            return results, decode_server
+
+        results, decode_server = asyncio.run(run())
+        expected = self._expected(lines)
+        self.assertIn("[INFO] (weird,file.c: 36): this is ok\n", expected)
+        for result in results:
+            self.assertEqual(expected, result)
+        statistics = decode_server.statistics
+        self.assertEqual(3, statistics.connections)
+        self.assertEqual(3 * len(lines), statistics.lines)
+        self.assertEqual(3 * len(expected.encode()), statistics.bytes_out)
+        self.assertGreaterEqual(
+            statistics.max_latency, statistics.mean_latency)
+        self.assertGreater(statistics.lines_per_second, 0)
+        self.assertIn("3 connections", str(statistics))
+
+    def test_partial_line(self) -> None:
+        lines = ["D1", "1\nD", "11"]
+
+        async def run() -> str:
+            decode_server = DecodeServer(
+                Replacer(preload=True, registry=self._registry))
+            server = await decode_server.start_tcp()
+            async with server:
+                return await _produce(*await asyncio.open_connection(
+                    *server.sockets[0].getsockname()[:2]), lines)
+
+        self.assertEqual(self._expected(["D11\n", "D11"]), asyncio.run(run()))
+
+    def test_long_line(self) -> None:
+        # The end of the long line looks like a log line but is not one
+        lines = ["x" * 10] * 100 + ["D11\nD11\n"]
+
+        async def run() -> Tuple[str, DecodeServer]:
+            decode_server = DecodeServer(
+                Replacer(preload=True, registry=self._registry),
+                read_size=10)
+            server = await decode_server.start_tcp()
+            async with server:
+                return await _produce(*await asyncio.open_connection(
+                    *server.sockets[0].getsockname()[:2]), lines), \
+                    decode_server
+
+        result, decode_server = asyncio.run(run())
+        self.assertEqual(
+            "x" * 1000 + "D11\n" + self._expected(["D11\n"]), result)
+        # Passed on in pieces rather than held until the line ends
+        self.assertGreater(decode_server.statistics.batches, 2)
+
+    def test_decode_fails(self) -> None:
+        replace_lines = Replacer.replace_lines
+
+        def fussy(replacer: Replacer, lines: List[str]) -> Iterator[str]:
+            if any("bad" in line for line in lines):
+                raise ValueError("bad line")
+            return replace_lines(replacer, lines)
+
+        async def run() -> str:
+            decode_server = DecodeServer(
+                Replacer(preload=True, registry=self._registry))
+            server = await decode_server.start_tcp()
+            async with server:
+                return await _produce(*await asyncio.open_connection(
+                    *server.sockets[0].getsockname()[:2]),
+                    ["".join(SHORTS + ["bad\n"] + SHORTS)])
+
+        with mock.patch.object(Replacer, "replace_lines", fussy), \
+                self.assertLogs(LOGGER, "ERROR"):
+            # Only the line that fails is passed on as it is
+            self.assertEqual(
+                self._expected(SHORTS) + "bad\n" + self._expected(SHORTS),
+                asyncio.run(run()))
+        with mock.patch.object(DecodeServer, "_decode",
+                               side_effect=ValueError("broken")), \
+                self.assertLogs(LOGGER, "ERROR"):
+            # The client is still served
+            self.assertEqual(
+                "".join(SHORTS + ["bad\n"] + SHORTS), asyncio.run(run()))
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "No Unix sockets")
+    def test_unix(self) -> None:
+        path = os.path.join(self._tmp.name, "decode.sock")
+
+        async def run() -> str:
+            decode_server = DecodeServer(
+                Replacer(preload=True, registry=self._registry))
+            server = await decode_server.start_unix(path)
+            async with server:
+                return await _produce(
+                    *await asyncio.open_unix_connection(path), SHORTS)
+
+        self.assertEqual(self._expected(SHORTS), asyncio.run(run()))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from io import StringIO
 import os
 import pytest
 from pathlib import Path
@@ -19,6 +20,7 @@ import sys
 import tempfile
 import unittest
 
+from spinn_utilities.exceptions import UnexpectedCException
 from spinn_utilities.make_tools.file_converter import FileConverter
 from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 ranged_file = "local_ranges.txt"
@@ -220,3 +222,35 @@ class TestConverter(unittest.TestCase):
                     str(ex1))
                 self.assertIn("mistakes", str(ex1))
                 self.assertIn("too_many.c", str(ex1))
+
+    def test_engines_match(self) -> None:
+        # pylint: disable=protected-access
+        class_file = str(sys.modules[self.__module__].__file__)
+        path = os.path.dirname(os.path.abspath(class_file))
+        for directory in ["mock_src", "mistakes"]:
+            src = os.path.join(path, directory)
+            for file_name in sorted(os.listdir(src)):
+                if not file_name.endswith((".c", ".h")):
+                    continue
+                with open(os.path.join(src, file_name),
+                          encoding="utf-8") as f:
+                    content = f.read()
+                results = []
+                for by_lines in [False, True]:
+                    file_converter = FileConverter(None, database_key="")
+                    dest_f = StringIO()
+                    try:
+                        if by_lines:
+                            # The line at a time engine it replaced
+                            for line_num, text in enumerate(
+                                    StringIO(content)):
+                                file_converter._convert_line(
+                                    dest_f, line_num, text)
+                        else:
+                            file_converter._convert_text(dest_f, content)
+                        file_converter._check_end_status()
+                        results.append(
+                            (dest_f.getvalue(), file_converter._logs))
+                    except UnexpectedCException as ex:
+                        results.append((str(ex), []))
+                self.assertEqual(results[0], results[1], file_name)
@@ -0,0 +1,215 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from spinn_utilities.make_tools.converter import convert
+from spinn_utilities.make_tools.log_lookup import LogLookup, lookup_filename
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+from spinn_utilities.make_tools.prune import prune
+
+LOGS = [(20, 3, "first"), (30, 5, "second %u"), (20, 3, "first"),
+        (40, 9, "third")]
+
+
+class TestLogDatabase(unittest.TestCase):
+
+    def test_set_log_infos(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            with LogSqlLiteDatabase(os.path.join(tmp, "one.sqlite3")) as one:
+                with LogSqlLiteDatabase(
+                        os.path.join(tmp, "batch.sqlite3")) as batch:
+                    for db in [one, batch]:
+                        directory_id = db.get_directory_id("src", "dest")
+                        db.get_file_id(directory_id, "a.c")
+                    # first time all new then the second time reused
+                    for logs in [LOGS, LOGS[1:] + [(20, 4, "first")]]:
+                        file_id = one.get_file_id(directory_id, "a.c")
+                        expected = [
+                            one.set_log_info(level, line, original, file_id)
+                            for (level, line, original) in logs]
+                        file_id = batch.get_file_id(directory_id, "a.c")
+                        self.assertEqual(
+                            expected, batch.set_log_infos(logs, file_id))
+                    self.assertEqual([1, 2, 1, 3], batch.set_log_infos(
+                        LOGS, file_id))
+                    self.assertEqual([], batch.set_log_infos([], file_id))
+                    self.assertEqual(4, batch.get_max_log_id())
+
+    def test_indexes_added(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsO.sqlite3")
+            with LogSqlLiteDatabase(database_file):
+                pass
+            # Make it look like a database from before the indexes
+            db = sqlite3.connect(database_file)
+            for index in ["log_lookup", "file_lookup", "directory_lookup"]:
+                db.execute(f"DROP INDEX {index}")
+            db.commit()
+            db.close()
+            with LogSqlLiteDatabase(database_file):
+                pass
+            db = sqlite3.connect(database_file)
+            indexes = {row[0] for row in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+            db.close()
+            self.assertTrue({"log_lookup", "file_lookup",
+                             "directory_lookup"}.issubset(indexes))
+
+    def test_read_only_threads(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsT.sqlite3")
+            with LogSqlLiteDatabase(database_file) as writer:
+                directory_id = writer.get_directory_id("src", "dest")
+                file_id = writer.get_file_id(directory_id, "a.c")
+                writer.set_log_infos(LOGS, file_id)
+                self.assertTrue(os.path.exists(database_file + "-wal"))
+                # Can read while the writer is still open
+                with LogSqlLiteDatabase(
+                        database_file, read_only=True) as reader:
+                    with ThreadPoolExecutor(max_workers=4) as pool:
+                        infos = list(pool.map(
+                            reader.get_log_info, ["1", "2", "3"] * 10))
+                    self.assertEqual(
+                        (30, "a.c", "5", "second %u"), infos[1])
+                    with self.assertRaises(sqlite3.OperationalError):
+                        reader.set_log_infos(LOGS, file_id)
+            # No longer WAL once the writer is closed
+            self.assertFalse(os.path.exists(database_file + "-wal"))
+            with LogSqlLiteDatabase(
+                    database_file, read_only=True, immutable=True) as reader:
+                self.assertEqual(3, reader.get_max_log_id())
+            with self.assertRaises(sqlite3.OperationalError):
+                LogSqlLiteDatabase(
+                    os.path.join(tmp, "missing.sqlite3"), read_only=True)
+
+    def test_session(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsS.sqlite3")
+            with LogSqlLiteDatabase(database_file) as db:
+                directory_id = db.get_directory_id("src", "dest")
+                old_id = db.get_file_id(directory_id, "a.c")
+                db.start_session()
+                self.assertEqual(
+                    directory_id, db.get_directory_id("src", "dest"))
+                file_id = db.get_file_id(directory_id, "a.c")
+                self.assertEqual(old_id + 1, file_id)
+                self.assertEqual(file_id, db.get_file_id(directory_id, "a.c"))
+                other_id = db.get_file_id(directory_id, "b.c")
+                self.assertEqual(file_id + 1, other_id)
+                db.set_log_infos(LOGS, file_id)
+                # Files are written as soon as they get an ID
+                self.assertEqual(
+                    (20, "a.c", "3", "first"), db.get_log_info("1"))
+                db.end_session()
+                self.assertEqual(
+                    old_id + 3, db.get_file_id(directory_id, "b.c"))
+            connection = sqlite3.connect(database_file)
+            self.assertEqual(
+                [(old_id, 0), (file_id, 1), (other_id, 0), (old_id + 3, 1)],
+                list(connection.execute(
+                    "SELECT file_id, last_build FROM file ORDER BY file_id")))
+            connection.close()
+
+    def test_set_file_log_infos(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsF.sqlite3")
+            with LogSqlLiteDatabase(database_file) as db:
+                directory_id = db.get_directory_id("src", "dest")
+                db.start_session()
+                with mock.patch.object(
+                        LogSqlLiteDatabase, "_save_log_infos",
+                        side_effect=sqlite3.OperationalError("full")):
+                    with self.assertRaises(sqlite3.OperationalError):
+                        db.set_file_log_infos(
+                            directory_id, "a.c", LOGS, "hash")
+                log_ids = db.set_file_log_infos(
+                    directory_id, "a.c", LOGS, "hash")
+                self.assertEqual(log_ids, db.set_file_log_infos(
+                    directory_id, "a.c", LOGS, "hash"))
+                self.assertEqual(
+                    ("hash", log_ids),
+                    db.get_source_manifest(directory_id, "a.c"))
+                db.end_session()
+            connection = sqlite3.connect(database_file)
+            # The failed save left no file row behind; the second reused one
+            self.assertEqual(
+                [(1, "a.c", 1)],
+                list(connection.execute(
+                    "SELECT file_id, file_name, last_build FROM file")))
+            connection.close()
+
+    def test_sessions_share_database(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = os.path.join(tmp, "logsT.sqlite3")
+            with LogSqlLiteDatabase(database_file) as first, \
+                    LogSqlLiteDatabase(database_file) as second:
+                first.start_session()
+                second.start_session()
+                directory_id = first.get_directory_id("src", "dest")
+                file_ids = {first.get_file_id(directory_id, "a.c"),
+                            second.get_file_id(directory_id, "b.c"),
+                            first.get_file_id(directory_id, "c.c")}
+                self.assertEqual(3, len(file_ids))
+                second.end_session()
+            connection = sqlite3.connect(database_file)
+            self.assertEqual(
+                sorted(file_ids),
+                [row[0] for row in connection.execute(
+                    "SELECT file_id FROM file ORDER BY file_id")])
+            connection.close()
+
+    def test_prune(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            dest = os.path.join(tmp, "dest")
+            shutil.copytree(os.path.join(dir_path, "mock_src"), src)
+            database_file = convert(src, dest, tmp, "G")
+            connection = sqlite3.connect(database_file)
+            self.assertEqual(  # INCREMENTAL
+                2, connection.execute("PRAGMA auto_vacuum").fetchone()[0])
+            connection.close()
+            with LogSqlLiteDatabase(database_file) as sql:
+                first = sql.get_all_log_info()
+            # Every message in the file moves down a line
+            weird = os.path.join(src, "weird,file.c")
+            with open(weird) as f:
+                text = f.read()
+            with open(weird, "w") as f:
+                f.write("\n" + text)
+            convert(src, dest, tmp, "G")
+            with LogSqlLiteDatabase(database_file) as sql:
+                stale = [info for info in sql.get_all_log_info()
+                         if info[3].endswith("*")]
+                self.assertGreater(len(stale), 1)
+                kept = stale[0][0]
+                self.assertGreaterEqual(sql.prune([kept]), 0)
+                current = sql.get_all_log_info()
+            stale_ids = {info[0] for info in stale}
+            self.assertEqual(
+                [kept], [info[0] for info in current
+                         if info[0] in stale_ids])
+            self.assertEqual(len(first) + 1, len(current))
+            # Without keeping it the last stale message goes too
+            self.assertGreaterEqual(prune(database_file), 0)
+            with LogLookup(lookup_filename(database_file)) as lookup:
+                self.assertEqual(
+                    len(first), len(lookup.get_all_log_info()))
@@ -0,0 +1,124 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, List
+import unittest
+
+from spinn_utilities.make_tools.converter import convert
+from spinn_utilities.make_tools.file_converter import TOKEN
+from spinn_utilities.make_tools.log_database_registry import (
+    AttachedDatabase, LogDatabaseRegistry)
+from spinn_utilities.make_tools.log_lookup import (
+    LogLookup, LookupInfo, lookup_filename)
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+from spinn_utilities.make_tools.replacer import Replacer
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+# More than can be attached to one connection
+KEYS = "ABCDEFGHIJKL"
+
+
+class TestLogDatabaseRegistry(unittest.TestCase):
+
+    def test_attached(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            for i, key in enumerate(KEYS):
+                database_file = LogSqlLiteDatabase.filename_by_key(tmp, key)
+                with LogSqlLiteDatabase(database_file) as db:
+                    directory_id = db.get_directory_id("src", "dest")
+                    file_id = db.get_file_id(directory_id, f"{key}.c")
+                    db.set_log_infos(
+                        [(20, i, f"from {key} %u"), (30, i + 1, "second")],
+                        file_id)
+            with LogDatabaseRegistry.from_directories([tmp]) as registry:
+                self.assertEqual(list(KEYS), registry.keys)
+                for key in KEYS:
+                    database = registry.database(key)
+                    assert isinstance(database, AttachedDatabase)
+                    with LogSqlLiteDatabase(
+                            LogSqlLiteDatabase.filename_by_key(tmp, key),
+                            read_only=True) as db:
+                        self.assertEqual(db.get_all_log_info(),
+                                         database.get_all_log_info())
+                        for log_id in ["1", "2", "3", "x"]:
+                            self.assertEqual(db.get_log_info(log_id),
+                                             database.get_log_info(log_id))
+                        self.assertEqual(
+                            sorted(db.get_log_infos([2, 1, 7])),
+                            sorted(database.get_log_infos([2, 1, 7])))
+                self.assertIsNone(registry.database("Z"))
+
+                with Replacer(registry=registry) as replacer:
+                    self.assertEqual(
+                        ["[INFO] (A.c: 0): from A 5",
+                         "[INFO] (L.c: 11): from L 6", "Z1"],
+                        list(replacer.replace_lines(
+                            ["A1" + TOKEN + "5", "L1" + TOKEN + "6", "Z1"])))
+
+    def test_threads(self) -> None:
+        # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            for i, key in enumerate(KEYS):
+                database_file = LogSqlLiteDatabase.filename_by_key(tmp, key)
+                with LogSqlLiteDatabase(database_file) as db:
+                    directory_id = db.get_directory_id("src", "dest")
+                    file_id = db.get_file_id(directory_id, f"{key}.c")
+                    db.set_log_infos([(20, i, f"from {key}")], file_id)
+            barrier = threading.Barrier(4)
+            with LogDatabaseRegistry.from_directories([tmp]) as registry:
+                # Opened in this thread but read in the others
+                expected = {key: [(1, 20, f"{key}.c", str(i), f"from {key}")]
+                            for i, key in enumerate(KEYS)}
+                for key in KEYS:
+                    registry.database(key)
+
+                def read_all(_: int) -> Dict[str, List[LookupInfo]]:
+                    barrier.wait()
+                    infos = {}
+                    for key in KEYS:
+                        database = registry.database(key)
+                        assert database is not None
+                        infos[key] = database.get_all_log_info()
+                    return infos
+
+                with ThreadPoolExecutor(4) as pool:
+                    for infos in pool.map(read_all, range(4)):
+                        self.assertEqual(expected, infos)
+                # Two connections for this thread and for each of the others
+                self.assertEqual(10, len(registry._connections))
+            with LogDatabaseRegistry(
+                    {"X": os.path.join(tmp, "missing.sqlite3")}) as registry:
+                with self.assertRaises(sqlite3.OperationalError):
+                    registry.database("X")
+
+    def test_lookup(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = convert(
+                os.path.join(PATH, "mock_src"), os.path.join(tmp, "dest"),
+                tmp, "K")
+            with LogDatabaseRegistry({"K": database_file}) as registry:
+                self.assertIsInstance(registry.database("K"), LogLookup)
+            os.remove(lookup_filename(database_file))
+            with LogDatabaseRegistry({"K": database_file}) as registry:
+                database = registry.database("K")
+                self.assertIsInstance(database, AttachedDatabase)
+                with Replacer(registry=registry) as replacer:
+                    self.assertEqual(
+                        "[INFO] (weird,file.c: 36): this is ok",
+                        replacer.replace("K11"))
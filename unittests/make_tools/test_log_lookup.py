@@ -0,0 +1,97 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from spinn_utilities.make_tools.converter import convert
+from spinn_utilities.make_tools.log_lookup import LogLookup, lookup_filename
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestLogLookup(unittest.TestCase):
+
+    def test_same_as_database(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            database_file = convert(
+                os.path.join(PATH, "mock_src"), os.path.join(tmp, "dest"),
+                tmp, "L")
+            with LogSqlLiteDatabase(database_file, read_only=True) as db:
+                expected = db.get_all_log_info()
+                current = LogLookup.open_if_current(database_file)
+                assert current is not None
+                with current as lookup:
+                    self.assertEqual(expected, lookup.get_all_log_info())
+                    for log_id in ["0", "1", "011", "24", "x", "99999"]:
+                        self.assertEqual(db.get_log_info(log_id),
+                                         lookup.get_log_info(log_id))
+                    self.assertEqual(
+                        sorted(db.get_log_infos([3, 2, 3, 99999])),
+                        sorted(lookup.get_log_infos([3, 2, 3, 99999])))
+
+            # Out of date once the database changes
+            lookup_path = lookup_filename(database_file)
+            stamp = os.stat(database_file).st_mtime_ns
+            os.utime(lookup_path, ns=(stamp - 10, stamp - 10))
+            self.assertIsNone(LogLookup.open_if_current(database_file))
+            # The same time may be from before the change
+            os.utime(lookup_path, ns=(stamp, stamp))
+            self.assertIsNone(LogLookup.open_if_current(database_file))
+
+            # Or once only its write ahead log changes
+            os.utime(lookup_path, ns=(stamp + 1, stamp + 1))
+            current = LogLookup.open_if_current(database_file)
+            assert current is not None
+            current.close()
+            with open(database_file + "-wal", "wb"):
+                pass
+            os.utime(database_file + "-wal", ns=(stamp + 10, stamp + 10))
+            self.assertIsNone(LogLookup.open_if_current(database_file))
+            os.remove(database_file + "-wal")
+
+            with open(lookup_path, "wb") as f:
+                f.write(b"not a lookup file")
+            with self.assertRaises(ValueError):
+                LogLookup(lookup_path)
+
+    def test_empty(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            lookup_path = os.path.join(tmp, "logsE.lookup")
+            LogLookup.write(lookup_path, [])
+            with LogLookup(lookup_path) as lookup:
+                self.assertEqual([], lookup.get_all_log_info())
+                self.assertIsNone(lookup.get_log_info("1"))
+
+    def test_sparse(self) -> None:
+        infos = [(7, 20, "a.c", "3", "first %u"),
+                 (2 ** 31 - 2, 30, "b.c", "9*", "second"),
+                 (123456, 40, "a.c", "5", "third"),
+                 # The separator in the text is kept
+                 (123457, 20, "a.c", "6", "fourth\0end")]
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            lookup_path = os.path.join(tmp, "logsS.lookup")
+            LogLookup.write(lookup_path, infos)
+            # Not indexed by ID so the file is still small
+            self.assertLess(os.path.getsize(lookup_path), 1000)
+            with LogLookup(lookup_path) as lookup:
+                self.assertEqual(sorted(infos), lookup.get_all_log_info())
+                self.assertEqual((30, "b.c", "9*", "second"),
+                                 lookup.get_log_info(str(2 ** 31 - 2)))
+                self.assertEqual((20, "a.c", "6", "fourth\0end"),
+                                 lookup.get_log_info("123457"))
+                for log_id in ["0", "8", "123458", str(2 ** 40)]:
+                    self.assertIsNone(lookup.get_log_info(log_id))
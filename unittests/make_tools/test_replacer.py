@@ -26,23 +26,40 @@ Note: if weird,file.c changes you may have to manually fix the tests
     especially the log_id and row numbers
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import math
 import os
 import pytest
 import shutil
+import struct
 import tempfile
+from typing import List, Tuple, Union
 import unittest
+from unittest import mock
 
 from spinn_utilities.config_setup import unittest_setup
 from spinn_utilities.data import UtilsDataView
 from spinn_utilities.make_tools.converter import convert
 from spinn_utilities.make_tools.file_converter import TOKEN
-from spinn_utilities.make_tools.replacer import Replacer
+from spinn_utilities.make_tools.replacer import DecodePlan, Replacer
 
 PATH = os.path.dirname(os.path.abspath(__file__))
 logs_database = "TO BE SET"
 
 
+def _convert_unreadable(tmpdirname: str) -> str:
+    """
+    Converts a source with a message that can not be unescaped
+    (ID 1) and one that can (ID 2).
+    """
+    src = os.path.join(tmpdirname, "src")
+    os.mkdir(src)
+    with open(os.path.join(src, "arrow.c"), "w", encoding="utf-8") as f:
+        f.write('log_info("arrow \u2192 here");\n'
+                'log_info("plain %d", 3);\n')
+    return convert(src, os.path.join(tmpdirname, "dest"), tmpdirname, "Q")
+
+
 class TestReplacer(unittest.TestCase):
 
     @classmethod
@@ -187,3 +204,188 @@ class TestReplacer(unittest.TestCase):
         replacer = Replacer()
         new = replacer.replace("")
         self.assertEqual("", new)
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_preload(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        shorts = [
+            "R11", "R17" + TOKEN + "10" + TOKEN + "20",
+            "R8" + TOKEN + "0xc0400000",
+            "R9" + TOKEN + "40379999" + TOKEN + "9999999a",
+            "R1007" + TOKEN + "10", "R17" + TOKEN + "%d" + TOKEN + "20",
+            "R17" + TOKEN + "10", "Rx", ""]
+        shorts.extend(f"R{i}" + TOKEN + "3f800000" + TOKEN + "40379999"
+                      for i in range(1, 60))
+        with Replacer() as replacer:
+            expected = [replacer.replace(short) for short in shorts]
+        with Replacer(preload=True) as replacer:
+            self.assertEqual(
+                expected, [replacer.replace(short) for short in shorts])
+        self.assertEqual(
+            "[INFO] (weird,file.c: 36): this is ok", expected[0])
+
+    def test_preload_unreadable(self) -> None:
+        unittest_setup()
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            UtilsDataView._register_log_database(
+                "Q", _convert_unreadable(tmpdirname))
+            for preload in (True, False):
+                with Replacer(preload=preload) as replacer:
+                    self.assertEqual("Q1", replacer.replace("Q1"))
+                    self.assertEqual(
+                        "[INFO] (arrow.c: 2): plain 5",
+                        replacer.replace("Q2" + TOKEN + "5"))
+
+    def test_replace_lines_unreadable(self) -> None:
+        unittest_setup()
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            UtilsDataView._register_log_database(
+                "Q", _convert_unreadable(tmpdirname))
+            lines = ["Q2" + TOKEN + "5\n", "Q1\n", "Q2" + TOKEN + "6\n"]
+            for preload in (True, False):
+                with Replacer(preload=preload) as replacer:
+                    # The bad message shares a chunk with good ones
+                    self.assertEqual(
+                        ["[INFO] (arrow.c: 2): plain 5\n", "Q1\n",
+                         "[INFO] (arrow.c: 2): plain 6\n"],
+                        list(replacer.replace_lines(lines, chunk_size=3)))
+
+    def test_plan_fast_path(self) -> None:
+        plan = DecodePlan(20, "a.c", "7", "%d of %s is %f then %x")
+        parts = ["R1", "3", "ten", "3f800000", "ff"]
+        with mock.patch.object(
+                DecodePlan, "_replace_in_order",
+                side_effect=AssertionError("slow path used")):
+            self.assertEqual("3 of ten is 1.0 then ff", plan.replace(parts))
+        # An argument holding a specifier still goes the slow way
+        self.assertEqual(
+            "%d of ten is 1.0 then ff",
+            plan.replace(["R1", "%d", "ten", "3f800000", "ff"]))
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_replace_lines(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        shorts = ["R11", "R17" + TOKEN + "10" + TOKEN + "20", "hello",
+                  "R1007" + TOKEN + "10", "", "R8" + TOKEN + "0xc0400000"]
+        with Replacer() as replacer:
+            expected = [replacer.replace(short) + "\n" for short in shorts]
+            lines = [short + "\n" for short in shorts]
+            self.assertEqual(
+                expected, list(replacer.replace_lines(lines, chunk_size=4)))
+            self.assertEqual(
+                ["[INFO] (weird,file.c: 36): this is ok\r\n", "R99999\r"],
+                list(replacer.replace_lines(iter(["R11\r\n", "R99999\r"]))))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            src = os.path.join(tmpdirname, "iobuf.txt")
+            dest = os.path.join(tmpdirname, "decoded.txt")
+            with open(src, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            with Replacer(preload=True) as replacer:
+                replacer.replace_file(src, dest)
+            with open(dest, encoding="utf-8") as f:
+                self.assertEqual(expected, f.readlines())
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_memo(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        shorts = ["R11", "R17" + TOKEN + "10" + TOKEN + "20", "hello",
+                  "R99999", "Q5", "R8" + TOKEN + "0xc0400000"]
+        lines = [short + "\n" for short in shorts * 5]
+        with Replacer(memo_size=0) as replacer:
+            expected = list(replacer.replace_lines(lines, chunk_size=4))
+            self.assertEqual(0, replacer.memo_statistics["hits"])
+        with Replacer(memo_size=3) as replacer:
+            self.assertEqual(
+                expected, list(replacer.replace_lines(lines, chunk_size=4)))
+            self.assertEqual(3, replacer.memo_statistics["size"])
+        with Replacer() as replacer:
+            self.assertEqual(
+                expected, list(replacer.replace_lines(lines, chunk_size=4)))
+            # Each known or unknown message is only looked up once
+            self.assertEqual(
+                {"hits": 20, "misses": 5, "size": 5},
+                replacer.memo_statistics)
+            for short in shorts:
+                replacer.replace(short)
+            self.assertEqual(25, replacer.memo_statistics["hits"])
+            replacer.clear_memo()
+            self.assertEqual(
+                {"hits": 0, "misses": 0, "size": 0},
+                replacer.memo_statistics)
+            self.assertEqual(expected[0], replacer.replace(shorts[0]) + "\n")
+        with Replacer() as replacer:
+            # A line at a time counts the same as in batches
+            for line in lines:
+                replacer.replace(line.rstrip("\n"))
+            self.assertEqual(
+                {"hits": 20, "misses": 5, "size": 5},
+                replacer.memo_statistics)
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_memo_threads(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        shorts = [f"R{log_id}" for log_id in range(1, 30)]
+        with Replacer(memo_size=5) as replacer:
+            expected = [replacer.replace(short) for short in shorts]
+            replacer.clear_memo()
+
+            def replace_all(_: int) -> List[str]:
+                return [replacer.replace(short) for short in shorts * 20]
+
+            with ThreadPoolExecutor(8) as pool:
+                for result in pool.map(replace_all, range(8)):
+                    self.assertEqual(expected * 20, result)
+            statistics = replacer.memo_statistics
+            self.assertEqual(
+                8 * 20 * len(shorts),
+                statistics["hits"] + statistics["misses"])
+            self.assertEqual(5, statistics["size"])
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_replace_iobufs(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        iobufs = [
+            [f"R{(core + line) % 20 + 1}" + TOKEN + "10" + TOKEN + "20"
+             for line in range(50)] + ["not short"]
+            for core in range(10)]
+        with Replacer() as replacer:
+            expected = replacer.replace_iobufs(iobufs)
+            self.assertEqual(expected, replacer.replace_iobufs(iobufs, 3))
+        self.assertEqual(
+            [replacer.replace(line) for line in iobufs[4]], expected[4])
+
+    @pytest.mark.xdist_group(name="mock_src")
+    def test_replace_binary(self) -> None:
+        unittest_setup()
+        UtilsDataView._register_log_database("R", logs_database)
+        messages: List[Tuple[str, Union[bytes, memoryview]]] = [
+            ("R17", struct.pack("<II", 10, 20)),
+            ("R8", memoryview(struct.pack("<I", 0xc0400000))),
+            ("R9", struct.pack("<II", 0x40379999, 0x9999999a)),
+            ("R99999", struct.pack("<I", 255)),
+            ("R17", struct.pack("<I", 10)),
+            ("R11", b""),
+            ("R17", b"\x01\x02")]
+        expected = [
+            "[INFO] (weird,file.c: 56): \t back off = 10, time between"
+            " spikes 20",
+            "[INFO] (weird,file.c: 30): test -three -3.0",
+            "[INFO] (weird,file.c: 32): test double 23.6",
+            "R99999" + TOKEN + "ff",
+            "R17" + TOKEN + "a",
+            "[INFO] (weird,file.c: 36): this is ok",
+            "R17" + TOKEN + "0102"]
+        with Replacer() as replacer:
+            self.assertEqual(expected, replacer.replace_binary(messages))
+        with Replacer(preload=True) as replacer:
+            self.assertEqual(expected, replacer.replace_binary(messages))
+            big = [(short, struct.pack(">II", 10, 20)) for short in
+                   ["R17", "R17"]]
+            self.assertEqual(
+                [expected[0], expected[0]],
+                replacer.replace_binary(big, byteorder="big"))
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import redirect_stdout
+from io import StringIO
+import os
+import shutil
+import tempfile
+import unittest
+
+from spinn_utilities.make_tools.log_lookup import LogLookup
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
+from spinn_utilities.make_tools.watch import SourceWatcher
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestWatch(unittest.TestCase):
+
+    def test_poll(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            dest = os.path.join(tmp, "dest")
+            shutil.copytree(os.path.join(PATH, "mock_src"), src)
+            weird = os.path.join(src, "weird,file.c")
+            with SourceWatcher(src, dest, tmp, "V") as watcher:
+                first = watcher.poll()
+                self.assertIn(weird, first)
+                self.assertTrue(os.path.exists(
+                    os.path.join(dest, "weird,file.c")))
+                self.assertEqual([], watcher.poll())
+
+                # Touched but the same content
+                os.utime(weird)
+                self.assertEqual([], watcher.poll())
+
+                with open(weird, "a") as f:
+                    f.write('log_info("watched");\n')
+                self.assertEqual([weird], watcher.poll())
+                with open(os.path.join(dest, "weird,file.c")) as f:
+                    self.assertIn("watched", f.read())
+                lookup = LogLookup.open_if_current(watcher.database_file)
+                assert lookup is not None
+                with lookup:
+                    self.assertIn("watched", [
+                        info[4] for info in lookup.get_all_log_info()])
+
+                # A new file in a new directory
+                os.mkdir(os.path.join(src, "new"))
+                new_file = os.path.join(src, "new", "new.c")
+                with open(new_file, "w") as f:
+                    f.write('log_info("new");\n')
+                self.assertEqual([new_file], watcher.poll())
+
+                # Bad code is reported and not tried again until changed
+                with open(new_file, "w") as f:
+                    f.write('log_info("new";\n')
+                output = StringIO()
+                with redirect_stdout(output):
+                    self.assertEqual([], watcher.poll())
+                self.assertIn("new.c", output.getvalue())
+                self.assertEqual([], watcher.poll())
+                with open(new_file, "w") as f:
+                    f.write('log_info("fixed");\n')
+                self.assertEqual([new_file], watcher.poll())
+
+            with LogSqlLiteDatabase(watcher.database_file) as sql:
+                sql.check_original("fixed")
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "No symbolic links")
+    def test_link_cycle(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            src = os.path.join(tmp, "src")
+            os.mkdir(src)
+            c_file = os.path.join(src, "a.c")
+            with open(c_file, "w") as f:
+                f.write('log_info("looped");\n')
+            try:
+                os.symlink(src, os.path.join(src, "loop"))
+            except OSError:
+                self.skipTest("Can not make symbolic links")
+            output = StringIO()
+            with SourceWatcher(src, os.path.join(tmp, "dest"), tmp,
+                               "L") as watcher, redirect_stdout(output):
+                # The link is not followed, as in convert
+                self.assertEqual([c_file], watcher.poll())
+                self.assertEqual([], watcher.poll())
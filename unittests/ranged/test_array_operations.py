@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import (
+    DualArrayList, DualList, MultipleValuesException, RangedList,
+    SingleList)
+
+
+def test_add_array() -> None:
+    rl: RangedList = RangedList(6, 1.0)
+    rl[3:6] = 2.0
+    factors = numpy.array([1, 1, 2, 2, 2, 3])
+    result = rl + factors
+    assert isinstance(result, DualArrayList)
+    assert list(result) == [2, 2, 3, 4, 4, 5]
+    assert list(result.iter_ranges()) == [
+        (0, 2, 2), (2, 3, 3), (3, 5, 4), (5, 6, 5)]
+    assert result[4] == 4
+    assert result.get_single_value_by_slice(3, 5) == 4
+    with pytest.raises(MultipleValuesException):
+        result.get_single_value_by_slice(2, 5)
+    assert result.get_single_value_by_ids([0, 1]) == 2
+    assert result.get_default() is None
+    # Changes to the list are reflected
+    rl[0] = 5.0
+    assert result[0] == 6
+
+
+def test_operators() -> None:
+    rl: RangedList = RangedList(4, 6)
+    array = numpy.array([1, 2, 3, 4])
+    assert list(rl - array) == [5, 4, 3, 2]
+    assert list(rl * array) == [6, 12, 18, 24]
+    assert list(rl / array) == [6, 3, 2, 1.5]
+    assert list(rl // array) == [6, 3, 2, 1]
+    with pytest.raises(ZeroDivisionError):
+        _ = rl / numpy.array([1, 0, 1, 1])
+    with pytest.raises(ValueError):
+        _ = rl + numpy.array([1, 2])
+
+
+def test_broadcast() -> None:
+    rl: RangedList = RangedList(4, 2)
+    assert list(rl * numpy.array(3)) == [6, 6, 6, 6]
+    assert list(rl * numpy.array([3])) == [6, 6, 6, 6]
+    assert list((rl * numpy.array(3)).iter_ranges()) == [(0, 4, 6)]
+
+
+def test_non_ranged() -> None:
+    rl: RangedList = RangedList(4, [1, 2, 3, 4])
+    assert not rl.range_based()
+    result = rl * numpy.array([4, 3, 2, 1])
+    assert list(result) == [4, 6, 6, 4]
+    assert list(result.iter_ranges_by_slice(1, 4)) == [(1, 3, 6), (3, 4, 4)]
+
+
+def test_ufuncs() -> None:
+    rl: RangedList = RangedList(3, 0.0)
+    result = numpy.exp(rl)
+    assert isinstance(result, SingleList)
+    assert list(result) == [1.0, 1.0, 1.0]
+    result = numpy.array([1, 2, 3]) - rl
+    assert isinstance(result, DualArrayList)
+    assert list(result) == [1, 2, 3]
+    rl[1] = 5.0
+    assert list(result) == [1, -3, 3]
+    result = numpy.subtract(10, rl)  # type: ignore[call-overload]
+    assert list(result) == [10, 5, 10]
+    other: RangedList = RangedList(3, 1.0)
+    result = numpy.add(rl, other)  # type: ignore[call-overload]
+    assert isinstance(result, DualList)
+    assert list(result) == [1, 6, 1]
@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from typing import List, Tuple
+from spinn_utilities.ranged import RangeDictionary, RangedList
+
+
+def test_no_changes() -> None:
+    rl: RangedList = RangedList(10, "a")
+    token = rl.change_token()
+    assert rl.changes_since(token) == []
+    # Everything changed since before creation
+    assert rl.changes_since(0) == [(0, 10)]
+
+
+def test_list_changes() -> None:
+    rl: RangedList = RangedList(10, "a")
+    token = rl.change_token()
+    rl[2] = "b"
+    rl[3] = "b"
+    rl[7:9] = "c"
+    # Setting to the same value is not a change
+    rl[5] = "a"
+    assert rl.changes_since(token) == [(2, 4), (7, 9)]
+    token2 = rl.change_token()
+    rl[0] = "d"
+    assert rl.changes_since(token2) == [(0, 1)]
+    assert rl.changes_since(token) == [(0, 1), (2, 4), (7, 9)]
+
+
+def test_non_ranged_changes() -> None:
+    rl: RangedList = RangedList(5, [1, 2, 3, 4, 5])
+    token = rl.change_token()
+    rl[1:3] = [7, 8]
+    rl[4] = 9
+    assert rl.changes_since(token) == [(1, 3), (4, 5)]
+    token = rl.change_token()
+    rl.set_value(3)
+    assert rl.changes_since(token) == [(0, 5)]
+
+
+def test_copy_into() -> None:
+    rl: RangedList = RangedList(5, 1)
+    other: RangedList = RangedList(5, 2)
+    token = rl.change_token()
+    rl.copy_into(other)
+    assert rl.changes_since(token) == [(0, 5)]
+    assert other.changes_since(token) == []
+
+
+def test_dict_changes() -> None:
+    rd = RangeDictionary(10, {"a": 1, "b": 2})
+    token = rd.change_token()
+    assert rd.changes_since(token) == []
+    rd[2:4].set_value("a", 5)
+    rd[3:6].set_value("b", 6)
+    rd[8]["a"] = 7
+    assert rd.changes_since(token, "a") == [(2, 4), (8, 9)]
+    assert rd.changes_since(token, ["b"]) == [(3, 6)]
+    assert rd.changes_since(token) == [(2, 6), (8, 9)]
+    token = rd.change_token()
+    rd["c"] = 3
+    assert rd.changes_since(token) == [(0, 10)]
+    token = rd.change_token()
+    rd["d"] = RangedList(10, 4)
+    assert rd.changes_since(token, "d") == [(0, 10)]
+
+
+def test_many_changes() -> None:
+    rl: RangedList = RangedList(100, 0)
+    rng = random.Random(7)
+    stamps = [0] * 100
+    tokens = []
+    for value in range(1, 300):
+        tokens.append(rl.change_token())
+        start = rng.randrange(100)
+        stop = min(100, start + rng.choice([1, 1, 2, 5, 20]))
+        rl[start:stop] = value
+        stamps[start:stop] = [tokens[-1]] * (stop - start)
+    for token in tokens[::10]:
+        expected: List[Tuple[int, int]] = []
+        for the_id, stamp in enumerate(stamps):
+            if stamp < token:
+                continue
+            if expected and expected[-1][1] == the_id:
+                expected[-1] = (expected[-1][0], the_id + 1)
+            else:
+                expected.append((the_id, the_id + 1))
+        assert rl.changes_since(token) == expected
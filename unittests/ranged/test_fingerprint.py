@@ -0,0 +1,109 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import numpy
+import pytest
+from spinn_utilities.ranged import RangeDictionary, RangedList
+
+
+def test_same_content() -> None:
+    rl1: RangedList = RangedList(10, 1.5)
+    rl2: RangedList = RangedList(10, 1.5)
+    assert rl1.fingerprint() == rl2.fingerprint()
+    rl1[3] = 2
+    assert rl1.fingerprint() != rl2.fingerprint()
+    rl2[3] = 2
+    assert rl1.fingerprint() == rl2.fingerprint()
+    # Ranges are the same regardless of how they are stored
+    rl3: RangedList = RangedList(10, [1.5] * 3 + [2] + [1.5] * 6)
+    assert not rl3.range_based()
+    assert rl1.fingerprint() == rl3.fingerprint()
+
+
+def test_cache_cleared_on_write() -> None:
+    rl: RangedList = RangedList(10, "a")
+    before = rl.fingerprint()
+    assert before == rl.fingerprint()
+    rl[2:5] = "b"
+    after = rl.fingerprint()
+    assert before != after
+    rl[2:5] = "a"
+    assert before == rl.fingerprint()
+
+
+def test_slices() -> None:
+    rl: RangedList = RangedList(10, 1)
+    rl[5:10] = 2
+    assert rl.fingerprint(0, 5) != rl.fingerprint(5, 10)
+    rl[0:5] = 2
+    assert rl.fingerprint(0, 5) == rl.fingerprint(5, 10)
+    assert rl.fingerprint(0, 5) != rl.fingerprint()
+
+
+def test_numpy_values() -> None:
+    rl1: RangedList = RangedList(
+        4, numpy.arange(2000), use_list_as_value=True)
+    rl2: RangedList = RangedList(
+        4, numpy.arange(2000), use_list_as_value=True)
+    assert rl1.fingerprint() == rl2.fingerprint()
+    values = numpy.arange(2000)
+    values[1000] = -1
+    rl2.set_value(values, use_list_as_value=True)
+    assert rl1.fingerprint() != rl2.fingerprint()
+    assert RangedList(3, numpy.float64(2.0)).fingerprint() == \
+        RangedList(3, 2.0).fingerprint()
+
+
+def test_dict() -> None:
+    rd1 = RangeDictionary(10, {"a": 1, "b": 2})
+    rd2 = RangeDictionary(10, {"b": 2, "a": 1})
+    assert rd1.fingerprint() == rd2.fingerprint()
+    rd1[3:5].set_value("a", 4)
+    assert rd1.fingerprint() != rd2.fingerprint()
+    assert rd1.fingerprint("b") == rd2.fingerprint("b")
+    assert rd1.fingerprint(slice_start=5) == rd2.fingerprint(slice_start=5)
+    rd2["c"] = 3
+    assert rd1.fingerprint(["a"]) != rd2.fingerprint(["a"])
+    assert rd1.fingerprint(["b"]) == rd2.fingerprint(["b"])
+
+
+def test_kept_up_to_date() -> None:
+    rl: RangedList = RangedList(50, 0)
+    non_ranged: RangedList = RangedList(50, list(range(50)))
+    rl.fingerprint()
+    non_ranged.fingerprint()
+    rng = random.Random(3)
+    for value in range(100):
+        start = rng.randrange(50)
+        stop = min(50, start + rng.choice([1, 3, 10]))
+        rl[start:stop] = value % 4
+        non_ranged[rng.randrange(50)] = value % 4
+        # A new list computes the fingerprint from scratch
+        assert rl.fingerprint() == RangedList(50, list(rl)).fingerprint()
+        assert non_ranged.fingerprint() == \
+            RangedList(50, list(non_ranged)).fingerprint()
+
+
+def test_unstable_values() -> None:
+    rl: RangedList = RangedList(4, 1)
+    rl.fingerprint()
+    rl[2] = object()
+    with pytest.raises(TypeError):
+        rl.fingerprint()
+    rl[2] = 1
+    assert rl.fingerprint() == RangedList(4, 1).fingerprint()
+    with pytest.raises(TypeError):
+        RangedList(4, test_unstable_values,
+                   use_list_as_value=True).fingerprint()
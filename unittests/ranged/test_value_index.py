@@ -0,0 +1,99 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from typing import Any, Iterable, Tuple
+import numpy
+import pytest
+from spinn_utilities.ranged import RangedList, ranged_list
+from spinn_utilities.ranged.value_index import ValueIndex
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_lookups(indexed: bool) -> None:
+    rl: RangedList = RangedList(10, "a")
+    rl.enable_value_index(indexed)
+    rl[2:4] = "b"
+    rl[7] = "b"
+    assert "b" in rl
+    assert "c" not in rl
+    assert rl.count("a") == 7
+    assert rl.count("b") == 3
+    assert rl.count("c") == 0
+    assert rl.index("b") == 2
+    with pytest.raises(ValueError):
+        rl.index("c")
+    assert list(rl.ids_by_value("b")) == [2, 3, 7]
+    assert len(rl.ids_by_value("c")) == 0
+    # Index kept up to date by writes
+    rl[2] = "c"
+    assert rl.index("c") == 2
+    assert list(rl.ids_by_value("b")) == [3, 7]
+    rl.set_value("d")
+    assert rl.count("d") == 10
+    assert "a" not in rl
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_non_ranged(indexed: bool) -> None:
+    rl: RangedList = RangedList(6, [1, 1, 2, 2, 1, 3.0])
+    rl.enable_value_index(indexed)
+    assert list(rl.ids_by_value(1)) == [0, 1, 4]
+    assert rl.count(1.0) == 3
+    assert rl.index(3) == 5
+    rl[4] = 2
+    assert list(rl.ids_by_value(2)) == [2, 3, 4]
+
+
+def test_unhashable() -> None:
+    rl: RangedList = RangedList(4, [1, 2], use_list_as_value=True)
+    rl.enable_value_index()
+    assert rl.count([1, 2]) == 4
+    assert [1, 2] in rl
+    rl.set_value_by_id(1, numpy.arange(3))
+    assert rl.index(numpy.arange(3)) == 1
+    assert list(rl.ids_by_value([1, 2])) == [0, 2, 3]
+
+
+def test_kept_up_to_date() -> None:
+    rl: RangedList = RangedList(40, 0)
+    rl.enable_value_index()
+    rng = random.Random(5)
+    for value in range(200):
+        start = rng.randrange(40)
+        stop = min(40, start + rng.choice([1, 2, 7]))
+        rl[start:stop] = value % 5
+        expected = [the_id for the_id, x in enumerate(rl) if x == value % 3]
+        assert list(rl.ids_by_value(value % 3)) == expected
+
+
+def test_failed_build_remembered(monkeypatch: pytest.MonkeyPatch) -> None:
+    builds = []
+
+    class CountingIndex(ValueIndex):
+        def __init__(self, ranges: Iterable[Tuple[int, int, Any]]) -> None:
+            builds.append(1)
+            super().__init__(ranges)
+
+    monkeypatch.setattr(ranged_list, "ValueIndex", CountingIndex)
+    rl: RangedList = RangedList(4, [1, 2], use_list_as_value=True)
+    rl.enable_value_index()
+    assert rl.count([1, 2]) == 4
+    assert rl.index([1, 2]) == 0
+    assert len(builds) == 1
+    rl.set_value(3)
+    assert rl.count(3) == 4
+    rl[1] = 4
+    assert rl.count(3) == 3
+    assert len(builds) == 2
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from configparser import NoOptionError
 from testfixtures import LogCapture
 import os
 from tempfile import TemporaryDirectory
@@ -20,7 +21,7 @@ from spinn_utilities.config_setup import unittest_setup
 from spinn_utilities.config_holder import (
     get_config_bool, get_config_bool_or_none, get_config_float,
     get_config_float_or_none, get_config_int, get_config_int_or_none,
-    get_report_path, get_timestamp_path,
+    get_config_str_list, get_report_path, get_timestamp_path,
     get_config_str, get_config_str_or_none,  set_config)
 from spinn_utilities.data import UtilsDataView
 from spinn_utilities.exceptions import ConfigException, SpiNNUtilsException
@@ -58,6 +59,46 @@ def test_configs_None() -> None:
         pass
 
 
+def test_configs_cached() -> None:
+    unittest_setup()
+    set_config("Logging", "Foo", "5")
+    assert get_config_int("Logging", "Foo") == 5
+    assert get_config_int("Logging", "Foo") == 5
+    assert get_config_float("Logging", "Foo") == 5.0
+    assert get_config_str("Logging", "Foo") == "5"
+    set_config("Logging", "Foo", "6")
+    assert get_config_int("Logging", "Foo") == 6
+
+    set_config("Logging", "Bar", "a, b")
+    bar = get_config_str_list("Logging", "Bar")
+    bar.append("c")
+    assert get_config_str_list("Logging", "Bar") == ["a", "b"]
+    assert get_config_str_list("Logging", "Bar", ";") == ["a, b"]
+
+    set_config("Logging", "Baz", "auto")
+    assert get_config_bool_or_none("Logging", "Baz", ["auto"]) is None
+    set_config("Logging", "Baz", "auto,x")
+    assert get_config_bool_or_none("Logging", "Baz", ["auto,x"]) is None
+    try:
+        get_config_bool_or_none("Logging", "Baz", ["auto", "x"])
+        raise SpiNNUtilsException("Expected ValueError")
+    except ValueError:
+        pass
+    try:
+        get_config_bool_or_none("Logging", "Baz")
+        raise SpiNNUtilsException("Expected ValueError")
+    except ValueError:
+        pass
+
+    # A new setup clears the values read
+    unittest_setup()
+    try:
+        get_config_int("Logging", "Foo")
+        raise SpiNNUtilsException("Expected NoOptionError")
+    except NoOptionError:
+        pass
+
+
 def test_get_report_path() -> None:
     unittest_setup()
     # HACK to directly write the underlying models